@@ -1,6 +1,9 @@
 import React, { useState } from "react";
+import { electronService } from "../services/electron";
+import { useConfig } from "../hooks/useConfig";
 
 export function LearningSettings() {
+  const { config } = useConfig();
   const [context, setContext] = useState("");
   const [translation, setTranslation] = useState("");
   const [lastPreferred, setLastPreferred] = useState<string | null>(null);
@@ -9,11 +12,15 @@ export function LearningSettings() {
 
   const handleSave = async () => {
     if (!context || !translation) return;
+    // Scope the preference to the pair it was written for: a preferred
+    // translation is in one language and must not replace other targets.
+    const sourceLanguage = config?.whisper?.language ?? null;
+    const targetLanguage = config?.translation?.target_language || "en";
     setLoading(true);
     setError(null);
     try {
-      await learnPreference({ context, translation });
-      const pref = await getPreference(context);
+      await electronService.learnPreference({ context, translation, sourceLanguage, targetLanguage });
+      const pref = await electronService.getPreference(context, sourceLanguage, targetLanguage);
       setLastPreferred(pref);
     } catch (err: any) {
       setError(err?.toString?.() || "Failed to save preference");
@@ -26,7 +26,7 @@ import { SUPPORTED_UI_LANGUAGES } from "../i18n/languages";
 
 export function MainWindow() {
   const { mlReady, startupState } = useMLModelLoading();
-  const { translate, targetLanguage, setTargetLanguage } = useTranslation();
+  const { translate, addTranslation, targetLanguage, setTargetLanguage } = useTranslation();
   const { config, updateConfig, loading: configLoading } = useConfig();
   const { t, language, setLanguage } = useI18n();
   const [status, setStatus] = useState<string>(t(I18N_KEYS.STATUS_INITIALIZING));
@@ -110,6 +110,7 @@ export function MainWindow() {
   const teammatesRef = useRef(teammates);
   const targetLanguageRef = useRef(targetLanguage);
   const translateRef = useRef(translate);
+  const addTranslationRef = useRef(addTranslation);
   const recordTranslationRef = useRef(recordTranslation);
   const addLogRef = useRef<(message: string) => void>(() => {});
   const stopCaptureRef = useRef(stopCapture);
@@ -130,6 +131,7 @@ export function MainWindow() {
   teammatesRef.current = teammates;
   targetLanguageRef.current = targetLanguage;
   translateRef.current = translate;
+  addTranslationRef.current = addTranslation;
   recordTranslationRef.current = recordTranslation;
   addLogRef.current = addLog;
   stopCaptureRef.current = stopCapture;
@@ -653,6 +655,7 @@ export function MainWindow() {
           addLog(transcribeLog);
 
           let transcription;
+          let directSpeech = false;
           const transcriptionStartTime = Date.now(); // Declare outside try block for error handling
           try {
             console.log("[DEBUG] Calling transcribeAudio with:", {
@@ -680,15 +683,29 @@ export function MainWindow() {
                 : undefined
               : configRef.current?.whisper?.language || undefined;
 
-            const transcriptionPromise = electronService.transcribeAudio(
-              combinedAudio,
-              event.sample_rate,
-              {
-                channels: 1,
-                language: whisperLanguage || undefined,
-                modelName: configRef.current?.whisper?.model || "base",
-              }
-            );
+            // Whisper translates straight to English in one request; the
+            // source transcript is only needed for team translation
+            directSpeech =
+              configRef.current?.translation?.speech_pipeline ===
+                "whisper_translate" && targetLanguageRef.current === "en";
+            const transcriptionPromise = directSpeech
+              ? electronService.speechTranslate(combinedAudio, event.sample_rate, {
+                  channels: 1,
+                  language: whisperLanguage || undefined,
+                  modelName: configRef.current?.whisper?.model || "base",
+                  targetLanguage: "en",
+                  includeOriginal:
+                    configRef.current?.translation?.translate_to_teammates ?? false,
+                })
+              : electronService.transcribeAudio(
+                  combinedAudio,
+                  event.sample_rate,
+                  {
+                    channels: 1,
+                    language: whisperLanguage || undefined,
+                    modelName: configRef.current?.whisper?.model || "base",
+                  }
+                );
 
             const timeoutPromise = new Promise((_, reject) => {
               setTimeout(
@@ -736,6 +753,13 @@ export function MainWindow() {
             if (!transcription) {
               throw new Error("Transcription returned null/undefined");
             }
+            if (directSpeech) {
+              // Without the source transcript, filter and log Whisper's English
+              transcription = {
+                ...transcription,
+                text: transcription.text || transcription.translated_text || "",
+              };
+            }
           } catch (transcribeError) {
             const errorTime = Date.now();
             const processingDuration = errorTime - transcriptionStartTime;
@@ -852,10 +876,23 @@ export function MainWindow() {
                 sourceLanguage: transcription.language,
                 targetLanguage: targetLanguageRef.current,
               });
-              translation = await translateRef.current(
-                transcription.text,
-                transcription.language
-              );
+              if (directSpeech) {
+                translation = {
+                  original: transcription.text,
+                  translated: transcription.translated_text ?? "",
+                  sourceLanguage: transcription.language,
+                  targetLanguage: transcription.target_language ?? "en",
+                  timestamp: Date.now(),
+                };
+                addTranslationRef.current(translation);
+              } else {
+                translation = await translateRef.current(
+                  transcription.text,
+                  transcription.language,
+                  undefined,
+                  transcription.utterance_id
+                );
+              }
 
               console.log("=== TRANSLATION RESULT ===", translation);
               if (translation?.translated) {
@@ -1074,7 +1111,8 @@ export function MainWindow() {
                     const teamTranslation = await translateRef.current(
                       transcription.text,
                       translation.sourceLanguage,
-                      effectiveTeamLanguage
+                      effectiveTeamLanguage,
+                      transcription.utterance_id
                     );
                     if (!teamTranslation?.translated?.trim()) {
                       return;
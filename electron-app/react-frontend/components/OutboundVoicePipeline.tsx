@@ -243,7 +243,8 @@ export function OutboundVoicePipeline({
         const translation = await translateRef.current(
           text,
           sourceLanguage,
-          teamLanguage
+          teamLanguage,
+          transcription.utterance_id
         );
         if (!translation?.translated?.trim()) {
           return;
@@ -271,15 +272,34 @@ export function OutboundVoicePipeline({
           `[Voice Out] TTS: "${text}" -> "${spoken}" (${teamLanguage})`
         );
 
-        await electronService.speakText(spoken, {
+        const queued = await electronService.speakText(spoken, {
           language: teamLanguage,
           outputDeviceIndex,
           outputMode,
           volume: cfg?.tts?.volume ?? 1.0,
           rate: cfg?.tts?.rate ?? 1.0,
+          utteranceId: transcription.utterance_id,
         });
 
-        onLogRef.current(`[Voice Out] Spoke translation via ${outputMode}`);
+        // The backend only queued the job; report what actually happened to
+        // it without holding up capture of the next utterance.
+        void electronService
+          .waitForTtsJob(queued.job_id)
+          .then((job) => {
+            if (job.status === "done") {
+              onLogRef.current(`[Voice Out] Spoke translation via ${outputMode}`);
+            } else if (job.status === "failed") {
+              onLogRef.current(
+                `[Voice Out] TTS failed: ${job.error || "unknown error"}`
+              );
+            } else {
+              onLogRef.current(`[Voice Out] Translation not spoken (${job.status})`);
+            }
+          })
+          .catch((err) => {
+            const msg = err instanceof Error ? err.message : String(err);
+            onLogRef.current(`[Voice Out] Lost track of TTS job: ${msg}`);
+          });
       } catch (err) {
         const msg = err instanceof Error ? err.message : String(err);
         onLogRef.current(`[Voice Out] Error: ${msg}`);
@@ -25,8 +25,11 @@ type TranslationContextValue = {
   translate: (
     text: string,
     sourceLanguage?: string,
-    overrideTargetLanguage?: string
+    overrideTargetLanguage?: string,
+    utteranceId?: string
   ) => Promise<Translation | undefined>;
+  // Log a translation produced elsewhere (e.g. /speech_translate_bytes)
+  addTranslation: (translation: Translation) => void;
   clearTranslations: () => void;
 };
 
@@ -42,7 +45,8 @@ function useTranslationState(): TranslationContextValue {
     async (
       text: string,
       sourceLanguage?: string,
-      overrideTargetLanguage?: string
+      overrideTargetLanguage?: string,
+      utteranceId?: string
     ) => {
       if (!text.trim()) return;
 
@@ -55,7 +59,8 @@ function useTranslationState(): TranslationContextValue {
         const result = await electronService.translateText(
           text,
           targetLang,
-          sourceLanguage || undefined
+          sourceLanguage || undefined,
+          utteranceId
         );
 
         const translation: Translation = {
@@ -85,6 +90,12 @@ function useTranslationState(): TranslationContextValue {
     [targetLanguage]
   );
 
+  const addTranslation = useCallback((translation: Translation) => {
+    if (!isSameLanguagePassthroughTranslation(translation)) {
+      setTranslations((prev) => [translation, ...prev].slice(0, 50));
+    }
+  }, []);
+
   const clearTranslations = useCallback(() => {
     setTranslations([]);
   }, []);
@@ -96,6 +107,7 @@ function useTranslationState(): TranslationContextValue {
     isTranslating,
     error,
     translate,
+    addTranslation,
     clearTranslations,
   };
 }
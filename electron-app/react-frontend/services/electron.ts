@@ -66,6 +66,29 @@ export interface Config {
     provider: string;
     model_type: string;
     model_name: string;
+    backend?: "transformers" | "ctranslate2";
+    cpu_threads?: number;
+    generation_deadline_ms?: number;
+    api_timeout_ms?: number;
+    segment_max_chars?: number;
+    fuzzy_memory?: {
+      enabled: boolean;
+      threshold: number;
+      language_thresholds: Record<string, number>;
+      max_entries: number;
+    };
+    language_id?: {
+      enabled: boolean;
+      min_confidence: number;
+    };
+    warmup?: {
+      enabled: boolean;
+      history_phrases: number;
+      max_phrases: number;
+      min_interval_ms: number;
+      idle_ms: number;
+    };
+    speech_pipeline?: "two_model" | "whisper_translate";
     use_fallback: boolean;
     translate_to_teammates?: boolean;
     team_target_language?: string;
@@ -82,6 +105,11 @@ export interface Config {
     engine: string;
     rate: number;
     volume: number;
+    streaming?: boolean;
+    max_queue_age_ms?: number;
+    merge_window_ms?: number;
+    merge_max_chars?: number;
+    voice_pack?: boolean;
   };
   voice_output?: {
     mode?: VoiceOutputMode;
@@ -100,6 +128,7 @@ export interface Config {
     show_same_language?: boolean;
     style_preset?: string;
     position_preset?: string;
+    refresh_ms?: number;
   };
   ui: {
     theme: string;
@@ -119,6 +148,82 @@ export interface MLServiceHealth {
   ready?: boolean;
   whisper_loaded?: boolean;
   translation_loaded?: boolean;
+  translation_status?: {
+    stage: string;
+    progress: number;
+    loading: boolean;
+    loaded: boolean;
+    ready: boolean;
+    elapsed_s: number;
+    error?: string | null;
+  } | null;
+  translation_api?: {
+    enabled: boolean;
+    calls?: number;
+    failures?: number;
+    connections_created?: number;
+    connections_reused?: number;
+    cached_pairs?: number;
+    breaker?: {
+      state: "closed" | "open" | "half_open";
+      consecutive_failures: number;
+      trips: number;
+      rejected: number;
+    };
+  } | null;
+  dedup?: {
+    translation: { executed: number; duplicates_avoided: number; in_flight: number } | null;
+    transcription: { executed: number; duplicates_avoided: number; in_flight: number } | null;
+  };
+}
+
+export type PipelineEventType =
+  | "utterance_start"
+  | "partial"
+  | "final"
+  | "translated"
+  | "tts_started"
+  | "tts_finished";
+
+/** One event from the backend event bus (/events WebSocket, /events/stream SSE). */
+export interface PipelineEvent {
+  seq: number;
+  type: PipelineEventType;
+  mono_ms: number;
+  wall_ms: number;
+  utterance_id: string | null;
+  job_id: string | null;
+  [field: string]: unknown;
+}
+
+export type TtsJobStatus =
+  | "queued"
+  | "speaking"
+  | "done"
+  | "dropped"
+  | "merged"
+  | "cancelled"
+  | "interrupted"
+  | "failed";
+
+/** A /tts/speak job as reported by /tts/jobs/{job_id}. */
+export interface TtsJob {
+  job_id: string;
+  utterance_id: string | null;
+  status: TtsJobStatus;
+  priority: number;
+  text: string;
+  age_ms: number;
+  merged_into: string | null;
+  error: string | null;
+  result: Record<string, unknown> | null;
+}
+
+export interface TtsSpeakResponse {
+  status: "queued";
+  job_id: string;
+  utterance_id: string | null;
+  played_to: string[];
 }
 
 export type MLServiceStartupPhase =
@@ -629,8 +734,10 @@ class ElectronService {
       outputMode?: VoiceOutputMode;
       volume?: number;
       rate?: number;
+      priority?: number;
+      utteranceId?: string | null;
     }
-  ): Promise<void> {
+  ): Promise<TtsSpeakResponse> {
     const payload = {
       text,
       language: options?.language ?? 'en',
@@ -639,8 +746,32 @@ class ElectronService {
       output_mode: options?.outputMode ?? 'virtual_mic',
       volume: options?.volume ?? 1.0,
       rate: options?.rate ?? 1.0,
+      priority: options?.priority ?? 0,
+      utterance_id: options?.utteranceId ?? null,
     };
-    await this.callMLService('/tts/speak', payload);
+    return await this.callMLService('/tts/speak', payload);
+  }
+
+  // /tts/speak only queues the utterance; poll its job until it reaches a
+  // terminal status. A job merged into another resolves with the job that
+  // actually spoke its text.
+  async waitForTtsJob(jobId: string, timeoutMs: number = 60000): Promise<TtsJob> {
+    const deadline = Date.now() + timeoutMs;
+    let currentId = jobId;
+    for (;;) {
+      const job: TtsJob = await this.callMLService(`/tts/jobs/${encodeURIComponent(currentId)}`);
+      if (job.status === 'merged' && job.merged_into) {
+        currentId = job.merged_into;
+        continue;
+      }
+      if (job.status !== 'queued' && job.status !== 'speaking') {
+        return job;
+      }
+      if (Date.now() >= deadline) {
+        throw new Error(`TTS job ${jobId} still ${job.status} after ${timeoutMs} ms`);
+      }
+      await this.delay(250);
+    }
   }
 
   // Transcribe audio via ML service (float32 PCM)
@@ -651,6 +782,7 @@ class ElectronService {
       language?: string | null;
       channels?: number;
       modelName?: string;
+      utteranceId?: string;
     }
   ): Promise<{
     text: string;
@@ -658,6 +790,7 @@ class ElectronService {
     confidence?: number;
     rms_level?: number;
     segments?: unknown[];
+    utterance_id?: string;
   }> {
     if (!audioData?.length) {
       throw new Error('transcribeAudio: empty audio buffer');
@@ -682,6 +815,9 @@ class ElectronService {
     if (options?.language) {
       formData.append('language', options.language);
     }
+    if (options?.utteranceId) {
+      formData.append('utterance_id', options.utteranceId);
+    }
 
     const controller = new AbortController();
     const timeoutId = setTimeout(() => controller.abort(), 90000);
@@ -718,6 +854,7 @@ class ElectronService {
         confidence: result.confidence,
         rms_level: result.rms_level,
         segments: result.segments,
+        utterance_id: result.utterance_id,
       };
     } catch (error) {
       if (error instanceof Error && error.name === 'AbortError') {
@@ -729,6 +866,87 @@ class ElectronService {
     }
   }
 
+  // Audio -> translated text in one request (/speech_translate_bytes). Under
+  // translation.speech_pipeline = "whisper_translate" English targets come
+  // from Whisper's translate task; `text` is the source transcript only when
+  // includeOriginal is set (one extra Whisper pass).
+  async speechTranslate(
+    audioData: ArrayLike<number>,
+    sampleRate: number = 48000,
+    options?: {
+      targetLanguage?: string;
+      language?: string | null;
+      channels?: number;
+      modelName?: string;
+      includeOriginal?: boolean;
+      utteranceId?: string;
+    }
+  ): Promise<{
+    text: string;
+    translated_text: string;
+    language: string;
+    target_language: string;
+    confidence?: number;
+    rms_level?: number;
+    segments?: unknown[];
+    pipeline: string;
+    status: string;
+    utterance_id?: string;
+  }> {
+    if (!audioData?.length) {
+      throw new Error('speechTranslate: empty audio buffer');
+    }
+
+    await this.waitForMLService(30000);
+    const baseUrl = await this.getMLServiceURL();
+    const float32 =
+      audioData instanceof Float32Array
+        ? audioData
+        : Float32Array.from(audioData);
+
+    const formData = new FormData();
+    formData.append(
+      'audio_data',
+      new Blob([float32.buffer], { type: 'application/octet-stream' }),
+      'audio.pcm'
+    );
+    formData.append('sample_rate', String(sampleRate));
+    formData.append('model_name', options?.modelName || 'base');
+    formData.append('channels', String(options?.channels ?? 1));
+    formData.append('target_language', options?.targetLanguage || 'en');
+    formData.append('include_original', String(options?.includeOriginal ?? false));
+    if (options?.language) {
+      formData.append('language', options.language);
+    }
+    if (options?.utteranceId) {
+      formData.append('utterance_id', options.utteranceId);
+    }
+
+    const controller = new AbortController();
+    const timeoutId = setTimeout(() => controller.abort(), 90000);
+
+    try {
+      const response = await fetch(`${baseUrl}/speech_translate_bytes`, {
+        method: 'POST',
+        body: formData,
+        signal: controller.signal,
+      });
+
+      if (!response.ok) {
+        const detail = await this.parseMLServiceErrorResponse(response);
+        throw new Error(`Speech translation failed (${response.status}): ${detail}`);
+      }
+      return await response.json();
+    } catch (error) {
+      if (error instanceof Error && error.name === 'AbortError') {
+        throw new Error('Speech translation timeout after 90 seconds');
+      }
+      throw error;
+    } finally {
+      clearTimeout(timeoutId);
+    }
+  }
+
   // Auto-detect teammate language
   async autoDetectTeammateLanguage(language: string, name?: string): Promise<string> {
     const teammateName = name || `Teammate (${language})`;
@@ -772,12 +990,16 @@ class ElectronService {
   }
 
   // Show Python overlay by reusing the translation pipeline.
-  // This calls a dedicated backend endpoint that spawns `overlay_test.py`.
-  async showPythonOverlay(text: string): Promise<any> {
+  // The backend feeds one long-lived overlay process; mode 'update' with the
+  // returned line_id edits that line in place instead of adding a new one.
+  async showPythonOverlay(
+    text: string,
+    options?: { mode?: 'queue' | 'replace' | 'update'; line_id?: string }
+  ): Promise<any> {
     console.log('showPythonOverlay called with text:', text);
     
     try {
-      const result = await this.callMLService('/overlay/show', { text });
+      const result = await this.callMLService('/overlay/show', { text, ...options });
       console.log('showPythonOverlay result:', result);
       return result;
     } catch (error) {
@@ -787,7 +1009,7 @@ class ElectronService {
   }
   
   // Show overlay text: prefer Electron transparent overlay window (works without
-  // `overlay_test.py`). Fall back to Python subprocess if Electron API is unavailable.
+  // the Python backend). Fall back to the Python overlay process if Electron API is unavailable.
   async showOverlayText(text: string, overlayConfig?: Record<string, unknown>): Promise<any> {
     console.log('showOverlayText called with text:', text);
     const api = typeof window !== 'undefined' ? (window as any).electronAPI : null;
@@ -832,8 +1054,14 @@ class ElectronService {
     };
   }
 
-  // Translation operations
-  async translateText(text: string, targetLanguage: string, sourceLanguage?: string): Promise<any> {
+  // Translation operations. utteranceId is the one /transcribe_bytes
+  // returned, so the translated event joins that utterance's timeline.
+  async translateText(
+    text: string,
+    targetLanguage: string,
+    sourceLanguage?: string,
+    utteranceId?: string
+  ): Promise<any> {
     const url = await this.getMLServiceURL();
     const fullUrl = `${url}/translate`;
 
@@ -849,6 +1077,7 @@ class ElectronService {
           text,
           target_language: targetLanguage,
           source_language: sourceLanguage,
+          utterance_id: utteranceId,
         }),
         signal: controller.signal,
       });
@@ -872,6 +1101,150 @@ class ElectronService {
     }
   }
 
+  // Learned preferences ("when I say X, translate it as Y"). The language
+  // pair scopes the preference; without a target it would apply to every
+  // target language, so callers pass the active one.
+  async learnPreference(preference: {
+    context: string;
+    translation: string;
+    sourceLanguage?: string | null;
+    targetLanguage: string;
+  }): Promise<void> {
+    await this.postMLServiceForm('/learn_preference', {
+      context: preference.context,
+      translation: preference.translation,
+      source_language: preference.sourceLanguage,
+      target_language: preference.targetLanguage,
+    });
+  }
+
+  async getPreference(
+    context: string,
+    sourceLanguage: string | null | undefined,
+    targetLanguage: string
+  ): Promise<string | null> {
+    const result = await this.postMLServiceForm('/get_personalized_translation', {
+      context,
+      source_language: sourceLanguage,
+      target_language: targetLanguage,
+    });
+    return result?.preferred_translation ?? null;
+  }
+
+  private async postMLServiceForm(
+    endpoint: string,
+    fields: Record<string, string | null | undefined>
+  ): Promise<any> {
+    await this.waitForMLService(30000);
+    const baseUrl = await this.getMLServiceURL();
+    const formData = new FormData();
+    for (const [key, value] of Object.entries(fields)) {
+      if (value) {
+        formData.append(key, value);
+      }
+    }
+    const response = await fetch(`${baseUrl}${endpoint}`, {
+      method: 'POST',
+      body: formData,
+    });
+    if (!response.ok) {
+      const detail = await this.parseMLServiceErrorResponse(response);
+      throw new Error(detail || `HTTP ${response.status}: ${response.statusText}`);
+    }
+    return await response.json();
+  }
+
+  // Speculative translation: send every partial transcript of one utterance
+  // (same sessionId) with final=false, then the final transcript with final=true.
+  async translateSpeculative(
+    sessionId: string,
+    text: string,
+    targetLanguage: string,
+    sourceLanguage: string | undefined,
+    final: boolean,
+  ): Promise<any> {
+    return await this.callMLService('/translate/speculative', {
+      session_id: sessionId,
+      text,
+      target_language: targetLanguage,
+      source_language: sourceLanguage,
+      final,
+    });
+  }
+
+  // Streaming translation (SSE): onPartial receives the full text decoded so
+  // far; resolves with the final /translate-shaped result.
+  async translateTextStream(
+    text: string,
+    targetLanguage: string,
+    sourceLanguage: string | undefined,
+    onPartial: (partial: { text: string; append: boolean }) => void,
+  ): Promise<any> {
+    const url = await this.getMLServiceURL();
+
+    await this.waitForMLService(30000);
+    const controller = new AbortController();
+    const timeoutId = setTimeout(() => controller.abort(), 120000);
+
+    try {
+      const response = await fetch(`${url}/translate/stream`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+          text,
+          target_language: targetLanguage,
+          source_language: sourceLanguage,
+        }),
+        signal: controller.signal,
+      });
+
+      if (!response.ok || !response.body) {
+        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+      }
+
+      this.mlServiceReady = true;
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffered = '';
+      let finalResult: any = null;
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffered += decoder.decode(value, { stream: true });
+        let boundary = buffered.indexOf('\n\n');
+        while (boundary !== -1) {
+          const block = buffered.slice(0, boundary);
+          buffered = buffered.slice(boundary + 2);
+          boundary = buffered.indexOf('\n\n');
+          const dataLine = block.split('\n').find((line) => line.startsWith('data: '));
+          if (!dataLine) continue;
+          const event = JSON.parse(dataLine.slice(6));
+          if (event.type === 'partial') {
+            onPartial({ text: event.text, append: event.append });
+          } else if (event.type === 'final') {
+            finalResult = event;
+          } else if (event.type === 'error') {
+            throw new Error(event.detail || 'Streaming translation failed');
+          }
+        }
+      }
+      if (!finalResult) {
+        throw new Error('Streaming translation ended without a result');
+      }
+      return finalResult;
+    } catch (error) {
+      if (error instanceof Error && error.name === 'AbortError') {
+        throw new Error('Translation timeout after 120 seconds');
+      }
+      if (this.isRetriableMLServiceError(error)) {
+        this.mlServiceReady = false;
+      }
+      throw error;
+    } finally {
+      clearTimeout(timeoutId);
+    }
+  }
+
   // Configuration operations
   async getConfig(): Promise<Config> {
     return await this.callMLService('/config/get', undefined, {
@@ -974,6 +1347,72 @@ class ElectronService {
     };
   }
 
+  // Pipeline events (transcripts, translations, TTS) pushed by the backend.
+  // Reconnects after a drop and resumes after the last seq seen, so no event
+  // is missed or repeated; `replay` delivers recent history on first connect.
+  listenToPipelineEvents(
+    callback: (event: PipelineEvent) => void,
+    options: { types?: PipelineEventType[]; replay?: number } = {}
+  ): () => void {
+    let ws: WebSocket | null = null;
+    let active = true;
+    let lastSeq: number | null = null;
+    let retryTimer: ReturnType<typeof setTimeout> | null = null;
+
+    const connect = (baseUrl: string) => {
+      if (!active) {
+        return;
+      }
+      const params = new URLSearchParams();
+      if (options.types?.length) {
+        params.set('types', options.types.join(','));
+      }
+      if (lastSeq !== null) {
+        params.set('since', String(lastSeq));
+      } else if (options.replay) {
+        params.set('replay', String(options.replay));
+      }
+      ws = new WebSocket(baseUrl.replace(/^http/, 'ws') + `/events?${params.toString()}`);
+      ws.onmessage = (ev) => {
+        try {
+          const event = JSON.parse(ev.data as string) as PipelineEvent;
+          lastSeq = event.seq;
+          callback(event);
+        } catch (e) {
+          console.warn('Pipeline event parse error:', e);
+        }
+      };
+      ws.onclose = () => {
+        ws = null;
+        if (active) {
+          retryTimer = setTimeout(() => connect(baseUrl), 1000);
+        }
+      };
+    };
+
+    this.waitForBackendReachable()
+    .then(() => this.getMLServiceURL())
+    .then(connect)
+    .catch((e) => {
+      if (active) {
+        console.warn('Pipeline events unavailable during startup:', e);
+      }
+    });
+
+    return () => {
+      active = false;
+      if (retryTimer) {
+        clearTimeout(retryTimer);
+      }
+      if (ws) {
+        ws.onmessage = null;
+        ws.onclose = null;
+        ws.close();
+        ws = null;
+      }
+    };
+  }
+
   // File operations (Electron only)
   async showOpenDialog(_options: any = {}): Promise<any> {
     if (this.isElectron) {
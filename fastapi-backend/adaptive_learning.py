@@ -1,12 +1,238 @@
-from typing import Optional
+"""
+Learned translation preferences ("when I say X, translate it as Y").
 
-# Simple in-memory preference store placeholder
-preferences = {}
+Preferences are persisted in SQLite and served from an in-memory index, so
+TranslationService can consult them before anything else on every request.
+Contexts are normalized the same way as the translation memory (case,
+punctuation, whitespace) and scoped by language pair. A preference learned
+without a source language ("*") applies to every source; one learned without
+a target language only answers lookups that give no target either, since
+the preferred text is in one language and must not replace other targets.
+``scripts/benchmark_translation.py learned`` reports lookup latency at 100k entries.
+"""
+from __future__ import annotations
 
-def learn_preference(context: str, translation: str):
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-    preferences[context] = translation
+from translation_memory import normalize_source
 
-def get_personalized_translation(context: str) -> Optional[str]:
+ANY_LANGUAGE = "*"
+DB_FILENAME = "adaptive_learning.sqlite3"
 
-    return preferences.get(context)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS preferences (
+    source_language TEXT NOT NULL,
+    target_language TEXT NOT NULL,
+    context TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    original_context TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (source_language, target_language, context)
+)
+"""
+
+
+def _scope_language(language: Optional[str]) -> str:
+    if not language or language in ("auto", "unknown"):
+        return ANY_LANGUAGE
+    return language.strip().lower()
+
+
+class AdaptiveLearningStore:
+
+    """SQLite-backed preference store with a per-scope dict index."""
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        if path is None:
+            from app_paths import get_app_data_dir
+
+            path = get_app_data_dir() / DB_FILENAME
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+        # (source, target) -> {normalized context: translation}
+        self._index: Dict[Tuple[str, str], Dict[str, str]] = {}
+        self.lookups = 0
+        self.hits = 0
+        self._load()
+
+    def _load(self) -> None:
+        rows = self._db.execute(
+            "SELECT source_language, target_language, context, translation FROM preferences"
+        )
+        for source, target, context, translation in rows:
+            self._index.setdefault((source, target), {})[context] = translation
+
+    def _scopes(self, source_language: Optional[str], target_language: Optional[str]) -> List[Tuple[str, str]]:
+        """Most specific scope first; the target is never widened to "*"."""
+        source = _scope_language(source_language)
+        target = _scope_language(target_language)
+        return list(dict.fromkeys([(source, target), (ANY_LANGUAGE, target)]))
+
+    def learn(
+        self,
+        context: str,
+        translation: str,
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None,
+    ) -> bool:
+        """Store (or replace) a preference; False when the context normalizes to nothing."""
+        return self.import_entries(
+            [{
+                "context": context,
+                "translation": translation,
+                "source_language": source_language,
+                "target_language": target_language,
+            }]
+        ) == 1
+
+    def lookup(
+        self,
+        context: str,
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None,
+    ) -> Optional[str]:
+        """Preferred translation for ``context`` in the most specific matching scope."""
+        key = normalize_source(context)
+        with self._lock:
+            self.lookups += 1
+            if not key or not self._index:
+                return None
+            for scope in self._scopes(source_language, target_language):
+                translation = self._index.get(scope, {}).get(key)
+                if translation is not None:
+                    self.hits += 1
+                    return translation
+        return None
+
+    def forget(
+        self,
+        context: str,
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None,
+    ) -> bool:
+        """Remove the preference in exactly this scope."""
+        key = normalize_source(context)
+        scope = (_scope_language(source_language), _scope_language(target_language))
+        with self._lock:
+            entries = self._index.get(scope, {})
+            removed = entries.pop(key, None) is not None
+            if not entries:
+                self._index.pop(scope, None)
+            if removed:
+                self._db.execute(
+                    "DELETE FROM preferences WHERE source_language = ? AND target_language = ? AND context = ?",
+                    (*scope, key),
+                )
+                self._db.commit()
+        return removed
+
+    def import_entries(self, entries: Iterable[Dict[str, Any]], replace: bool = False) -> int:
+        """
+        Bulk upsert preferences in one transaction.
+
+        Args:
+            entries: dicts with 'context', 'translation' and optional
+                'source_language' / 'target_language'
+            replace: drop every existing preference first
+
+        Returns:
+            Number of entries stored
+        """
+        now = time.time()
+        rows = []
+        for entry in entries:
+            context = (entry.get("context") or "").strip()
+            translation = (entry.get("translation") or "").strip()
+            key = normalize_source(context)
+            if not key or not translation:
+                continue
+            rows.append((
+                _scope_language(entry.get("source_language")),
+                _scope_language(entry.get("target_language")),
+                key,
+                translation,
+                context,
+                now,
+            ))
+        with self._lock:
+            with self._db:
+                if replace:
+                    self._db.execute("DELETE FROM preferences")
+                    self._index.clear()
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO preferences VALUES (?, ?, ?, ?, ?, ?)", rows
+                )
+            for source, target, key, translation, _context, _updated in rows:
+                self._index.setdefault((source, target), {})[key] = translation
+        return len(rows)
+
+    def export_entries(self) -> List[Dict[str, Any]]:
+        """Every preference, in the shape import_entries() accepts."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT source_language, target_language, original_context, translation, updated_at "
+                "FROM preferences ORDER BY updated_at"
+            ).fetchall()
+        return [
+            {
+                "context": context,
+                "translation": translation,
+                "source_language": None if source == ANY_LANGUAGE else source,
+                "target_language": None if target == ANY_LANGUAGE else target,
+                "updated_at": updated_at,
+            }
+            for source, target, context, translation, updated_at in rows
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": sum(len(scope) for scope in self._index.values()),
+                "scopes": len(self._index),
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "hit_rate": round(self.hits / self.lookups, 4) if self.lookups else 0.0,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+_store: Optional[AdaptiveLearningStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> AdaptiveLearningStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = AdaptiveLearningStore()
+    return _store
+
+
+def learn_preference(
+    context: str,
+    translation: str,
+    source_language: Optional[str] = None,
+    target_language: Optional[str] = None,
+):
+
+    get_store().learn(context, translation, source_language, target_language)
+
+def get_personalized_translation(
+    context: str,
+    source_language: Optional[str] = None,
+    target_language: Optional[str] = None,
+) -> Optional[str]:
+
+    return get_store().lookup(context, source_language, target_language)
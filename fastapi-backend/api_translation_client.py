@@ -0,0 +1,358 @@
+"""
+Pooled, circuit-broken client for the web translation fallback.
+
+Replaces per-request ``GoogleTranslator(...)`` construction: one
+deep_translator ``GoogleTranslator`` per language pair is built once and
+reused, every call has a hard deadline (calls run on a small worker pool and
+are abandoned when it passes), and a circuit breaker stops calling the
+endpoint after repeated failures so a dead network cannot tie up executor
+threads.
+
+Without deep_translator the client talks to the mobile web page itself over
+a keep-alive connection pool. That page is unversioned HTML, so a response
+without the result element is logged as a likely markup change and counted
+as a failure by the breaker.
+"""
+from __future__ import annotations
+
+import html
+import http.client
+import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+try:
+    from deep_translator import GoogleTranslator
+
+    _DEEP_TRANSLATOR_AVAILABLE = True
+except ImportError:
+    GoogleTranslator = None  # type: ignore
+    _DEEP_TRANSLATOR_AVAILABLE = False
+
+GOOGLE_WEB_URL = "https://translate.google.com/m"
+_ENGINE_WORKERS = 4
+
+_RESULT_PATTERN = re.compile(
+    r'<div[^>]*class="(?:result-container|t0)"[^>]*>(.*?)</div>', re.S
+)
+_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) RealTimeVoiceTranslation"
+
+
+class ApiTranslationError(RuntimeError):
+    """The fallback endpoint failed, timed out or returned no translation."""
+
+
+class CircuitOpenError(ApiTranslationError):
+    """Calls are short-circuited after repeated failures."""
+
+
+class _RetryableError(ApiTranslationError):
+    """Connection-level failure (refused, reset, stale keep-alive socket)."""
+
+
+class CircuitBreaker:
+    """closed -> open after N consecutive failures -> half_open probe after a cooldown."""
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout_s: float = 30.0) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout_s = reset_timeout_s
+        self._lock = threading.Lock()
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.rejected = 0
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == "open":
+                if time.monotonic() - self._opened_at < self.reset_timeout_s:
+                    self.rejected += 1
+                    return False
+                self._state = "half_open"
+                self._probe_in_flight = False
+            if self._state == "half_open":
+                if self._probe_in_flight:
+                    self.rejected += 1
+                    return False
+                self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = "closed"
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == "half_open" or self._failures >= self.failure_threshold:
+                if self._state != "open":
+                    self.trips += 1
+                self._state = "open"
+                self._opened_at = time.monotonic()
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "trips": self.trips,
+                "rejected": self.rejected,
+            }
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections to one host."""
+
+    def __init__(self, scheme: str, host: str, port: Optional[int], max_idle: int = 4) -> None:
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.max_idle = max_idle
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                conn = self._idle.pop()
+                self.reused += 1
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+            self.created += 1
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=timeout), False
+
+    def release(self, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        if reusable:
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append(conn)
+                    return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+def _google_translator(source: str, target: str) -> Any:
+    return GoogleTranslator(source=source, target=target)
+
+
+class PairTranslator:
+    """Cached per (source, target) translator bound to the shared client."""
+
+    def __init__(self, client: "ApiTranslationClient", source: str, target: str, engine: Any = None) -> None:
+        self.client = client
+        self.source = source
+        self.target = target
+        # deep_translator object for this pair (None with the built-in HTTP backend)
+        self.engine = engine
+
+    def translate(self, text: str) -> str:
+        return self.client.translate(text, self.source, self.target)
+
+
+class ApiTranslationClient:
+    """Web translation fallback with pooling, deadlines and a circuit breaker."""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout_s: float = 2.0,
+        max_retries: int = 1,
+        failure_threshold: int = 3,
+        reset_timeout_s: float = 30.0,
+        engine_factory: Optional[Callable[[str, str], Any]] = None,
+    ) -> None:
+        """
+        Args:
+            base_url: Mobile web page to call directly; None uses deep_translator
+                when it is installed and translate.google.com/m otherwise
+            engine_factory: Builds the per-pair translator object (anything
+                with ``translate(text)``); defaults to deep_translator's
+                GoogleTranslator
+        """
+        if engine_factory is None and base_url is None and _DEEP_TRANSLATOR_AVAILABLE:
+            engine_factory = _google_translator
+        self._engine_factory = engine_factory
+        self.backend = "deep_translator" if engine_factory is not None else "http"
+        self._executor = (
+            ThreadPoolExecutor(max_workers=_ENGINE_WORKERS, thread_name_prefix="api-translate")
+            if engine_factory is not None
+            else None
+        )
+        parts = urlsplit(base_url or GOOGLE_WEB_URL)
+        self._path = parts.path or "/"
+        self._host = parts.hostname or ""
+        self.timeout_s = timeout_s
+        self.max_retries = max(0, max_retries)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout_s)
+        self._pool = _ConnectionPool(parts.scheme or "https", self._host, parts.port)
+        self._translators: Dict[Tuple[str, str], PairTranslator] = {}
+        self._translators_lock = threading.Lock()
+        self.calls = 0
+        self.failures = 0
+
+    def translator(self, source: Optional[str], target: str) -> PairTranslator:
+        key = (source or "auto", target)
+        with self._translators_lock:
+            translator = self._translators.get(key)
+            if translator is None:
+                engine = self._engine_factory(key[0], key[1]) if self._engine_factory else None
+                translator = PairTranslator(self, key[0], key[1], engine)
+                self._translators[key] = translator
+            return translator
+
+    @staticmethod
+    def _remaining(deadline: float, stage: str) -> float:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise ApiTranslationError(f"deadline exceeded {stage}")
+        return remaining
+
+    def _request(self, query: str, deadline: float) -> str:
+        remaining = self._remaining(deadline, "before request")
+        conn, _ = self._pool.acquire(timeout=remaining)
+        reusable = False
+        try:
+            # Every socket operation gets only what is left of the deadline
+            # (acquire() set it for connect/send), so a server trickling
+            # bytes cannot stretch the call past it.
+            conn.request(
+                "GET",
+                f"{self._path}?{query}",
+                headers={"User-Agent": _USER_AGENT, "Connection": "keep-alive"},
+            )
+            conn.sock.settimeout(self._remaining(deadline, "waiting for response"))
+            response = conn.getresponse()
+            chunks: List[bytes] = []
+            while True:
+                conn.sock.settimeout(self._remaining(deadline, "while reading response"))
+                # read1: at most one recv, so the timeout above bounds it
+                chunk = response.read1(16384)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if response.length == 0:
+                    break
+            # read1 does not mark a fully read Content-Length body as done;
+            # closing the response (not the socket) frees the connection
+            response.close()
+            if response.status != 200:
+                raise ApiTranslationError(f"HTTP {response.status}")
+            reusable = not response.will_close
+            return b"".join(chunks).decode("utf-8", errors="replace")
+        except ApiTranslationError:
+            raise
+        except (socket.timeout, TimeoutError) as e:
+            raise ApiTranslationError(f"timeout: {e}") from e
+        except (OSError, http.client.HTTPException) as e:
+            raise _RetryableError(f"{type(e).__name__}: {e}") from e
+        finally:
+            self._pool.release(conn, reusable)
+
+    def _translate_with_engine(self, pair: PairTranslator, text: str, deadline: float) -> str:
+        future = self._executor.submit(pair.engine.translate, text)
+        try:
+            # An abandoned call finishes on its worker; its result is dropped
+            translated = future.result(timeout=self._remaining(deadline, "before request"))
+        except FutureTimeoutError as e:
+            future.cancel()
+            raise ApiTranslationError("timeout: deadline exceeded waiting for translation") from e
+        except ApiTranslationError:
+            raise
+        except Exception as e:
+            raise ApiTranslationError(f"{type(e).__name__}: {e}") from e
+        if not translated or not str(translated).strip():
+            raise ApiTranslationError("no translation in response")
+        return str(translated).strip()
+
+    def translate(self, text: str, source: Optional[str], target: str) -> str:
+        """
+        Translate ``text``; raises ApiTranslationError (or CircuitOpenError).
+
+        The whole call, including retries, is bounded by ``timeout_s``.
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError("translation API circuit open")
+
+        self.calls += 1
+        deadline = time.monotonic() + self.timeout_s
+        if self._executor is not None:
+            try:
+                translated = self._translate_with_engine(self.translator(source, target), text, deadline)
+            except ApiTranslationError:
+                self.failures += 1
+                self.breaker.record_failure()
+                raise
+            self.breaker.record_success()
+            return translated
+
+        query = urlencode({"sl": source or "auto", "tl": target, "q": text})
+        last_error: Optional[Exception] = None
+        for _attempt in range(self.max_retries + 1):
+            try:
+                body = self._request(query, deadline)
+            except _RetryableError as e:
+                last_error = e
+                continue
+            except ApiTranslationError as e:
+                last_error = e
+                break
+            match = _RESULT_PATTERN.search(body)
+            translated = (
+                html.unescape(re.sub(r"<[^>]+>", "", match.group(1))).strip() if match else ""
+            )
+            if translated:
+                self.breaker.record_success()
+                return translated
+            print(
+                "[WARN] Translation API page has no result element; "
+                "its markup may have changed (install deep-translator)",
+                flush=True,
+            )
+            last_error = ApiTranslationError("no translation in response (page markup changed?)")
+            break
+
+        self.failures += 1
+        self.breaker.record_failure()
+        raise ApiTranslationError(str(last_error) if last_error else "translation failed")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "calls": self.calls,
+            "failures": self.failures,
+            "connections_created": self._pool.created,
+            "connections_reused": self._pool.reused,
+            "cached_pairs": len(self._translators),
+            "breaker": self.breaker.as_dict(),
+        }
+
+    def close(self) -> None:
+        self._pool.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
@@ -1,13 +1,24 @@
 """
 Playback routing for TTS output (virtual cable / speakers).
+
+Each output device gets one long-lived callback-driven PortAudio stream,
+opened on first use at the device's native rate with a small block size.
+Utterances are ``PlaybackVoice`` objects handed to the stream through a
+deque (atomic append/popleft, no lock in the audio callback) and mixed
+together, so several callouts can overlap and one utterance can fan out to
+the virtual cable and the speakers at the same moment.
 """
 from __future__ import annotations
 
 import threading
-from typing import List, Optional
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 
 import numpy as np
 
+from resampling import resample
+
 try:
     import sounddevice as sd
 
@@ -16,6 +27,11 @@ except ImportError:
     sd = None  # type: ignore
     _SOUNDDEVICE_AVAILABLE = False
 
+# 256 frames is ~5 ms at 48 kHz: short enough that a new voice starts almost
+# immediately, long enough for the Python callback to keep up.
+DEFAULT_BLOCKSIZE = 256
+_FALLBACK_SAMPLE_RATE = 48000
+
 
 def playback_available() -> bool:
     return _SOUNDDEVICE_AVAILABLE and sd is not None
@@ -43,17 +59,238 @@ def list_playback_devices() -> List[dict]:
     return devices
 
 
+def output_sample_rate(device_index: Optional[int] = None) -> Optional[int]:
+    """Default sample rate of an output device (None = system default output)."""
+    if not playback_available():
+        return None
+    try:
+        info = sd.query_devices(device_index, "output") if device_index is None else sd.query_devices(device_index)
+        return int(info.get("default_samplerate", 0)) or None
+    except Exception:
+        return None
+
+
+class PlaybackVoice:
+
+    """
+    One utterance on one device, fed chunk by chunk while it plays.
+
+    ``write`` may be called while earlier chunks are already playing; the
+    device mixes silence for this voice while it waits for more.
+    """
+
+    def __init__(self, output: "DeviceOutput", volume: float = 1.0) -> None:
+        self._output = output
+        self.sample_rate = output.sample_rate
+        self.volume = max(0.0, min(1.0, float(volume)))
+        self._chunks: Deque[np.ndarray] = deque()
+        self._offset = 0
+        self._closed = False
+        self._aborted = False
+        self._done = threading.Event()
+        # perf_counter() when the callback first mixed samples of this voice
+        self.first_audio_at: Optional[float] = None
+        self.starved_blocks = 0
+
+    @property
+    def output_latency_s(self) -> float:
+        return self._output.latency_s
+
+    def write(self, samples: np.ndarray, sample_rate: Optional[int] = None) -> None:
+        """Queue mono samples (resampled to the device rate when needed)."""
+        chunk = np.asarray(samples, dtype=np.float32).reshape(-1)
+        if sample_rate and sample_rate != self.sample_rate:
+            chunk = resample(chunk, sample_rate, self.sample_rate)
+        if self.volume != 1.0:
+            chunk = chunk * self.volume
+        if chunk.size:
+            self._chunks.append(chunk)
+
+    def close(self) -> None:
+        """No more audio; the voice ends once queued chunks have played."""
+        self._closed = True
+
+    def wait(self, timeout_s: Optional[float] = None) -> bool:
+        return self._done.wait(timeout_s)
+
+    def finish(self, timeout_s: Optional[float] = None) -> bool:
+        self.close()
+        return self.wait(timeout_s)
+
+    def abort(self) -> None:
+        """
+        Stop mid-utterance. Only flags the voice: the audio callback owns
+        ``_chunks`` while it mixes, so it drops them and sets ``_done``.
+        """
+        self._closed = True
+        self._aborted = True
+        if not self._output.active:
+            # No callback will run to finish it
+            self._drop()
+
+    def _drop(self) -> None:
+        self._chunks.clear()
+        self._done.set()
+
+    def _mix_into(self, out: np.ndarray, frames: int) -> int:
+        """Add up to ``frames`` samples into ``out``; runs in the audio callback."""
+        filled = 0
+        chunks = self._chunks
+        while filled < frames and chunks:
+            chunk = chunks[0]
+            take = min(frames - filled, chunk.shape[0] - self._offset)
+            out[filled:filled + take] += chunk[self._offset:self._offset + take]
+            filled += take
+            self._offset += take
+            if self._offset >= chunk.shape[0]:
+                chunks.popleft()
+                self._offset = 0
+        return filled
+
+
+class DeviceOutput:
+
+    """Long-lived mixing output stream for one device."""
+
+    def __init__(self, device_index: Optional[int], sample_rate: int, blocksize: int = DEFAULT_BLOCKSIZE) -> None:
+        self.device_index = device_index
+        self.sample_rate = int(sample_rate)
+        self.blocksize = int(blocksize)
+        self._incoming: Deque[PlaybackVoice] = deque()
+        self._active: List[PlaybackVoice] = []
+        self.underruns = 0
+        self.starved_blocks = 0
+        self.voices_played = 0
+        self._stream = sd.OutputStream(
+            samplerate=self.sample_rate,
+            device=device_index,
+            channels=1,
+            dtype="float32",
+            blocksize=self.blocksize,
+            latency="low",
+            callback=self._callback,
+        )
+        self._stream.start()
+
+    @property
+    def active(self) -> bool:
+        try:
+            return bool(self._stream.active)
+        except Exception:
+            return False
+
+    @property
+    def latency_s(self) -> float:
+        """Estimated delay from mixing a block to hearing it."""
+        try:
+            stream_latency = float(self._stream.latency)
+        except Exception:
+            stream_latency = 0.0
+        return stream_latency + self.blocksize / float(self.sample_rate)
+
+    def add(self, voice: PlaybackVoice) -> None:
+        self._incoming.append(voice)
+
+    def _callback(self, outdata, frames, _time_info, status) -> None:
+        if status and status.output_underflow:
+            self.underruns += 1
+        while self._incoming:
+            self._active.append(self._incoming.popleft())
+        out = outdata[:, 0]
+        out.fill(0.0)
+        if not self._active:
+            return
+        now = time.perf_counter()
+        still_active: List[PlaybackVoice] = []
+        for voice in self._active:
+            if voice._aborted:
+                voice._drop()
+                continue
+            filled = voice._mix_into(out, frames)
+            if filled and voice.first_audio_at is None:
+                voice.first_audio_at = now
+            if voice._closed and not voice._chunks:
+                voice._done.set()
+                self.voices_played += 1
+                continue
+            if filled < frames and voice.first_audio_at is not None:
+                # Producer (synthesis) fell behind playback mid-utterance
+                voice.starved_blocks += 1
+                self.starved_blocks += 1
+            still_active.append(voice)
+        self._active = still_active
+        np.clip(out, -1.0, 1.0, out=out)
+
+    def close(self) -> None:
+        try:
+            self._stream.abort()
+            self._stream.close()
+        except Exception:
+            pass
+        # The callback has stopped, so the voices can be dropped from here
+        for voice in list(self._active) + list(self._incoming):
+            voice._closed = voice._aborted = True
+            voice._drop()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "device_index": self.device_index,
+            "sample_rate": self.sample_rate,
+            "blocksize": self.blocksize,
+            "active": self.active,
+            "output_latency_ms": round(self.latency_s * 1000.0, 2),
+            "underruns": self.underruns,
+            "starved_blocks": self.starved_blocks,
+            "active_voices": len(self._active),
+            "voices_played": self.voices_played,
+        }
+
+
 class AudioOutputPlayer:
-    """Thread-safe queued playback to a chosen output device."""
+    """Non-blocking playback through one persistent mixing stream per device."""
 
-    def __init__(self) -> None:
+    def __init__(self, blocksize: int = DEFAULT_BLOCKSIZE) -> None:
+        self.blocksize = blocksize
         self._lock = threading.Lock()
-        self._playing = False
+        self._outputs: Dict[Optional[int], DeviceOutput] = {}
 
     @property
     def is_playing(self) -> bool:
         with self._lock:
-            return self._playing
+            return any(output._active or output._incoming for output in self._outputs.values())
+
+    def _output(self, device_index: Optional[int], sample_rate: Optional[int]) -> DeviceOutput:
+        if not playback_available() or sd is None:
+            raise RuntimeError("sounddevice not available for audio playback")
+        with self._lock:
+            output = self._outputs.get(device_index)
+            if output is not None and not output.active:
+                # Device went away or the stream errored; reopen it
+                output.close()
+                output = None
+            if output is None:
+                rate = output_sample_rate(device_index) or sample_rate or _FALLBACK_SAMPLE_RATE
+                output = DeviceOutput(device_index, rate, self.blocksize)
+                self._outputs[device_index] = output
+            return output
+
+    def open_voice(
+        self,
+        device_index: Optional[int] = None,
+        sample_rate: Optional[int] = None,
+        volume: float = 1.0,
+    ) -> PlaybackVoice:
+        """
+        Start an utterance on ``device_index``; feed it with ``write``.
+
+        Args:
+            sample_rate: rate used to open the device if it is not open yet
+                (its native rate wins when PortAudio reports one)
+        """
+        output = self._output(device_index, sample_rate)
+        voice = PlaybackVoice(output, volume=volume)
+        output.add(voice)
+        return voice
 
     def play(
         self,
@@ -61,22 +298,47 @@ class AudioOutputPlayer:
         sample_rate: int,
         device_index: Optional[int] = None,
         volume: float = 1.0,
-    ) -> None:
-        if not playback_available() or sd is None:
-            raise RuntimeError("sounddevice not available for audio playback")
-
+        blocking: bool = False,
+    ) -> Optional[PlaybackVoice]:
+        """Queue ``samples`` on a device; returns the voice (None if empty)."""
         mono = np.asarray(samples, dtype=np.float32).reshape(-1)
         if mono.size == 0:
-            return
+            return None
+        voice = self.open_voice(device_index, sample_rate, volume=volume)
+        voice.write(mono, sample_rate)
+        voice.close()
+        if blocking:
+            voice.wait(mono.size / float(sample_rate) + 5.0)
+        return voice
 
-        vol = max(0.0, min(1.0, float(volume)))
-        mono = np.clip(mono * vol, -1.0, 1.0)
+    def play_many(
+        self,
+        samples: np.ndarray,
+        sample_rate: int,
+        devices: List[Optional[int]],
+        volume: float = 1.0,
+        blocking: bool = False,
+    ) -> List[PlaybackVoice]:
+        """Start the same audio on every device at once."""
+        voices = [
+            voice
+            for voice in (self.play(samples, sample_rate, device, volume) for device in devices)
+            if voice is not None
+        ]
+        if blocking:
+            timeout_s = samples.size / float(sample_rate) + 5.0
+            for voice in voices:
+                voice.wait(timeout_s)
+        return voices
 
+    def stats(self) -> List[Dict[str, Any]]:
         with self._lock:
-            self._playing = True
+            outputs = list(self._outputs.values())
+        return [output.stats() for output in outputs]
 
-        try:
-            sd.play(mono, samplerate=int(sample_rate), device=device_index, blocking=True)
-        finally:
-            with self._lock:
-                self._playing = False
+    def close(self) -> None:
+        with self._lock:
+            outputs = list(self._outputs.values())
+            self._outputs.clear()
+        for output in outputs:
+            output.close()
@@ -0,0 +1,211 @@
+"""
+Int8 CTranslate2 backend for the local translation model.
+
+Models are converted once by scripts/convert_translation_model.py into
+``<models>/ct2/<model-id>-int8`` and then loaded through PairModelRouter like
+the fp32 MarianMT models, so pair routing and eviction work the same way.
+"""
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import ctranslate2
+
+    _CT2_AVAILABLE = True
+except ImportError:
+    ctranslate2 = None  # type: ignore
+    _CT2_AVAILABLE = False
+
+DEFAULT_QUANTIZATION = "int8"
+
+
+def ctranslate2_available() -> bool:
+    return _CT2_AVAILABLE and ctranslate2 is not None
+
+
+def quantized_model_dir(
+    models_dir: Path, model_id: str, quantization: str = DEFAULT_QUANTIZATION
+) -> Path:
+    return Path(models_dir) / "ct2" / f"{model_id.replace('/', '--')}-{quantization}"
+
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def make_loader(
+    models_dir: Path,
+    cpu_threads: int = 2,
+    quantization: str = DEFAULT_QUANTIZATION,
+) -> Callable[[str], Dict[str, Any]]:
+    """PairModelRouter loader that opens converted models on CPU."""
+
+    def load(model_id: str) -> Dict[str, Any]:
+        if not ctranslate2_available():
+            raise RuntimeError("ctranslate2 not installed")
+        model_dir = quantized_model_dir(models_dir, model_id, quantization)
+        if not (model_dir / "model.bin").is_file():
+            raise FileNotFoundError(
+                f"{model_dir} not found; run scripts/convert_translation_model.py"
+            )
+        from tokenization import TokenIdCache, load_tokenizer
+
+        translator = ctranslate2.Translator(
+            str(model_dir),
+            device="cpu",
+            compute_type=quantization,
+            inter_threads=1,
+            intra_threads=max(1, int(cpu_threads)),
+        )
+        tokenizer = load_tokenizer(str(model_dir))
+        return {
+            "model": translator,
+            "tokenizer": tokenizer,
+            "token_cache": TokenIdCache(tokenizer, "cpu"),
+            "device": "cpu",
+            "backend": "ctranslate2",
+            "memory_bytes": _dir_size(model_dir),
+        }
+
+    return load
+
+
+def _decode_options(
+    entry: Dict[str, Any],
+    beam_size: int,
+    max_decoding_length: int,
+    deadline_s: Optional[float],
+) -> Dict[str, Any]:
+    """
+    translate_batch options that honour ``deadline_s``.
+
+    CTranslate2 can only stop greedy search early (through the token
+    callback), so beam search runs only when the entry's measured decode rate
+    says even a ``max_decoding_length`` output finishes within the deadline.
+    Otherwise, and until a rate has been measured, decoding falls back to
+    greedy search under the callback.
+    """
+    if deadline_s and beam_size > 1:
+        rate = entry.get("s_per_beam_token")
+        if rate is None or max_decoding_length * beam_size * rate > deadline_s:
+            beam_size = 1
+            entry["deadline_greedy"] = entry.get("deadline_greedy", 0) + 1
+    options: Dict[str, Any] = {
+        "beam_size": beam_size,
+        "max_decoding_length": max_decoding_length,
+    }
+    if deadline_s and beam_size == 1:
+        stop_at = time.perf_counter() + deadline_s
+        options["callback"] = lambda _step: time.perf_counter() >= stop_at
+    return options
+
+
+def _record_decode_rate(entry: Dict[str, Any], elapsed_s: float, output_tokens: int, beam_size: int) -> None:
+    if output_tokens <= 0:
+        return
+    sample = elapsed_s / (output_tokens * beam_size)
+    previous = entry.get("s_per_beam_token")
+    entry["s_per_beam_token"] = sample if previous is None else 0.8 * previous + 0.2 * sample
+
+
+def translate_with_entry(
+    entry: Dict[str, Any],
+    text: str,
+    max_decoding_length: int = 512,
+    beam_size: int = 4,
+    deadline_s: Optional[float] = None,
+    input_ids: Optional[list] = None,
+    target_prefix_ids: Optional[list] = None,
+) -> Tuple[str, int]:
+    """
+    Run one sentence through a loaded CTranslate2 entry.
+
+    With greedy decoding the deadline is enforced per step through the token
+    callback, which stops decoding and keeps the partial hypothesis; beam
+    search is used only when it is expected to finish in time (see
+    _decode_options). ``target_prefix_ids`` forces the start of the output;
+    decoding continues after it.
+
+    Returns:
+        (decoded text, number of output tokens)
+    """
+    tokenizer = entry["tokenizer"]
+    if input_ids is None:
+        input_ids = tokenizer.encode(text)
+    source_tokens = tokenizer.convert_ids_to_tokens(input_ids)
+    if target_prefix_ids:
+        max_decoding_length += len(target_prefix_ids)
+    options = _decode_options(entry, beam_size, max_decoding_length, deadline_s)
+    if target_prefix_ids:
+        options["target_prefix"] = [tokenizer.convert_ids_to_tokens(target_prefix_ids)]
+    start = time.perf_counter()
+    results = entry["model"].translate_batch([source_tokens], **options)
+    output_tokens = results[0].hypotheses[0]
+    _record_decode_rate(entry, time.perf_counter() - start, len(output_tokens), options["beam_size"])
+    decoded = tokenizer.decode(
+        tokenizer.convert_tokens_to_ids(output_tokens), skip_special_tokens=True
+    )
+    return decoded, len(output_tokens)
+
+
+def translate_batch_with_entry(
+    entry: Dict[str, Any],
+    input_ids: List[list],
+    max_decoding_length: int = 512,
+    beam_size: int = 4,
+    deadline_s: Optional[float] = None,
+) -> List[Tuple[str, int]]:
+    """
+    Translate several already tokenized segments in one padded batch.
+
+    Returns:
+        [(decoded text, number of output tokens), ...] in input order
+    """
+    tokenizer = entry["tokenizer"]
+    # A batch decodes its segments side by side, so its cost scales with the batch
+    options = _decode_options(entry, beam_size, max_decoding_length * len(input_ids), deadline_s)
+    options["max_decoding_length"] = max_decoding_length
+    start = time.perf_counter()
+    results = entry["model"].translate_batch(
+        [tokenizer.convert_ids_to_tokens(ids) for ids in input_ids], **options
+    )
+    longest = max((len(result.hypotheses[0]) for result in results), default=0)
+    _record_decode_rate(
+        entry, time.perf_counter() - start, longest * len(input_ids), options["beam_size"]
+    )
+    outputs = []
+    for result in results:
+        output_tokens = result.hypotheses[0]
+        outputs.append((
+            tokenizer.decode(tokenizer.convert_tokens_to_ids(output_tokens), skip_special_tokens=True),
+            len(output_tokens),
+        ))
+    return outputs
+
+
+def stream_with_entry(
+    entry: Dict[str, Any],
+    input_ids: list,
+    max_decoding_length: int = 512,
+    deadline_s: Optional[float] = None,
+) -> Iterator[str]:
+    """
+    Greedy-decode one sentence token by token.
+
+    Yields the decoded text so far after every generated token; stops at the
+    end token, ``max_decoding_length`` or ``deadline_s``.
+    """
+    tokenizer = entry["tokenizer"]
+    source_tokens = tokenizer.convert_ids_to_tokens(input_ids)
+    stop_at = time.perf_counter() + deadline_s if deadline_s else None
+    output_ids: list = []
+    for step in entry["model"].generate_tokens(
+        source_tokens, max_decoding_length=max_decoding_length
+    ):
+        output_ids.append(step.token_id)
+        yield tokenizer.decode(output_ids, skip_special_tokens=True)
+        if stop_at is not None and time.perf_counter() >= stop_at:
+            break
@@ -0,0 +1,129 @@
+"""
+In-process offline TTS through the espeak-ng shared library.
+
+gTTS needs the network and SAPI exists only on Windows. espeak-ng ships for
+Windows, macOS and Linux, covers every language the app translates into, and
+its C API can synthesize synchronously into a callback, so samples go
+straight from libespeak-ng into a NumPy buffer: no subprocess, no WAV file.
+
+The library is located with ``ctypes.util.find_library`` (plus the default
+Windows install path, or ``ESPEAK_NG_LIBRARY``). espeak-ng keeps global
+state, so one instance serializes synthesis behind a lock.
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import sys
+import threading
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# speak_lib.h
+_AUDIO_OUTPUT_SYNCHRONOUS = 2
+_INITIALIZE_DONT_EXIT = 0x8000
+_POS_CHARACTER = 1
+_CHARS_UTF8 = 1
+_EE_OK = 0
+_PARAM_RATE = 1
+_PARAM_VOLUME = 2
+
+_SYNTH_CALLBACK = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.POINTER(ctypes.c_short), ctypes.c_int, ctypes.c_void_p)
+
+_DEFAULT_WPM = 175
+_WINDOWS_LIBRARY = r"C:\Program Files\eSpeak NG\libespeak-ng.dll"
+
+# App language codes whose espeak-ng voice name differs
+_VOICE_NAMES = {
+    "zh": "cmn",
+}
+
+
+def _find_library() -> Optional[str]:
+    override = os.environ.get("ESPEAK_NG_LIBRARY")
+    if override:
+        return override
+    found = ctypes.util.find_library("espeak-ng") or ctypes.util.find_library("libespeak-ng")
+    if found:
+        return found
+    if sys.platform == "win32" and os.path.exists(_WINDOWS_LIBRARY):
+        return _WINDOWS_LIBRARY
+    return None
+
+
+def espeak_available() -> bool:
+    return _find_library() is not None
+
+
+class EspeakEngine:
+
+    """libespeak-ng in synchronous mode; synthesize() returns mono float32 PCM."""
+
+    name = "espeak"
+
+    def __init__(self, library_path: Optional[str] = None) -> None:
+        path = library_path or _find_library()
+        if path is None:
+            raise RuntimeError("libespeak-ng not found")
+        self._lib = ctypes.CDLL(path)
+        self._lib.espeak_Initialize.restype = ctypes.c_int
+        self._lib.espeak_Initialize.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_char_p, ctypes.c_int]
+        self._lib.espeak_SetSynthCallback.argtypes = [_SYNTH_CALLBACK]
+        self._lib.espeak_SetVoiceByName.argtypes = [ctypes.c_char_p]
+        self._lib.espeak_SetParameter.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int]
+        self._lib.espeak_Synth.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_size_t,
+            ctypes.c_uint,
+            ctypes.c_int,
+            ctypes.c_uint,
+            ctypes.c_uint,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+        ]
+        self.sample_rate = int(self._lib.espeak_Initialize(_AUDIO_OUTPUT_SYNCHRONOUS, 0, None, _INITIALIZE_DONT_EXIT))
+        if self.sample_rate <= 0:
+            raise RuntimeError("espeak_Initialize failed (espeak-ng-data missing?)")
+        self._lock = threading.Lock()
+        self._chunks: List[np.ndarray] = []
+        # Keep a reference: ctypes does not keep the callback alive for C
+        self._callback = _SYNTH_CALLBACK(self._on_samples)
+        self._lib.espeak_SetSynthCallback(self._callback)
+        self._voice: Optional[str] = None
+
+    def _on_samples(self, wav, numsamples: int, _events) -> int:
+        if wav and numsamples > 0:
+            self._chunks.append(np.ctypeslib.as_array(wav, shape=(numsamples,)).copy())
+        return 0
+
+    def _set_voice(self, name: str) -> None:
+        if name == self._voice:
+            return
+        if self._lib.espeak_SetVoiceByName(name.encode("utf-8")) != _EE_OK:
+            raise RuntimeError(f"espeak-ng has no voice '{name}'")
+        self._voice = name
+
+    def synthesize(
+        self,
+        text: str,
+        language: str = "en",
+        rate: float = 1.0,
+        voice: Optional[str] = None,
+    ) -> Tuple[np.ndarray, int]:
+        """Unit-volume mono float32 PCM at ``self.sample_rate``."""
+        data = text.encode("utf-8") + b"\0"
+        with self._lock:
+            self._set_voice(voice or _VOICE_NAMES.get(language, language))
+            self._lib.espeak_SetParameter(_PARAM_RATE, int(max(80, min(450, _DEFAULT_WPM * float(rate or 1.0)))), 0)
+            self._lib.espeak_SetParameter(_PARAM_VOLUME, 100, 0)
+            self._chunks = []
+            err = self._lib.espeak_Synth(data, len(data), 0, _POS_CHARACTER, 0, _CHARS_UTF8, None, None)
+            self._lib.espeak_Synchronize()
+            chunks, self._chunks = self._chunks, []
+        if err != _EE_OK:
+            raise RuntimeError(f"espeak_Synth failed ({err})")
+        if not chunks:
+            raise RuntimeError("espeak-ng produced empty audio")
+        return np.concatenate(chunks).astype(np.float32) / 32768.0, self.sample_rate
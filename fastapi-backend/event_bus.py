@@ -0,0 +1,190 @@
+"""
+In-process pipeline event bus pushed to clients over WebSocket and SSE.
+
+Endpoints publish typed events (utterance start, partial and final
+transcripts, translations, TTS start/finish) instead of the renderer polling
+or chaining HTTP calls to learn about them. Every event gets a sequence
+number, a monotonic timestamp and correlation ids (``utterance_id``, and
+``job_id`` for TTS), and is serialized exactly once: the JSON text and the
+SSE frame built at publish time are shared by every subscriber.
+
+``publish`` may be called from any thread (the TTS scheduler thread,
+executor workers); delivery onto each subscriber's asyncio queue goes
+through its loop's ``call_soon_threadsafe``. A bounded ring of recent events
+lets late joiners replay history: ``replay=N`` for the last N events, or
+``since=<seq>`` to resume after a reconnect without gaps or duplicates.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set
+
+UTTERANCE_START = "utterance_start"
+PARTIAL = "partial"
+FINAL = "final"
+TRANSLATED = "translated"
+TTS_STARTED = "tts_started"
+TTS_FINISHED = "tts_finished"
+EVENT_TYPES = (UTTERANCE_START, PARTIAL, FINAL, TRANSLATED, TTS_STARTED, TTS_FINISHED)
+
+DEFAULT_HISTORY = 500
+# Events buffered per subscriber before its oldest undelivered ones are dropped
+DEFAULT_SUBSCRIBER_BUFFER = 1000
+
+
+class BusEvent:
+
+    """One published event with its serialized forms."""
+
+    __slots__ = ("seq", "type", "json", "sse")
+
+    def __init__(self, seq: int, event_type: str, payload: Dict[str, Any]) -> None:
+        self.seq = seq
+        self.type = event_type
+        self.json = json.dumps(payload, ensure_ascii=False)
+        self.sse = f"id: {seq}\nevent: {event_type}\ndata: {self.json}\n\n"
+
+
+class Subscription:
+
+    """A subscriber's queue on its own event loop; ``get`` awaits the next event."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, types: Optional[Set[str]], buffer: int) -> None:
+        self.loop = loop
+        self.types = types
+        self.queue: "asyncio.Queue[BusEvent]" = asyncio.Queue()
+        self.buffer = buffer
+        self.dropped = 0
+
+    def wants(self, event: BusEvent) -> bool:
+        return self.types is None or event.type in self.types
+
+    def _offer(self, event: BusEvent) -> None:
+        # Runs on the subscriber's loop; a stalled client loses its oldest events
+        if self.queue.qsize() >= self.buffer:
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[BusEvent]:
+        """Next event, or None after ``timeout`` seconds with nothing published."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBus:
+
+    """Fan-out of pipeline events to any number of subscribers, with replay."""
+
+    def __init__(self, history: int = DEFAULT_HISTORY, subscriber_buffer: int = DEFAULT_SUBSCRIBER_BUFFER) -> None:
+        self._lock = threading.Lock()
+        self._seq = itertools.count(1)
+        self._ids = itertools.count(1)
+        self._history: Deque[BusEvent] = deque(maxlen=history)
+        self._subscribers: List[Subscription] = []
+        self.subscriber_buffer = subscriber_buffer
+        self.published: Dict[str, int] = {}
+
+    def new_utterance_id(self) -> str:
+        return f"utt-{next(self._ids)}"
+
+    def publish(
+        self,
+        event_type: str,
+        utterance_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        **data: Any,
+    ) -> BusEvent:
+        """
+        Record and deliver one event.
+
+        Args:
+            event_type: one of EVENT_TYPES
+            utterance_id: correlates every event of one spoken utterance
+            job_id: TTS job id for tts_started / tts_finished
+            data: event fields (text, language, ...)
+
+        Returns:
+            The published event
+        """
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"unknown event type {event_type!r}")
+        with self._lock:
+            seq = next(self._seq)
+            payload = {
+                "seq": seq,
+                "type": event_type,
+                # Monotonic clock for ordering and latency; wall clock for display
+                "mono_ms": round(time.monotonic() * 1000.0, 3),
+                "wall_ms": round(time.time() * 1000.0, 1),
+                "utterance_id": utterance_id,
+                "job_id": job_id,
+                **data,
+            }
+            event = BusEvent(seq, event_type, payload)
+            self._history.append(event)
+            self.published[event_type] = self.published.get(event_type, 0) + 1
+            subscribers = [sub for sub in self._subscribers if sub.wants(event)]
+        for sub in subscribers:
+            try:
+                sub.loop.call_soon_threadsafe(sub._offer, event)
+            except RuntimeError:
+                # Loop closed under a subscriber that never unsubscribed
+                self.unsubscribe(sub)
+        return event
+
+    def subscribe(
+        self,
+        types: Optional[Iterable[str]] = None,
+        replay: int = 0,
+        since: Optional[int] = None,
+    ) -> Subscription:
+        """
+        Register a subscriber on the running event loop.
+
+        Args:
+            types: event types to receive (all when None)
+            replay: deliver the last ``replay`` matching events first
+            since: deliver every retained event after this seq first
+                (takes precedence over ``replay``)
+        """
+        wanted = set(types) if types else None
+        sub = Subscription(asyncio.get_running_loop(), wanted, self.subscriber_buffer)
+        with self._lock:
+            history = [event for event in self._history if sub.wants(event)]
+            if since is not None:
+                backlog = [event for event in history if event.seq > since]
+            else:
+                backlog = history[-replay:] if replay > 0 else []
+            # Backlog and registration under one lock: no gap and no duplicate
+            for event in backlog:
+                sub.queue.put_nowait(event)
+            self._subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
+
+    def recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        with self._lock:
+            events = list(self._history)[-limit:] if limit > 0 else []
+        return [json.loads(event.json) for event in events]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "dropped": sum(sub.dropped for sub in self._subscribers),
+                "history": len(self._history),
+                "last_seq": self._history[-1].seq if self._history else 0,
+                "published": dict(self.published),
+            }
@@ -9,25 +9,35 @@ for stream in (sys.stdout, sys.stderr):
     except Exception:
         pass
 
+from overlay_client import DAEMON_FLAG
+
+if __name__ == "__main__" and DAEMON_FLAG in sys.argv:
+    # Frozen builds cannot run overlay_daemon.py, so the overlay re-enters the
+    # backend executable; leave before torch, Whisper and FastAPI are imported.
+    import overlay_daemon
+
+    sys.exit(overlay_daemon.main([arg for arg in sys.argv[1:] if arg != DAEMON_FLAG]))
+
 import asyncio
 import functools
 import threading
 import queue
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
 import numpy as np
 import io
 import json
-import subprocess
-from pathlib import Path
 from copy import deepcopy
 from app_paths import get_app_data_dir
 from whisper_service import WhisperService
 from translation_service import TranslationService
+from speculative_translation import SpeculativeTranslator
+from translation_warmup import HISTORY_FILENAME, PhraseHistory, TranslationWarmup, collect_warmup_phrases
 from speaker_identification import get_service as get_speaker_service
-from adaptive_learning import learn_preference, get_personalized_translation
+from adaptive_learning import get_store as get_learning_store
 from audio_capture import (
     MAX_SAMPLES_PER_WS_CHUNK,
     SoundcardCaptureController,
@@ -38,8 +48,22 @@ from audio_capture import (
     soundcard_device_count,
     soundcard_preferred_samplerate,
 )
-from audio_output import AudioOutputPlayer, list_playback_devices, playback_available
+from event_bus import (
+    EVENT_TYPES,
+    FINAL,
+    PARTIAL,
+    TRANSLATED,
+    TTS_FINISHED,
+    TTS_STARTED,
+    UTTERANCE_START,
+    EventBus,
+)
+from overlay_client import OVERLAY_MODES, OverlayClient, daemon_command
+from audio_output import AudioOutputPlayer, list_playback_devices, output_sample_rate, playback_available
+from tts_playback import StreamedSpeaker
+from tts_scheduler import TtsScheduler
 from tts_service import TTSService
+from voice_pack import VoicePack
 
 try:
     import sounddevice as sd
@@ -62,6 +86,11 @@ app.add_middleware(
 # Initialize services (lazy loading)
 whisper_service: Optional[WhisperService] = None
 translation_service: Optional[TranslationService] = None
+# Partial-transcript speculation state (per utterance session)
+_speculative_translator = SpeculativeTranslator()
+# Frequently translated phrases (persisted) and the startup cache warm-up
+_phrase_history: Optional[PhraseHistory] = None
+_translation_warmup: Optional[TranslationWarmup] = None
 
 # Audio capture state (loopback + mic can run simultaneously)
 _CAPTURE_BLOCK_SIZE = 2048
@@ -104,6 +133,32 @@ _capture_block_size = _CAPTURE_BLOCK_SIZE
 
 _tts_service = TTSService()
 _audio_player = AudioOutputPlayer()
+_tts_speaker = StreamedSpeaker(_tts_service, _audio_player)
+_event_bus = EventBus()
+
+
+def _publish_tts_event(what: str, job) -> None:
+    """TtsScheduler playback-thread hook -> tts_started / tts_finished."""
+    merged = [{"job_id": m.job_id, "utterance_id": m.utterance_id} for m in job.merged]
+    if what == "started":
+        _event_bus.publish(
+            TTS_STARTED, job.utterance_id, job.job_id,
+            text=job.text, language=job.language, priority=job.priority, merged=merged,
+        )
+        return
+    result = job.result or {}
+    _event_bus.publish(
+        TTS_FINISHED, job.utterance_id, job.job_id,
+        status=job.status,
+        duration_s=result.get("duration_s"),
+        time_to_first_audio_ms=result.get("time_to_first_audio_ms"),
+        error=job.error,
+        merged=merged,
+    )
+
+
+_tts_scheduler = TtsScheduler(_tts_speaker, on_event=_publish_tts_event)
+_overlay = OverlayClient()
 
 # Audio device models
 class AudioDevice(BaseModel):
@@ -139,6 +194,9 @@ class TTSSpeakRequest(BaseModel):
     output_mode: str = "virtual_mic"  # virtual_mic | speakers | both
     volume: float = 1.0
     rate: float = 1.0
+    stream: Optional[bool] = None  # None = tts.streaming config
+    priority: int = 0  # higher interrupts lower-priority speech
+    utterance_id: Optional[str] = None  # correlation id echoed on tts_* events
 
 # Request/Response models
 class TranscribeRequest(BaseModel):
@@ -154,39 +212,108 @@ class TranscribeResponse(BaseModel):
     segments: List[dict]
     confidence: float
     rms_level: float
+    utterance_id: Optional[str] = None
 
 class TranslateRequest(BaseModel):
 
     text: str
     source_language: Optional[str] = None
     target_language: Optional[str] = "en"
+    utterance_id: Optional[str] = None  # correlation id for the translated event
 
 class TranslateResponse(BaseModel):
 
     translated_text: str
     source_language: str
     target_language: str
+    status: str = "ok"  # "warming" while the translation model is still loading
+    similarity: Optional[float] = None  # set when served from the fuzzy translation memory
+    learned: bool = False  # served from a learned user preference
+
+class SpeculativeTranslateRequest(BaseModel):
+
+    session_id: str  # one utterance; partials and its final share it
+    text: str
+    source_language: Optional[str] = None
+    target_language: Optional[str] = "en"
+    final: bool = False
+
+class SpeechTranslateResponse(BaseModel):
+
+    text: str  # source-language transcript ("" unless requested on the direct path)
+    translated_text: str
+    language: str
+    target_language: str
+    segments: List[dict]
+    confidence: float
+    rms_level: float
+    pipeline: str  # "whisper_translate" | "transcribe+nmt"
+    utterance_id: str
+    status: str = "ok"  # "warming" while the translation model is still loading
 
 class OverlayShowRequest(BaseModel):
     text: str
+    mode: str = "queue"  # "queue" | "replace" | "update"
+    line_id: Optional[str] = None  # line to edit in "update" mode
 
 class OverlayShowResponse(BaseModel):
     status: str
-    started: bool
+    started: bool  # True when this call (re)started the overlay process
     script_path: str
+    line_id: str
+    pid: Optional[int] = None
+
+def _learned_preferences():
+    """The shared preference store, or None when translation.learned_preferences is off."""
+    if not _load_config().get("translation", {}).get("learned_preferences", True):
+        return None
+    try:
+        return get_learning_store()
+    except Exception as e:
+        print(f"[WARN] Learned preferences unavailable: {e}", flush=True)
+        return None
 
 @app.on_event("startup")
 async def startup_event():
     """Create services immediately; load heavy models in the background."""
-    global whisper_service, translation_service
+    global whisper_service, translation_service, _phrase_history
 
     print("[STARTUP] Initializing ML services (models load in background)...", flush=True)
     whisper_service = WhisperService(model_name="base")
+    translation_cfg = _load_config().get("translation", {})
+    fuzzy_cfg = translation_cfg.get("fuzzy_memory") or {}
+    language_id_cfg = translation_cfg.get("language_id") or {}
     translation_service = TranslationService(
         target_language="en",
         model_type="local",
         use_fallback=True,
+        backend=translation_cfg.get("backend", "transformers"),
+        cpu_threads=int(translation_cfg.get("cpu_threads", 2)),
+        generation_deadline_ms=float(translation_cfg.get("generation_deadline_ms", 1500)),
+        api_timeout_ms=float(translation_cfg.get("api_timeout_ms", 2000)),
+        fuzzy_threshold=fuzzy_cfg.get("threshold", 0.9) if fuzzy_cfg.get("enabled", True) else None,
+        fuzzy_language_thresholds=fuzzy_cfg.get("language_thresholds") or {},
+        fuzzy_max_entries=int(fuzzy_cfg.get("max_entries", 10000)),
+        language_id_min_confidence=(
+            language_id_cfg.get("min_confidence", 0.6) if language_id_cfg.get("enabled", True) else None
+        ),
+        learned_preferences=_learned_preferences(),
+        segment_max_chars=int(translation_cfg.get("segment_max_chars", 200)),
     )
+    _phrase_history = PhraseHistory(get_app_data_dir() / HISTORY_FILENAME)
+    tts_cfg = _load_config().get("tts", {})
+    _tts_scheduler.configure(
+        max_queue_age_ms=tts_cfg.get("max_queue_age_ms", 3000),
+        merge_window_ms=tts_cfg.get("merge_window_ms", 400),
+        merge_max_chars=tts_cfg.get("merge_max_chars", 60),
+    )
+    _tts_service.set_engine(tts_cfg.get("engine", "default"))
+    if tts_cfg.get("voice_pack", True):
+        _tts_service.voice_pack = VoicePack.load()
+    if tts_cfg.get("enabled") and _tts_service.local_engine is not None:
+        # Pay speech engine start-up now rather than on the first callout
+        _tts_service.local_engine.start()
+    _overlay.configure(_load_config().get("overlay", {}))
     print("[STARTUP] HTTP server ready; preloading models...", flush=True)
 
     async def preload_models():
@@ -212,22 +339,84 @@ async def startup_event():
             try:
                 load_start = time.time()
                 await loop.run_in_executor(
-                    None, translation_service._initialize_local_model
+                    None, translation_service.wait_until_ready
                 )
                 print(
                     f"[STARTUP] Translation model loaded in {time.time() - load_start:.1f}s",
                     flush=True,
                 )
+                _start_translation_warmup(translation_cfg.get("warmup") or {})
             except Exception as e:
                 print(
                     f"[STARTUP] Translation preload failed (lazy load on use): {e}",
                     flush=True,
                 )
 
-        await asyncio.gather(load_whisper(), load_translation())
+        if _translation_model_needed():
+            await asyncio.gather(load_whisper(), load_translation())
+        else:
+            print(
+                "[STARTUP] Speech pipeline uses Whisper translate for English and "
+                "team translation is off; translation model loads only if /translate is called",
+                flush=True,
+            )
+            await load_whisper()
 
     asyncio.create_task(preload_models())
 
+def _start_translation_warmup(warmup_cfg: dict) -> None:
+    """Fill the translation cache with tactical phrases once the model is ready."""
+    global _translation_warmup
+
+    if not warmup_cfg.get("enabled", True) or translation_service is None:
+        return
+    phrases = collect_warmup_phrases(
+        translation_service.tactical_rules,
+        _phrase_history,
+        history_phrases=int(warmup_cfg.get("history_phrases", 200)),
+    )
+    _translation_warmup = TranslationWarmup(
+        translation_service,
+        phrases[: int(warmup_cfg.get("max_phrases", 500))],
+        min_interval_ms=float(warmup_cfg.get("min_interval_ms", 100)),
+        idle_ms=float(warmup_cfg.get("idle_ms", 750)),
+    )
+    _translation_warmup.start()
+
+def _record_phrase(text: str, source_language: Optional[str]) -> None:
+    if _phrase_history is not None:
+        _phrase_history.record(text, source_language)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the cache warm-up, persist the phrase history, stop TTS, close output streams and the overlay."""
+    if _translation_warmup is not None:
+        _translation_warmup.cancel()
+    if _phrase_history is not None:
+        _phrase_history.save()
+    _tts_scheduler.stop()
+    if _tts_service.local_engine is not None:
+        _tts_service.local_engine.stop()
+    _audio_player.close()
+    _overlay.stop()
+
+def _whisper_translates(target_language: Optional[str]) -> bool:
+    """True when speech into ``target_language`` comes from Whisper's translate task."""
+    cfg = _load_config().get("translation", {})
+    return (
+        cfg.get("speech_pipeline", "two_model") == "whisper_translate"
+        and (target_language or "en").lower() == "en"
+    )
+
+def _translation_model_needed() -> bool:
+    """False only when nothing calls /translate: inbound English comes from
+    Whisper's translate task and team translation is off."""
+    cfg = _load_config().get("translation", {})
+    return not (
+        _whisper_translates(cfg.get("target_language"))
+        and not cfg.get("translate_to_teammates", False)
+    )
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint — responds before models finish loading."""
@@ -235,12 +424,26 @@ async def health_check():
     translation_loaded = bool(
         translation_service and translation_service._model_loaded
     )
-    ready = whisper_loaded and translation_loaded
+    ready = whisper_loaded and (translation_loaded or not _translation_model_needed())
     return {
         "status": "healthy",
         "ready": ready,
         "whisper_loaded": whisper_loaded,
         "translation_loaded": translation_loaded,
+        "translation_status": (
+            translation_service.load_status() if translation_service else None
+        ),
+        "translation_api": (
+            translation_service.api_status() if translation_service else None
+        ),
+        "dedup": {
+            "translation": (
+                translation_service.dedup_stats() if translation_service else None
+            ),
+            "transcription": (
+                whisper_service.dedup_stats() if whisper_service else None
+            ),
+        },
     }
 
 def _audio_callback(indata, frames, time_info, status):
@@ -523,7 +726,12 @@ async def get_playback_devices():
 
 @app.post("/tts/speak")
 async def tts_speak(request: TTSSpeakRequest):
-    """Synthesize translated speech and play to virtual cable / speakers."""
+    """
+    Queue translated speech for the virtual cable / speakers.
+
+    Returns immediately with a job id; poll /tts/jobs/{job_id} for the
+    outcome (done, dropped as stale, merged, interrupted, failed).
+    """
     text = (request.text or "").strip()
     if not text:
         raise HTTPException(status_code=400, detail="TTS text is empty")
@@ -533,60 +741,77 @@ async def tts_speak(request: TTSSpeakRequest):
             detail="Audio playback unavailable; install sounddevice",
         )
 
-    loop = asyncio.get_event_loop()
-
-    def _run_playback() -> dict:
-        samples, sample_rate = _tts_service.synthesize(
-            text,
-            language=request.language,
-            rate=request.rate,
-            volume=request.volume,
+    mode = (request.output_mode or "virtual_mic").strip().lower()
+    devices: list[Optional[int]] = []
+    played_to: list[str] = []
+    if mode in ("virtual_mic", "both") and request.output_device_index is not None:
+        devices.append(request.output_device_index)
+        played_to.append(f"device_{request.output_device_index}")
+    if mode in ("speakers", "both"):
+        speaker_idx = request.speakers_device_index
+        devices.append(speaker_idx)
+        played_to.append(
+            f"speakers_{speaker_idx if speaker_idx is not None else 'default'}"
+        )
+    if not devices:
+        raise HTTPException(
+            status_code=400,
+            detail="No output device configured. Select a virtual cable or speakers output.",
         )
-        mode = (request.output_mode or "virtual_mic").strip().lower()
-        played_to: list[str] = []
 
-        if mode in ("virtual_mic", "both") and request.output_device_index is not None:
-            _audio_player.play(
-                samples,
-                sample_rate,
-                device_index=request.output_device_index,
-                volume=request.volume,
-            )
-            played_to.append(f"device_{request.output_device_index}")
+    stream = request.stream
+    if stream is None:
+        stream = bool(_load_config().get("tts", {}).get("streaming", True))
+    job_id = _tts_scheduler.submit(
+        text,
+        devices,
+        language=request.language,
+        rate=request.rate,
+        volume=request.volume,
+        # Synthesize (and cache) at the first output's native rate
+        sample_rate=output_sample_rate(devices[0]),
+        priority=request.priority,
+        streamed=stream,
+        utterance_id=request.utterance_id,
+    )
+    return {"status": "queued", "job_id": job_id, "utterance_id": request.utterance_id, "played_to": played_to}
 
-        if mode in ("speakers", "both"):
-            speaker_idx = request.speakers_device_index
-            _audio_player.play(
-                samples,
-                sample_rate,
-                device_index=speaker_idx,
-                volume=request.volume,
-            )
-            played_to.append(
-                f"speakers_{speaker_idx if speaker_idx is not None else 'default'}"
-            )
 
-        if not played_to:
-            raise RuntimeError(
-                "No output device configured. Select a virtual cable or speakers output."
-            )
+@app.get("/tts/jobs/{job_id}")
+async def tts_job_status(job_id: str):
+    """Status of a /tts/speak job (recent jobs only)."""
+    status = _tts_scheduler.status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Unknown TTS job {job_id}")
+    return status
 
-        return {
-            "status": "success",
-            "samples": int(samples.size),
-            "sample_rate": sample_rate,
-            "played_to": played_to,
-        }
 
-    try:
-        result = await loop.run_in_executor(None, _run_playback)
-        print(
-            f"[TTS] Spoke {len(text)} chars ({request.language}) -> {result['played_to']}",
-            flush=True,
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"TTS playback failed: {e!s}")
+@app.post("/tts/jobs/{job_id}/cancel")
+async def tts_job_cancel(job_id: str):
+    """Drop a queued utterance or stop it mid-sentence."""
+    return {"job_id": job_id, "cancelled": _tts_scheduler.cancel(job_id)}
+
+
+@app.get("/tts/cache")
+async def tts_cache_stats():
+    """Synthesized-audio cache and voice pack hit rates."""
+    return _tts_service.cache_stats()
+
+
+@app.get("/tts/playback")
+async def tts_playback_stats():
+    """Streamed TTS time-to-first-audio, job queue counters, per-device underruns and latency."""
+    return {
+        **_tts_speaker.stats(),
+        "queue": _tts_scheduler.stats(),
+        "devices": _audio_player.stats(),
+    }
+
+
+@app.get("/tts/engine")
+async def tts_engine_stats():
+    """TTS engine order and measured latency; local worker startup cost."""
+    return _tts_service.engine_stats()
 
 
 async def _audio_stream_ws_handler(websocket: WebSocket, source: str) -> None:
@@ -616,6 +841,100 @@ async def audio_stream_ws_source(websocket: WebSocket, source: str):
     """WebSocket for loopback or mic audio chunks."""
     await _audio_stream_ws_handler(websocket, source.strip().lower())
 
+def _parse_event_types(raw: Optional[str]) -> Optional[set]:
+    """Comma-separated ``types`` filter -> set (None = every type)."""
+    if not raw:
+        return None
+    types = {t.strip() for t in raw.split(",") if t.strip()}
+    unknown = types - set(EVENT_TYPES)
+    if unknown:
+        raise ValueError(f"unknown event types: {', '.join(sorted(unknown))}")
+    return types or None
+
+
+@app.websocket("/events")
+async def events_ws(websocket: WebSocket):
+    """
+    Pipeline events as JSON text frames.
+
+    Query: ``types`` (comma-separated filter), ``replay`` (last N events
+    first) or ``since`` (every retained event after this seq first).
+    """
+    params = websocket.query_params
+    try:
+        types = _parse_event_types(params.get("types"))
+        replay = int(params.get("replay") or 0)
+        since = int(params["since"]) if params.get("since") else None
+    except ValueError:
+        await websocket.close(code=4400)
+        return
+    await websocket.accept()
+    sub = _event_bus.subscribe(types, replay=replay, since=since)
+
+    async def pump():
+        while True:
+            event = await sub.get()
+            await websocket.send_text(event.json)
+
+    sender = asyncio.create_task(pump())
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        _event_bus.unsubscribe(sub)
+
+
+@app.get("/events/stream")
+async def events_sse(
+    request: Request,
+    types: Optional[str] = None,
+    replay: int = 0,
+    since: Optional[int] = None,
+):
+    """
+    Pipeline events as Server-Sent Events (``event:`` is the event type).
+
+    A reconnecting EventSource sends Last-Event-ID and resumes after it.
+    """
+    try:
+        wanted = _parse_event_types(types)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    last_event_id = request.headers.get("last-event-id", "")
+    if since is None and last_event_id.isdigit():
+        since = int(last_event_id)
+    sub = _event_bus.subscribe(wanted, replay=replay, since=since)
+
+    async def stream():
+        try:
+            while not await request.is_disconnected():
+                event = await sub.get(timeout=15.0)
+                # Comment line keeps proxies and idle clients from timing out
+                yield event.sse if event is not None else ": keepalive\n\n"
+        finally:
+            _event_bus.unsubscribe(sub)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/events/recent")
+async def events_recent(limit: int = 50):
+    """Most recent pipeline events, oldest first."""
+    return _event_bus.recent(limit)
+
+
+@app.get("/events/stats")
+async def events_stats():
+    """Event bus subscribers, retained history and per-type publish counts."""
+    return _event_bus.stats()
+
 def _run_whisper_transcribe(
     audio_array: np.ndarray,
     sample_rate: int,
@@ -623,6 +942,8 @@ def _run_whisper_transcribe(
     min_audio_threshold: float,
     model_name: str,
     channels: int = 1,
+    task: str = "transcribe",
+    include_original: bool = False,
 ) -> dict:
     """Run Whisper in a worker thread so the event loop stays responsive."""
     global whisper_service
@@ -636,6 +957,8 @@ def _run_whisper_transcribe(
         language=language,
         min_audio_threshold=min_audio_threshold,
         channels=channels,
+        task=task,
+        include_original=include_original,
     )
 
 
@@ -713,6 +1036,58 @@ async def transcribe_audio(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Transcription error: {str(e)}")
 
+def _decode_float32_pcm(audio_data: bytes, sample_rate: int) -> np.ndarray:
+    """Validate raw float32 PCM upload bytes and return them as an array."""
+    # Validate input
+    if not audio_data or len(audio_data) == 0:
+        raise HTTPException(status_code=400, detail="Empty audio data received")
+
+    if sample_rate <= 0:
+        raise HTTPException(status_code=400, detail=f"Invalid sample rate: {sample_rate}")
+
+    # Check minimum bytes (at least 4 bytes for one float32 sample)
+    if len(audio_data) < 4:
+        raise HTTPException(status_code=400, detail=f"Audio data too short: {len(audio_data)} bytes (need at least 4 for one float32 sample)")
+
+    # Ensure the byte length is a multiple of 4 (float32 = 4 bytes)
+    if len(audio_data) % 4 != 0:
+        # Truncate to multiple of 4
+        audio_data = audio_data[:len(audio_data) - (len(audio_data) % 4)]
+        print(f"[WARN] Truncated audio data to {len(audio_data)} bytes (multiple of 4)")
+
+    # Convert bytes to numpy array (float32)
+    try:
+        audio_array = np.frombuffer(audio_data, dtype=np.float32)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to convert bytes to float32 array: {e}")
+
+    print(f"[DEBUG] Received audio: {len(audio_data)} bytes, {len(audio_array)} samples, sample_rate={sample_rate}, duration={len(audio_array)/sample_rate:.2f}s")
+    print(f"[DEBUG] Audio stats: min={np.min(audio_array):.6f}, max={np.max(audio_array):.6f}, mean={np.mean(audio_array):.6f}, rms={np.sqrt(np.mean(audio_array**2)):.6f}")
+
+    # Validate audio array
+    if len(audio_array) == 0:
+        raise HTTPException(status_code=400, detail="Audio array is empty after conversion")
+
+    # Check for invalid values
+    if np.any(np.isnan(audio_array)) or np.any(np.isinf(audio_array)):
+        nan_count = np.sum(np.isnan(audio_array))
+        inf_count = np.sum(np.isinf(audio_array))
+        raise HTTPException(
+            status_code=400,
+            detail=f"Audio data contains invalid values: {nan_count} NaN, {inf_count} Inf"
+        )
+
+    # Check minimum duration (at least 0.1 seconds)
+    min_samples = int(sample_rate * 0.1)
+    if len(audio_array) < min_samples:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Audio too short: {len(audio_array)} samples (need at least {min_samples} for {sample_rate}Hz, duration={len(audio_array)/sample_rate:.3f}s)"
+        )
+
+    return audio_array
+
+
 @app.post("/transcribe_bytes")
 async def transcribe_audio_bytes(
     audio_data: bytes = File(...),
@@ -721,6 +1096,7 @@ async def transcribe_audio_bytes(
     language: Optional[str] = Form(None),
     channels: int = Form(1),
     min_audio_threshold: float = Form(0.001),
+    utterance_id: Optional[str] = Form(None),
 ):
     """
     Transcribe raw audio bytes (float32 PCM)
@@ -731,6 +1107,7 @@ async def transcribe_audio_bytes(
         model_name: Whisper model name
         language: Language code
         min_audio_threshold: Minimum RMS level
+        utterance_id: Correlation id for pipeline events (generated if omitted)
 
     Returns:
         Transcription result
@@ -741,52 +1118,11 @@ async def transcribe_audio_bytes(
         if whisper_service is None or whisper_service.model_name != model_name:
             whisper_service = WhisperService(model_name=model_name)
 
-        # Validate input
-        if not audio_data or len(audio_data) == 0:
-            raise HTTPException(status_code=400, detail="Empty audio data received")
-
-        if sample_rate <= 0:
-            raise HTTPException(status_code=400, detail=f"Invalid sample rate: {sample_rate}")
-
-        # Check minimum bytes (at least 4 bytes for one float32 sample)
-        if len(audio_data) < 4:
-            raise HTTPException(status_code=400, detail=f"Audio data too short: {len(audio_data)} bytes (need at least 4 for one float32 sample)")
-
-        # Ensure the byte length is a multiple of 4 (float32 = 4 bytes)
-        if len(audio_data) % 4 != 0:
-            # Truncate to multiple of 4
-            audio_data = audio_data[:len(audio_data) - (len(audio_data) % 4)]
-            print(f"[WARN] Truncated audio data to {len(audio_data)} bytes (multiple of 4)")
-
-        # Convert bytes to numpy array (float32)
-        try:
-            audio_array = np.frombuffer(audio_data, dtype=np.float32)
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Failed to convert bytes to float32 array: {e}")
-
-        print(f"[DEBUG] Received audio: {len(audio_data)} bytes, {len(audio_array)} samples, sample_rate={sample_rate}, duration={len(audio_array)/sample_rate:.2f}s")
-        print(f"[DEBUG] Audio stats: min={np.min(audio_array):.6f}, max={np.max(audio_array):.6f}, mean={np.mean(audio_array):.6f}, rms={np.sqrt(np.mean(audio_array**2)):.6f}")
-
-        # Validate audio array
-        if len(audio_array) == 0:
-            raise HTTPException(status_code=400, detail="Audio array is empty after conversion")
-
-        # Check for invalid values
-        if np.any(np.isnan(audio_array)) or np.any(np.isinf(audio_array)):
-            nan_count = np.sum(np.isnan(audio_array))
-            inf_count = np.sum(np.isinf(audio_array))
-            raise HTTPException(
-                status_code=400,
-                detail=f"Audio data contains invalid values: {nan_count} NaN, {inf_count} Inf"
-            )
-
-        # Check minimum duration (at least 0.1 seconds)
-        min_samples = int(sample_rate * 0.1)
-        if len(audio_array) < min_samples:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Audio too short: {len(audio_array)} samples (need at least {min_samples} for {sample_rate}Hz, duration={len(audio_array)/sample_rate:.3f}s)"
-            )
+        audio_array = _decode_float32_pcm(audio_data, sample_rate)
+        utterance_id = utterance_id or _event_bus.new_utterance_id()
+        _event_bus.publish(
+            UTTERANCE_START, utterance_id, duration_s=round(len(audio_array) / sample_rate, 3)
+        )
 
         try:
             import time
@@ -838,12 +1174,17 @@ async def transcribe_audio_bytes(
                 pass
             # #endregion
 
+            _event_bus.publish(
+                FINAL, utterance_id,
+                text=result["text"], language=result["language"], confidence=result.get("confidence", 0.0),
+            )
             return TranscribeResponse(
                 text=result["text"],
                 language=result["language"],
                 segments=result.get("segments", []),
                 confidence=result.get("confidence", 0.0),
-                rms_level=result.get("rms_level", 0.0)
+                rms_level=result.get("rms_level", 0.0),
+                utterance_id=utterance_id,
             )
         except ValueError as ve:
             # ValueError from our validation - return 400
@@ -869,6 +1210,18 @@ async def transcribe_audio_bytes(
         print(f"[ERROR] Full traceback:\n{error_trace}")
         raise HTTPException(status_code=500, detail=f"Transcription error: {str(e)}")
 
+def _publish_translated(utterance_id: Optional[str], source_text: str, result: dict) -> None:
+    if result.get("status") == "warming":
+        # Source text passed through while the model loads; nothing was translated
+        return
+    _event_bus.publish(
+        TRANSLATED, utterance_id,
+        source_text=source_text,
+        translated_text=result.get("translated_text", ""),
+        source_language=result.get("source_language"),
+        target_language=result.get("target_language"),
+    )
+
 @app.post("/translate", response_model=TranslateResponse)
 async def translate_text(request: TranslateRequest):
     """
@@ -887,7 +1240,8 @@ async def translate_text(request: TranslateRequest):
             translation_service = TranslationService(
                 target_language=request.target_language,
                 model_type="local",
-                use_fallback=True
+                use_fallback=True,
+                learned_preferences=_learned_preferences(),
             )
         elif translation_service.target_language != request.target_language:
             translation_service.set_target_language(request.target_language)
@@ -931,6 +1285,10 @@ async def translate_text(request: TranslateRequest):
             pass
         # #endregion
 
+        if result.get("status") != "warming":
+            _record_phrase(request.text, result.get("source_language"))
+        _publish_translated(request.utterance_id, request.text, result)
+
         # Log if there was an error in translation
         if "error" in result:
             print(f"[WARN] Translation had error: {result['error']}")
@@ -938,7 +1296,10 @@ async def translate_text(request: TranslateRequest):
         return TranslateResponse(
             translated_text=result["translated_text"],
             source_language=result["source_language"],
-            target_language=result["target_language"]
+            target_language=result["target_language"],
+            status=result.get("status", "ok"),
+            similarity=result.get("similarity"),
+            learned=bool(result.get("learned")),
         )
 
     except Exception as e:
@@ -947,39 +1308,297 @@ async def translate_text(request: TranslateRequest):
         print(traceback.format_exc())
         raise HTTPException(status_code=500, detail=f"Translation error: {str(e)}")
 
+@app.post("/translate/speculative")
+async def translate_speculative(request: SpeculativeTranslateRequest):
+    """
+    Speculative translation of partial transcripts.
+
+    Send each partial transcript of an utterance with ``final=false``: once two
+    consecutive partials agree on a prefix it is translated in the background.
+    The ``final=true`` call returns the translation, reusing the speculation
+    when the final matches or extends it ("speculation": accepted / patched /
+    discarded / unspeculated).
+    """
+    global translation_service
+
+    if translation_service is None:
+        translation_service = TranslationService(
+            target_language=request.target_language,
+            model_type="local",
+            use_fallback=True,
+            learned_preferences=_learned_preferences(),
+        )
+    elif translation_service.target_language != request.target_language:
+        translation_service.set_target_language(request.target_language)
+
+    loop = asyncio.get_event_loop()
+    if not request.final:
+        result = _speculative_translator.partial(
+            translation_service, request.session_id, request.text, request.source_language
+        )
+        if result["partials"] == 1:
+            _event_bus.publish(UTTERANCE_START, request.session_id)
+        _event_bus.publish(PARTIAL, request.session_id, text=request.text, language=request.source_language)
+        return result
+    _event_bus.publish(FINAL, request.session_id, text=request.text, language=request.source_language)
+    result = await loop.run_in_executor(
+        None,
+        functools.partial(
+            _speculative_translator.final,
+            translation_service,
+            request.session_id,
+            request.text,
+            request.source_language,
+        ),
+    )
+    if result.get("status") != "warming":
+        _record_phrase(request.text, request.source_language)
+    _publish_translated(request.session_id, request.text, result)
+    return result
+
+def _sse_event(event: dict) -> str:
+    return f"event: {event.get('type', 'message')}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+
+@app.post("/translate/stream")
+async def translate_text_stream(request: TranslateRequest):
+    """
+    Stream a translation as Server-Sent Events.
+
+    Emits ``partial`` events (full tactically compressed text of every word
+    decoded so far, ``append`` false when compression rewrote earlier words)
+    and ends with one ``final`` event shaped like the /translate response.
+    """
+    global translation_service
+
+    if translation_service is None:
+        translation_service = TranslationService(
+            target_language=request.target_language,
+            model_type="local",
+            use_fallback=True,
+            learned_preferences=_learned_preferences(),
+        )
+    elif translation_service.target_language != request.target_language:
+        translation_service.set_target_language(request.target_language)
+
+    service = translation_service
+
+    def events():
+        try:
+            for event in service.translate_stream(request.text, request.source_language):
+                if event.get("type") == "final":
+                    if event.get("status") != "warming":
+                        _record_phrase(request.text, request.source_language)
+                    _publish_translated(request.utterance_id, request.text, event)
+                yield _sse_event(event)
+        except Exception as e:
+            print(f"[ERROR] Streaming translation exception: {e}")
+            yield _sse_event({"type": "error", "detail": str(e)})
+
+    # Sync generator: Starlette iterates it in the threadpool, so generate()
+    # never blocks the event loop.
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+def _run_speech_translate(
+    audio_array: np.ndarray,
+    sample_rate: int,
+    language: Optional[str],
+    min_audio_threshold: float,
+    model_name: str,
+    channels: int,
+    target_language: str,
+    include_original: bool,
+) -> dict:
+    """Audio -> target text in one worker hop.
+
+    With translation.speech_pipeline = "whisper_translate", English targets use
+    Whisper's own X->en translate task and never touch the NMT model; its
+    output still gets learned preferences, callout resolution and tactical
+    compression. Otherwise the audio is transcribed and run through
+    TranslationService.
+    """
+    global translation_service
+    if translation_service is None:
+        translation_service = TranslationService(
+            target_language=target_language,
+            model_type="local",
+            use_fallback=True,
+            learned_preferences=_learned_preferences(),
+        )
+    if _whisper_translates(target_language):
+        result = _run_whisper_transcribe(
+            audio_array,
+            sample_rate,
+            language,
+            min_audio_threshold,
+            model_name,
+            channels,
+            task="translate",
+            include_original=include_original,
+        )
+        english = result.get("text", "")
+        result["text"] = result.get("original_text", "")
+        finished = translation_service.finish_speech_translation(
+            english, result["text"], result.get("language")
+        )
+        result["translated_text"] = finished["translated_text"]
+        result["pipeline"] = "whisper_translate"
+        return result
+
+    result = _run_whisper_transcribe(
+        audio_array, sample_rate, language, min_audio_threshold, model_name, channels
+    )
+    if translation_service.target_language != target_language:
+        translation_service.set_target_language(target_language)
+    translated = translation_service.translate(result.get("text", ""), result.get("language"))
+    if translated.get("status") != "warming":
+        _record_phrase(result.get("text", ""), translated.get("source_language"))
+    result["translated_text"] = translated.get("translated_text", "")
+    result["status"] = translated.get("status", "ok")
+    result["pipeline"] = "transcribe+nmt"
+    return result
+
+@app.post("/speech_translate_bytes", response_model=SpeechTranslateResponse)
+async def speech_translate_bytes(
+    audio_data: bytes = File(...),
+    sample_rate: int = Form(16000),
+    model_name: str = Form("base"),
+    language: Optional[str] = Form(None),
+    channels: int = Form(1),
+    min_audio_threshold: float = Form(0.001),
+    target_language: str = Form("en"),
+    include_original: bool = Form(False),
+    utterance_id: Optional[str] = Form(None),
+):
+    """
+    Transcribe and translate raw float32 PCM in a single request
+
+    Args:
+        audio_data: Raw audio bytes (float32 PCM)
+        target_language: Output language; 'en' uses Whisper's translate task
+            when translation.speech_pipeline is "whisper_translate"
+        include_original: Also return the source-language transcript
+            (one extra Whisper pass on the direct English path)
+        utterance_id: Correlation id for pipeline events (generated if omitted)
+
+    Returns:
+        Source transcript (when requested) and translated text
+    """
+    audio_array = _decode_float32_pcm(audio_data, sample_rate)
+    utterance_id = utterance_id or _event_bus.new_utterance_id()
+    _event_bus.publish(UTTERANCE_START, utterance_id, duration_s=round(len(audio_array) / sample_rate, 3))
+    try:
+        loop = asyncio.get_event_loop()
+        result = await loop.run_in_executor(
+            None,
+            functools.partial(
+                _run_speech_translate,
+                audio_array,
+                sample_rate,
+                language,
+                min_audio_threshold,
+                model_name,
+                channels,
+                target_language,
+                include_original,
+            ),
+        )
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=f"Validation error: {ve}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Speech translation error: {str(e)}")
+
+    _event_bus.publish(
+        FINAL, utterance_id,
+        text=result.get("text", ""), language=result.get("language", "unknown"),
+        confidence=result.get("confidence", 0.0),
+    )
+    if result.get("status") != "warming":
+        _event_bus.publish(
+            TRANSLATED, utterance_id,
+            source_text=result.get("text", ""),
+            translated_text=result.get("translated_text", ""),
+            source_language=result.get("language", "unknown"),
+            target_language=target_language,
+            pipeline=result["pipeline"],
+        )
+    return SpeechTranslateResponse(
+        text=result.get("text", ""),
+        translated_text=result.get("translated_text", ""),
+        language=result.get("language", "unknown"),
+        target_language=target_language,
+        segments=result.get("segments", []),
+        confidence=result.get("confidence", 0.0),
+        rms_level=result.get("rms_level", 0.0),
+        pipeline=result["pipeline"],
+        utterance_id=utterance_id,
+        status=result.get("status", "ok"),
+    )
+
+@app.get("/translation/pairs")
+async def translation_pair_report():
+    """Per language pair model routing, latency and quality report."""
+    if translation_service is None:
+        return {"enabled": False}
+    report = translation_service.pair_report()
+    report["speculation"] = _speculative_translator.report()
+    report["warmup"] = _translation_warmup.status() if _translation_warmup else {"state": "idle"}
+    return report
+
+@app.post("/translation/warmup/cancel")
+async def cancel_translation_warmup():
+    """Stop the startup cache warm-up; phrases already cached stay cached."""
+    if _translation_warmup is None:
+        return {"state": "idle"}
+    _translation_warmup.cancel()
+    return _translation_warmup.status()
+
 @app.post("/overlay/show", response_model=OverlayShowResponse)
 async def show_overlay(request: OverlayShowRequest):
     """
-    Show subtitle overlay text using the Python overlay script.
+    Show subtitle overlay text in the persistent Python overlay process.
 
     This is intentionally a side-effecting endpoint used by the Electron UI
     (including the "Test Overlay" button) so overlay behavior matches runtime.
+    The overlay process is started on first use and reused; "queue" adds a
+    line, "replace" shows only this line and "update" edits ``line_id`` in
+    place (e.g. a growing partial transcript).
     """
     text = (request.text or "").strip()
     if not text:
         raise HTTPException(status_code=400, detail="Text is required")
+    if request.mode not in OVERLAY_MODES:
+        raise HTTPException(status_code=400, detail=f"mode must be one of: {', '.join(OVERLAY_MODES)}")
 
-    project_root = Path(__file__).resolve().parent.parent
-    overlay_script = project_root / "overlay_test.py"
-    if not overlay_script.exists():
-        raise HTTPException(
-            status_code=500,
-            detail=f"overlay_test.py not found at {str(overlay_script)}",
-        )
-
+    starts = _overlay.starts
     try:
-        subprocess.Popen(
-            [sys.executable, str(overlay_script), text],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-        return OverlayShowResponse(
-            status="ok",
-            started=True,
-            script_path=str(overlay_script),
-        )
+        line_id = _overlay.show(text, mode=request.mode, line_id=request.line_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to start overlay: {str(e)}")
+    stats = _overlay.stats()
+    return OverlayShowResponse(
+        status="ok",
+        started=_overlay.starts != starts,
+        script_path=daemon_command()[-1],
+        line_id=line_id,
+        pid=stats["pid"],
+    )
+
+@app.post("/overlay/clear")
+async def clear_overlay():
+    """Remove every line from the overlay (no-op when it is not running)."""
+    if _overlay.running:
+        _overlay.send("clear", line_id="")
+    return {"status": "ok"}
+
+@app.get("/overlay/stats")
+async def overlay_stats():
+    """Overlay process state, commands per redraw and send-to-screen latency."""
+    return _overlay.stats()
 
 @app.post("/identify_speaker")
 async def identify_speaker(
@@ -996,24 +1615,66 @@ async def identify_speaker(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Speaker identification error: {str(e)}")
 
+class LearnedPreferencesImport(BaseModel):
+    entries: List[dict]  # {context, translation, source_language?, target_language?}
+    replace: bool = False
+
 @app.post("/learn_preference")
-async def learn_preference_api(context: str = Form(...), translation: str = Form(...)):
-    """Learn user preference for a given context."""
+async def learn_preference_api(
+    context: str = Form(...),
+    translation: str = Form(...),
+    source_language: Optional[str] = Form(None),
+    target_language: Optional[str] = Form(None),
+):
+    """Learn user preference for a given context (optionally per source language).
+
+    Without ``target_language`` the preference is scoped to the configured
+    target, so it is not applied to translations into other languages.
+    """
     try:
-        learn_preference(context, translation)
+        if not target_language:
+            target_language = _load_config().get("translation", {}).get("target_language") or "en"
+        if not get_learning_store().learn(context, translation, source_language, target_language):
+            raise HTTPException(status_code=400, detail="Context and translation are required")
         return {"status": "ok"}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Learning error: {str(e)}")
 
 @app.post("/get_personalized_translation")
-async def get_personalized_translation_api(context: str = Form(...)):
-    """Get personalized translation for a context."""
+async def get_personalized_translation_api(
+    context: str = Form(...),
+    source_language: Optional[str] = Form(None),
+    target_language: Optional[str] = Form(None),
+):
+    """Get personalized translation for a context (target defaults to the configured one)."""
     try:
-        pref = get_personalized_translation(context)
+        if not target_language:
+            target_language = _load_config().get("translation", {}).get("target_language") or "en"
+        pref = get_learning_store().lookup(context, source_language, target_language)
         return {"preferred_translation": pref}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Preference error: {str(e)}")
 
+@app.get("/learned_preferences/export")
+async def export_learned_preferences():
+    """Every learned preference, in the shape /learned_preferences/import accepts."""
+    return {"entries": get_learning_store().export_entries()}
+
+@app.post("/learned_preferences/import")
+async def import_learned_preferences(request: LearnedPreferencesImport):
+    """Bulk-load preferences (``replace`` drops the existing ones first)."""
+    try:
+        loop = asyncio.get_event_loop()
+        imported = await loop.run_in_executor(
+            None,
+            functools.partial(get_learning_store().import_entries, request.entries, request.replace),
+        )
+        return {"imported": imported, **get_learning_store().stats()}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Import error: {str(e)}")
+
 _CONFIG_PATH = get_app_data_dir() / "config.json"
 _runtime_config: Optional[dict] = None
 
@@ -1040,6 +1701,47 @@ def _default_config() -> dict:
             "provider": "local",
             "model_type": "nllb",
             "model_name": "facebook/nllb-200-distilled-600M",
+            # "transformers" (fp32 PyTorch) or "ctranslate2" (int8 CPU, see
+            # scripts/convert_translation_model.py); read at startup.
+            "backend": "transformers",
+            "cpu_threads": 2,
+            "generation_deadline_ms": 1500,
+            "api_timeout_ms": 2000,
+            # Long transcripts are split into sentences/clauses of at most this
+            # many characters and translated as one padded batch.
+            "segment_max_chars": 200,
+            # Reuse translations of near-duplicate transcripts ("Rush B!" ~ "rush b").
+            # Similarity is trigram Dice in [0, 1]; language_thresholds overrides
+            # the default per source language, e.g. {"ru": 0.92}.
+            "fuzzy_memory": {
+                "enabled": True,
+                "threshold": 0.9,
+                "language_thresholds": {},
+                "max_entries": 10000,
+            },
+            # Identify the source language of untagged text in-process (char
+            # n-grams, or fastText when lid.176.ftz is in the models dir).
+            "language_id": {
+                "enabled": True,
+                "min_confidence": 0.6,
+            },
+            # Once the model is ready, translate tactical_terms.json
+            # warmup_phrases, the demo callouts and the most frequent history
+            # into the cache, one phrase per min_interval_ms and only after
+            # idle_ms without live requests.
+            # Preferences taught via /learn_preference replace the model output.
+            "learned_preferences": True,
+            "warmup": {
+                "enabled": True,
+                "history_phrases": 200,
+                "max_phrases": 500,
+                "min_interval_ms": 100,
+                "idle_ms": 750,
+            },
+            # "two_model" (Whisper transcribe + NMT) or "whisper_translate"
+            # (/speech_translate_bytes uses Whisper X->en for English targets;
+            # the NMT model is not preloaded unless team translation needs it).
+            "speech_pipeline": "two_model",
             "use_fallback": False,
             "show_same_language": True,
             "ui_language": "en",
@@ -1056,9 +1758,21 @@ def _default_config() -> dict:
         },
         "tts": {
             "enabled": False,
+            # default (fastest measured local engine first) | sapi | espeak | gtts
             "engine": "default",
             "rate": 1.0,
             "volume": 1.0,
+            # Play each sentence as soon as it is synthesized instead of
+            # synthesizing the whole callout first.
+            "streaming": True,
+            # Callouts still queued after max_queue_age_ms are dropped; queued
+            # short phrases (<= merge_max_chars together) arriving within
+            # merge_window_ms of each other are spoken as one utterance.
+            "max_queue_age_ms": 3000,
+            "merge_window_ms": 400,
+            "merge_max_chars": 60,
+            # Serve exact callouts from the bank built by scripts/build_voice_pack.py
+            "voice_pack": True,
         },
         "overlay": {
             "enabled": True,
@@ -1073,6 +1787,9 @@ def _default_config() -> dict:
             "show_same_language": True,
             "style_preset": "minimal",
             "position_preset": "bottom",
+            # Python overlay redraw interval; updates arriving within one
+            # interval are drawn together
+            "refresh_ms": 33,
         },
         "ui": {
             "theme": "dark",
@@ -1129,6 +1846,11 @@ async def save_config(config: dict):
     _runtime_config = merged
     _CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
     _CONFIG_PATH.write_text(json.dumps(merged, indent=2), encoding="utf-8")
+    _tts_service.set_engine(merged.get("tts", {}).get("engine", "default"))
+    _overlay.configure(merged.get("overlay", {}))
+    if translation_service is not None and _translation_model_needed():
+        # e.g. team translation switched on under the whisper_translate pipeline
+        translation_service.start_initialization()
     print(f"[CONFIG] Saved to {_CONFIG_PATH}", flush=True)
     return {"status": "success", "message": "Configuration saved"}
 
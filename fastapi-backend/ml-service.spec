@@ -57,6 +57,8 @@ hiddenimports = [
     'speaker_identification',
     'adaptive_learning',
     'app_paths',
+    'overlay_daemon',
+    'tkinter',
 ]
 
 a = Analysis(
@@ -68,7 +70,7 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=['matplotlib', 'tkinter', 'pytest'],
+    excludes=['matplotlib', 'pytest'],
     noarchive=False,
     optimize=0,
 )
@@ -0,0 +1,180 @@
+"""
+Backend side of the subtitle overlay: one overlay_daemon process per backend.
+
+The daemon is started on first use and fed JSON lines over its stdin pipe, so
+showing a subtitle costs a pipe write instead of a Python interpreter start
+and a Tk window per line. Frame reports coming back on the daemon's stdout
+give the send-to-screen latency of every command.
+"""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+OVERLAY_MODES = ("queue", "replace", "update")
+DAEMON_FLAG = "--overlay-daemon"
+_LATENCY_WINDOW = 500
+_READY_TIMEOUT_S = 5.0
+# A daemon that failed to open its window is not respawned for every subtitle
+_RESTART_BACKOFF_S = 5.0
+
+
+def daemon_command() -> List[str]:
+    """Command line for the overlay process (frozen builds re-enter main.py)."""
+    if getattr(sys, "frozen", False):
+        return [sys.executable, DAEMON_FLAG]
+    return [sys.executable, str(Path(__file__).resolve().parent / "overlay_daemon.py")]
+
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(pct * len(ordered)))], 2)
+
+
+class OverlayClient:
+
+    """Starts the overlay daemon once, restarts it if it dies, and feeds it commands."""
+
+    def __init__(self) -> None:
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._ids = 0
+        self.config: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+        self.starts = 0
+        self.startup_ms: Optional[float] = None
+        self._started_at = 0.0
+        self.frames = 0
+        self.commands = 0
+        self._latencies_ms: deque = deque(maxlen=_LATENCY_WINDOW)
+
+    @property
+    def running(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self.running:
+            return self._proc
+        if self.error and time.monotonic() - self._started_at < _RESTART_BACKOFF_S:
+            raise RuntimeError(self.error)
+        config = json.dumps(self.config)
+        self._ready.clear()
+        self.error = None
+        self._proc = subprocess.Popen(
+            daemon_command() + ["--config", config],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        self.starts += 1
+        self._started_at = time.monotonic()
+        if self.starts > 1:
+            print(f"[WARN] Overlay daemon exited; restarted (start #{self.starts})", flush=True)
+        threading.Thread(
+            target=self._read_events, args=(self._proc,), name="overlay-events", daemon=True
+        ).start()
+        return self._proc
+
+    def _read_events(self, proc: subprocess.Popen) -> None:
+        for raw in proc.stdout:
+            try:
+                event = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            kind = event.get("event")
+            if kind == "ready":
+                self.startup_ms = event.get("startup_ms")
+                self._ready.set()
+            elif kind == "frame":
+                self.frames += 1
+                self.commands += int(event.get("commands", 0))
+                self._latencies_ms.extend(event.get("latency_ms") or [])
+            elif kind == "error":
+                self.error = event.get("error")
+                print(f"[WARN] Overlay daemon: {self.error}", flush=True)
+        self._ready.set()
+
+    def send(self, op: str, text: str = "", line_id: Optional[str] = None, **fields: Any) -> str:
+        """
+        Queue one command for the next overlay frame.
+
+        Args:
+            op: "queue", "replace", "update", "clear" or "config"
+            line_id: line to edit for "update"; generated when omitted
+
+        Returns:
+            The line id the text is shown under
+        """
+        with self._lock:
+            if line_id is None:
+                self._ids += 1
+                line_id = f"ov-{self._ids}"
+            command = {"op": op, "text": text, "id": line_id, **fields}
+            for attempt in range(2):
+                proc = self._ensure_started()
+                command["sent_at"] = time.perf_counter()
+                try:
+                    proc.stdin.write(json.dumps(command) + "\n")
+                    proc.stdin.flush()
+                    break
+                except (BrokenPipeError, OSError, ValueError):
+                    proc.kill()
+                    if attempt:
+                        raise
+        return line_id
+
+    def show(self, text: str, mode: str = "queue", line_id: Optional[str] = None) -> str:
+        if mode not in OVERLAY_MODES:
+            raise ValueError(f"mode must be one of {', '.join(OVERLAY_MODES)}")
+        return self.send(mode, text, line_id)
+
+    def configure(self, config: Dict[str, Any]) -> None:
+        """Apply overlay config now if the daemon runs, else at its next start."""
+        self.config = dict(config)
+        if self.running:
+            self.send("config", line_id="", config=self.config)
+
+    def wait_ready(self, timeout: float = _READY_TIMEOUT_S) -> bool:
+        return self._ready.wait(timeout) and self.error is None and self.running
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = list(self._latencies_ms)
+        return {
+            "running": self.running,
+            "pid": self._proc.pid if self.running else None,
+            "starts": self.starts,
+            "startup_ms": self.startup_ms,
+            "error": self.error,
+            "frames": self.frames,
+            "commands": self.commands,
+            "commands_per_frame": round(self.commands / self.frames, 2) if self.frames else None,
+            "display_latency_ms": {
+                "p50": _percentile(latencies, 0.5),
+                "p95": _percentile(latencies, 0.95),
+                "max": round(max(latencies), 2) if latencies else None,
+            },
+        }
+
+    def stop(self) -> None:
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is None or proc.poll() is not None:
+            return
+        try:
+            proc.stdin.write(json.dumps({"op": "quit"}) + "\n")
+            proc.stdin.close()
+            proc.wait(timeout=2)
+        except Exception:
+            proc.kill()
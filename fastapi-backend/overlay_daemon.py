@@ -0,0 +1,195 @@
+"""
+Long-lived subtitle overlay process.
+
+Started once by the backend (overlay_client.OverlayClient) and fed
+newline-delimited JSON commands on stdin:
+
+    {"op": "queue",   "text": "...", "id": "l1", "sent_at": <perf_counter>}
+    {"op": "replace", "text": "...", "id": "l2", "sent_at": ...}   # drop other lines
+    {"op": "update",  "text": "...", "id": "l1", "sent_at": ...}   # edit line l1 in place
+    {"op": "clear"} | {"op": "config", "config": {...overlay config...}} | {"op": "quit"}
+
+Commands are applied on the Tk thread once per refresh interval, so a burst
+of partial-transcript updates costs one redraw. After each redraw a
+``{"event": "frame", ...}`` line on stdout reports how long every command
+took from ``sent_at`` to on screen. perf_counter is a system-wide monotonic
+clock on Windows, macOS and Linux, so the two processes can compare it.
+"""
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+DEFAULT_REFRESH_MS = 33
+_BOTTOM_MARGIN = 120
+_TOP_MARGIN = 60
+
+
+def _emit(event: Dict[str, Any]) -> None:
+    try:
+        sys.stdout.write(json.dumps(event) + "\n")
+        sys.stdout.flush()
+    except (BrokenPipeError, ValueError):
+        pass
+
+
+class OverlayDaemon:
+
+    """Tk overlay window driven by a command inbox filled from stdin."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
+        import tkinter as tk
+
+        self._tk = tk
+        self.root = tk.Tk()
+        self.root.withdraw()
+        self.root.overrideredirect(True)
+        self.root.attributes("-topmost", True)
+        self.label = tk.Label(self.root, justify="center", padx=16, pady=8)
+        self.label.pack()
+        self.config: Dict[str, Any] = {}
+        self.refresh_ms = DEFAULT_REFRESH_MS
+        self._inbox: Deque[Dict[str, Any]] = deque()
+        # Shown lines, oldest first: {"id", "text", "expires_at"}
+        self._lines: List[Dict[str, Any]] = []
+        self._visible = False
+        self.apply_config(config or {})
+
+    def apply_config(self, config: Dict[str, Any]) -> None:
+        self.config.update(config)
+        cfg = self.config
+        self.refresh_ms = max(5, int(cfg.get("refresh_ms", DEFAULT_REFRESH_MS)))
+        self.label.configure(
+            font=("Segoe UI", int(cfg.get("font_size", 24)), "bold"),
+            fg=cfg.get("text_color", "#FFFFFF"),
+            bg=cfg.get("background_color", "#000000"),
+            wraplength=int(cfg.get("max_width", 800)),
+        )
+        self.root.configure(bg=cfg.get("background_color", "#000000"))
+        try:
+            self.root.attributes("-alpha", float(cfg.get("opacity", 0.85)))
+        except self._tk.TclError:
+            pass
+
+    def _read_stdin(self) -> None:
+        for raw in sys.stdin:
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                self._inbox.append(json.loads(raw))
+            except json.JSONDecodeError as e:
+                _emit({"event": "error", "error": f"bad command: {e}"})
+        # Backend went away: exit instead of leaving an orphaned window
+        self._inbox.append({"op": "quit"})
+
+    def _apply(self, command: Dict[str, Any], now: float) -> bool:
+        """Apply one command to the line model; False on quit."""
+        op = command.get("op")
+        hold_s = float(self.config.get("fade_duration", 5.0))
+        text = (command.get("text") or "").strip()
+        line_id = command.get("id")
+        if op == "quit":
+            return False
+        if op == "clear":
+            self._lines = []
+        elif op == "config":
+            self.apply_config(command.get("config") or {})
+        elif op == "replace":
+            self._lines = [{"id": line_id, "text": text, "expires_at": now + hold_s}] if text else []
+        elif op in ("queue", "update") and text:
+            existing = next((line for line in self._lines if line_id and line["id"] == line_id), None)
+            if op == "update" and existing is not None:
+                existing["text"] = text
+                existing["expires_at"] = now + hold_s
+            else:
+                self._lines.append({"id": line_id, "text": text, "expires_at": now + hold_s})
+        max_lines = max(1, int(self.config.get("max_lines", 3)))
+        del self._lines[:-max_lines]
+        return True
+
+    def _place(self) -> None:
+        self.root.update_idletasks()
+        width, height = self.root.winfo_reqwidth(), self.root.winfo_reqheight()
+        preset = self.config.get("position_preset", "bottom")
+        if preset in ("bottom", "top"):
+            x = (self.root.winfo_screenwidth() - width) // 2
+            y = (
+                self.root.winfo_screenheight() - height - _BOTTOM_MARGIN
+                if preset == "bottom"
+                else _TOP_MARGIN
+            )
+        else:
+            x, y = int(self.config.get("position_x", 100)), int(self.config.get("position_y", 100))
+        self.root.geometry(f"+{x}+{y}")
+
+    def _redraw(self) -> None:
+        if not self._lines:
+            if self._visible:
+                self.root.withdraw()
+                self._visible = False
+            return
+        self.label.configure(text="\n".join(line["text"] for line in self._lines))
+        self._place()
+        if not self._visible:
+            self.root.deiconify()
+            self.root.attributes("-topmost", True)
+            self._visible = True
+        self.root.update_idletasks()
+
+    def _tick(self) -> None:
+        now = time.perf_counter()
+        applied: List[Dict[str, Any]] = []
+        dirty = False
+        while self._inbox:
+            command = self._inbox.popleft()
+            if not self._apply(command, now):
+                self.root.destroy()
+                return
+            applied.append(command)
+            dirty = True
+        before = len(self._lines)
+        self._lines = [line for line in self._lines if line["expires_at"] > now]
+        dirty = dirty or len(self._lines) != before
+        if dirty:
+            self._redraw()
+        if applied:
+            drawn_at = time.perf_counter()
+            _emit({
+                "event": "frame",
+                "commands": len(applied),
+                "lines": len(self._lines),
+                "latency_ms": [
+                    round((drawn_at - float(c["sent_at"])) * 1000.0, 2) for c in applied if "sent_at" in c
+                ],
+            })
+        self.root.after(self.refresh_ms, self._tick)
+
+    def run(self) -> None:
+        threading.Thread(target=self._read_stdin, name="overlay-stdin", daemon=True).start()
+        self.root.after(0, self._tick)
+        self.root.mainloop()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    start = time.perf_counter()
+    argv = sys.argv[1:] if argv is None else argv
+    config: Dict[str, Any] = {}
+    if "--config" in argv:
+        config = json.loads(argv[argv.index("--config") + 1])
+    try:
+        daemon = OverlayDaemon(config)
+    except Exception as e:
+        _emit({"event": "error", "error": f"overlay window unavailable: {e}"})
+        return 1
+    _emit({"event": "ready", "startup_ms": round((time.perf_counter() - start) * 1000.0, 1)})
+    daemon.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
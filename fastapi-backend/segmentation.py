@@ -0,0 +1,84 @@
+"""
+Sentence and clause segmentation for long transcripts.
+
+MarianMT decodes one long sequence superlinearly slower than several short
+ones and silently truncates input past 512 tokens. A 30 s Whisper chunk or a
+streamer's monologue is therefore split into sentences, and sentences that
+are still too long into clauses (then words), before translation; the
+segments are translated as one padded batch and joined back in order.
+Consecutive sentences are packed back together up to the segment limit, so
+short input ("Rush B. Go!") stays one segment and keeps its context.
+"""
+from __future__ import annotations
+
+import re
+from typing import List
+
+# Roughly 60-80 SentencePiece tokens for Latin-script text; keeps every
+# segment far below the 512-token input limit and in the fast decode regime.
+DEFAULT_MAX_SEGMENT_CHARS = 200
+
+# Sentence end: terminal punctuation (plus closing quotes/brackets) followed
+# by whitespace, or CJK full-width terminals which need no whitespace.
+_SENTENCE_END_RE = re.compile(r"(?:(?<=[.!?…])|(?<=[.!?…][\"'»)\]]))\s+|(?<=[。！？])")
+_CLAUSE_END_RE = re.compile(r"(?<=[,;:，；：—])\s*")
+
+# Targets written without spaces between sentences
+_UNSPACED_LANGUAGES = frozenset({"zh", "ja", "th"})
+
+
+def _split_keep(text: str, pattern: re.Pattern) -> List[str]:
+    return [part.strip() for part in pattern.split(text) if part and part.strip()]
+
+
+def _pack(parts: List[str], max_chars: int, joiner: str = " ") -> List[str]:
+    """Greedily merge consecutive parts while they fit in ``max_chars``."""
+    packed: List[str] = []
+    for part in parts:
+        if packed and len(packed[-1]) + len(joiner) + len(part) <= max_chars:
+            packed[-1] = f"{packed[-1]}{joiner}{part}"
+        else:
+            packed.append(part)
+    return packed
+
+
+def _split_long(sentence: str, max_chars: int) -> List[str]:
+    if len(sentence) <= max_chars:
+        return [sentence]
+    pieces: List[str] = []
+    for clause in _pack(_split_keep(sentence, _CLAUSE_END_RE), max_chars):
+        if len(clause) <= max_chars:
+            pieces.append(clause)
+            continue
+        # Run-on clause (Whisper often drops punctuation): cut at word boundaries
+        words = clause.split()
+        if len(words) > 1:
+            pieces.extend(_pack(words, max_chars))
+        else:
+            pieces.extend(clause[i:i + max_chars] for i in range(0, len(clause), max_chars))
+    return pieces
+
+
+def split_segments(text: str, max_chars: int = DEFAULT_MAX_SEGMENT_CHARS) -> List[str]:
+    """
+    Split ``text`` into translation segments, in order.
+
+    Text within ``max_chars`` is returned whole. Longer text is split into
+    sentences, sentences longer than ``max_chars`` are cut at clause
+    punctuation, then at word boundaries, and consecutive pieces are merged
+    again while they fit.
+    """
+    text = (text or "").strip()
+    if not text:
+        return []
+    if len(text) <= max_chars:
+        return [text]
+    pieces: List[str] = []
+    for sentence in _split_keep(text, _SENTENCE_END_RE):
+        pieces.extend(_split_long(sentence, max_chars))
+    return _pack(pieces, max_chars)
+
+
+def join_segments(segments: List[str], target_language: str) -> str:
+    joiner = "" if (target_language or "").split("-")[0] in _UNSPACED_LANGUAGES else " "
+    return joiner.join(s.strip() for s in segments if s and s.strip())
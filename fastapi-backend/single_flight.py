@@ -0,0 +1,65 @@
+"""
+Single-flight deduplication for identical in-flight work.
+
+The first caller for a key runs the function; callers that arrive with the
+same key while it is still running wait on the same future and get the same
+result (or exception) instead of running the model again.
+"""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+
+    """Collapse concurrent calls that share a key into one execution."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, Future] = {}
+        self.executed = 0
+        self.deduplicated = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run ``fn`` once per concurrent ``key``.
+
+        Returns:
+            (result, shared) where ``shared`` is True when this caller waited
+            on another caller's execution.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.deduplicated += 1
+                leader = False
+            else:
+                future = Future()
+                self._inflight[key] = future
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            return future.result(), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "executed": self.executed,
+                "duplicates_avoided": self.deduplicated,
+                "in_flight": len(self._inflight),
+            }
@@ -0,0 +1,214 @@
+"""
+Speculative translation of partial transcripts.
+
+While a speaker is still talking the client keeps sending growing partial
+transcripts for the same utterance (session). The words that two consecutive
+partials agree on form the stable prefix (LocalAgreement-2); whenever it grows
+it is translated in the background, so MT runs while ASR is still listening.
+
+When the final transcript arrives the speculation is
+
+- accepted: the final equals the speculated source, the translation is ready
+  (or nearly so) and is returned as is;
+- patched: the final extends the speculated source, the final is translated
+  with the speculative decoder output (minus its last, least stable word)
+  forced as the decoder prefix, so only the tail is decoded. Only raw text
+  the model decoded in one pass is forced; a speculation served by a cache,
+  callout, learned preference, fallback or the API is translated afresh;
+- discarded: the final diverges, it is translated from scratch.
+
+Partials are compared word by word on their normalized form (case and
+punctuation ignored), but the speculation translates the speaker's own words,
+and a final is only accepted when it matches them exactly; a final that
+differs only in case or punctuation is patched instead.
+
+MarianMT's encoder is bidirectional, so encoder states for a prefix change
+once words are appended and cannot be reused for the final text; reuse
+happens on the decoder side through the forced prefix instead.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from translation_memory import normalize_source
+
+SESSION_TTL_S = 30.0
+MIN_STABLE_WORDS = 2
+
+
+class _Session:
+
+    __slots__ = ("previous_words", "speculated_words", "speculated_tokens", "future", "touched_at", "partials")
+
+    def __init__(self) -> None:
+        self.partials = 0
+        self.previous_words: List[str] = []
+        self.speculated_words: List[str] = []
+        # Original-cased tokens behind speculated_words, as sent to the model
+        self.speculated_tokens: List[str] = []
+        self.future: Optional[Future] = None
+        self.touched_at = time.monotonic()
+
+
+def _tokenize(text: str) -> Tuple[List[str], List[str]]:
+    """
+    Split a transcript into its original tokens and their normalized forms.
+
+    Tokens that normalize to nothing (stray punctuation) are dropped, so the
+    two lists stay aligned.
+    """
+    tokens: List[str] = []
+    words: List[str] = []
+    for token in (text or "").split():
+        word = normalize_source(token)
+        if word:
+            tokens.append(token)
+            words.append(word)
+    return tokens, words
+
+
+def _common_prefix(a: List[str], b: List[str]) -> List[str]:
+    n = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        n += 1
+    return a[:n]
+
+
+class SpeculativeTranslator:
+
+    """Per-session stable-prefix speculation on top of TranslationService."""
+
+    def __init__(self, min_stable_words: int = MIN_STABLE_WORDS, session_ttl_s: float = SESSION_TTL_S) -> None:
+        self.min_stable_words = min_stable_words
+        self.session_ttl_s = session_ttl_s
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, _Session] = {}
+        # One worker: speculation should overlap ASR, not compete with finals
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="speculative-mt")
+        self.stats = {
+            "partials": 0,
+            "speculations": 0,
+            "finals": 0,
+            "accepted": 0,
+            "patched": 0,
+            "discarded": 0,
+            "unspeculated": 0,
+        }
+
+    def _session(self, session_id: str) -> _Session:
+        now = time.monotonic()
+        expired = [k for k, s in self._sessions.items() if now - s.touched_at > self.session_ttl_s]
+        for key in expired:
+            future = self._sessions.pop(key).future
+            if future is not None:
+                future.cancel()
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = _Session()
+            self._sessions[session_id] = session
+        session.touched_at = now
+        return session
+
+    def partial(
+        self,
+        service: Any,
+        session_id: str,
+        text: str,
+        source_language: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Record a partial transcript; starts a background translation when the
+        stable prefix grew by at least ``min_stable_words``.
+        """
+        tokens, words = _tokenize(text)
+        with self._lock:
+            self.stats["partials"] += 1
+            session = self._session(session_id)
+            session.partials += 1
+            stable = _common_prefix(session.previous_words, words)
+            session.previous_words = words
+            extends = stable[: len(session.speculated_words)] == session.speculated_words
+            grown = len(stable) - len(session.speculated_words)
+            grew = len(stable) >= self.min_stable_words and (
+                not extends or grown >= self.min_stable_words
+            )
+            if grew:
+                session.speculated_words = list(stable)
+                session.speculated_tokens = tokens[: len(stable)]
+                # A superseded speculation still queued would only delay the new one
+                if session.future is not None:
+                    session.future.cancel()
+                session.future = self._executor.submit(
+                    service.translate, " ".join(session.speculated_tokens), source_language
+                )
+                self.stats["speculations"] += 1
+            return {
+                "status": "speculating" if session.future is not None else "listening",
+                "stable_prefix": " ".join(tokens[: len(stable)]),
+                "speculated_source": " ".join(session.speculated_tokens),
+                "partials": session.partials,  # 1 on the utterance's first partial
+            }
+
+    def final(
+        self,
+        service: Any,
+        session_id: str,
+        text: str,
+        source_language: Optional[str] = None,
+        timeout_s: float = 5.0,
+    ) -> Dict[str, Any]:
+        """Translate the final transcript, reusing the session's speculation."""
+        tokens, words = _tokenize(text)
+        with self._lock:
+            self.stats["finals"] += 1
+            session = self._sessions.pop(session_id, None)
+
+        outcome = "unspeculated"
+        speculative: Optional[Dict[str, Any]] = None
+        if session is not None and session.future is not None:
+            try:
+                speculative = session.future.result(timeout=timeout_s)
+            except Exception:
+                speculative = None
+            spec_words = session.speculated_words
+            if speculative is None or speculative.get("status") == "warming":
+                outcome = "discarded"
+            elif tokens == session.speculated_tokens:
+                outcome = "accepted"
+            elif words[: len(spec_words)] == spec_words and speculative.get("model_output"):
+                outcome = "patched"
+            else:
+                outcome = "discarded"
+
+        if outcome == "accepted":
+            result = dict(speculative)
+        elif outcome == "patched":
+            # Drop the last speculative word: it is the one most likely to change
+            spec_output = speculative["model_output"].split()[:-1]
+            result = dict(
+                service.translate(text, source_language, target_prefix=" ".join(spec_output) or None)
+            )
+        else:
+            result = dict(service.translate(text, source_language))
+
+        with self._lock:
+            self.stats[outcome] += 1
+        result.pop("model_output", None)
+        result["speculation"] = outcome
+        return result
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            resolved = stats["accepted"] + stats["patched"] + stats["discarded"]
+            stats["acceptance_rate"] = round(stats["accepted"] / resolved, 4) if resolved else 0.0
+            stats["reuse_rate"] = (
+                round((stats["accepted"] + stats["patched"]) / resolved, 4) if resolved else 0.0
+            )
+            stats["active_sessions"] = len(self._sessions)
+            return stats
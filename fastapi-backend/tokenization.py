@@ -0,0 +1,117 @@
+"""
+Tokenizer loading and per-model token-id caching for the local translation path.
+
+Short callouts repeat constantly, so encoding the same text again through
+SentencePiece and building fresh input tensors is wasted work. Each loaded
+model entry gets a TokenIdCache that keeps ready-to-use ``input_ids`` tensors
+(already on the model device) for recently seen texts, plus one preallocated
+all-ones attention mask that is sliced per request instead of reallocated.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_CACHE_SIZE = 2048
+MAX_INPUT_TOKENS = 512
+
+
+def load_tokenizer(model_id: str, cache_dir: Optional[str] = None) -> Any:
+    """
+    Rust-backed fast tokenizer when the model has one, else the slow one.
+
+    Marian (opus-mt) models currently only ship a SentencePiece slow
+    tokenizer, so for those AutoTokenizer returns MarianTokenizer and the
+    token-id cache below does the heavy lifting.
+    """
+    from transformers import AutoTokenizer
+
+    try:
+        return AutoTokenizer.from_pretrained(model_id, cache_dir=cache_dir, use_fast=True)
+    except Exception:
+        from transformers import MarianTokenizer
+
+        return MarianTokenizer.from_pretrained(model_id, cache_dir=cache_dir)
+
+
+class TokenIdCache:
+
+    """LRU of text -> input_ids tensor for one tokenizer/device pair."""
+
+    def __init__(self, tokenizer: Any, device: str = "cpu", max_entries: int = DEFAULT_CACHE_SIZE) -> None:
+        self.tokenizer = tokenizer
+        self.device = device
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._ids: "OrderedDict[str, Any]" = OrderedDict()
+        self._attention_mask = None
+        self.hits = 0
+        self.misses = 0
+
+    def _mask(self, length: int) -> Any:
+        import torch
+
+        if self._attention_mask is None:
+            self._attention_mask = torch.ones(
+                (1, MAX_INPUT_TOKENS), dtype=torch.long, device=self.device
+            )
+        # Read-only view; generate() never writes to its inputs
+        return self._attention_mask[:, :length]
+
+    def encode(self, text: str) -> list:
+        """Token ids for ``text`` (truncated to MAX_INPUT_TOKENS)."""
+        return self.tokenizer.encode(text, truncation=True, max_length=MAX_INPUT_TOKENS)
+
+    def inputs(self, text: str) -> Tuple[Dict[str, Any], int]:
+        """
+        Model inputs for ``text`` on this cache's device.
+
+        Returns:
+            ({'input_ids', 'attention_mask'}, number of input tokens)
+        """
+        import torch
+
+        with self._lock:
+            input_ids = self._ids.get(text)
+            if input_ids is not None:
+                self._ids.move_to_end(text)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if input_ids is None:
+            ids = self.encode(text)
+            input_ids = torch.tensor([ids], dtype=torch.long, device=self.device)
+            with self._lock:
+                self._ids[text] = input_ids
+                while len(self._ids) > self.max_entries:
+                    self._ids.popitem(last=False)
+        length = int(input_ids.shape[-1])
+        return {"input_ids": input_ids, "attention_mask": self._mask(length)}, length
+
+    def ids(self, text: str) -> list:
+        """Plain token-id list (CTranslate2 path); cached the same way."""
+        with self._lock:
+            ids = self._ids.get(text)
+            if ids is not None:
+                self._ids.move_to_end(text)
+                self.hits += 1
+                return ids
+            self.misses += 1
+        ids = self.encode(text)
+        with self._lock:
+            self._ids[text] = ids
+            while len(self._ids) > self.max_entries:
+                self._ids.popitem(last=False)
+        return ids
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._ids),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "fast_tokenizer": bool(getattr(self.tokenizer, "is_fast", False)),
+            }
@@ -0,0 +1,300 @@
+"""
+Fuzzy translation memory for near-duplicate transcripts.
+
+Whisper rarely produces the same string twice for the same spoken callout
+("rush b", "Rush B!", "rush b."), so the exact-key cache misses. This index
+keeps character trigram sets of previously translated sources per language
+pair and answers "was something similar enough already translated?" without
+running the NMT model.
+
+Lookups use the usual set-similarity join tricks instead of scanning every
+entry: a length filter on the candidate gram count and prefix filtering,
+where only the rarest query grams are used to generate candidates before the
+exact Dice coefficient is computed. ``scripts/benchmark_translation.py memory``
+reports index size and lookup latency at 10k/100k entries.
+
+A high trigram score alone is not enough on longer sentences ("the team is
+not pushing" vs "the team is pushing"), so a match must also keep the same
+guard words (negations, directions, numbers, single letters) and differ from
+the query by at most ``max_word_changes`` words beyond spelling variants.
+"""
+from __future__ import annotations
+
+import math
+import re
+import sys
+import threading
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+NGRAM = 3
+DEFAULT_THRESHOLD = 0.9
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_MAX_WORD_CHANGES = 1
+# Two different words this similar are the same word spelled differently
+_SPELLING_RATIO = 0.8
+
+# Words that flip or redirect a callout; a match must contain the same ones
+_GUARD_WORDS = frozenset("""
+    not no dont don't never nothing nobody none cant can't wont won't isnt
+    left right up down top bottom front back inside outside upper lower
+    no nunca nada nadie izquierda derecha arriba abajo dentro fuera
+    pas ne jamais rien personne gauche droite haut bas
+    nicht kein keine nie niemand links rechts oben unten
+    não nao nunca esquerda direita cima baixo
+    не нет никогда никто ничего лево левый право правый верх низ
+""".split())
+
+_PUNCT_RE = re.compile(r"[^\w\s]+", re.UNICODE)
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_source(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    text = _PUNCT_RE.sub(" ", (text or "").lower())
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def char_ngrams(text: str, n: int = NGRAM) -> FrozenSet[str]:
+    padded = f"{' ' * (n - 1)}{text}{' ' * (n - 1)}"
+    # Interned so 100k entries share one string object per distinct gram
+    return frozenset(sys.intern(padded[i:i + n]) for i in range(len(padded) - n + 1))
+
+
+def guard_tokens(text: str) -> Tuple[str, ...]:
+    """
+    Tokens that must match exactly: numbers, one-letter tokens, negations
+    and direction words.
+
+    "rush a" / "rush b", "2 mid" / "3 mid" or "on the left side" / "on the
+    right side" are a few characters apart but mean different things, so
+    they are never treated as near-duplicates.
+    """
+    return tuple(t for t in text.split() if len(t) == 1 or t.isdigit() or t in _GUARD_WORDS)
+
+
+def word_changes(a: Tuple[str, ...], b: Tuple[str, ...]) -> int:
+    """
+    Words added, removed or replaced between ``a`` and ``b``, not counting
+    words that only differ in spelling ("pushin" / "pushing").
+    """
+    unmatched_b = list(b)
+    unmatched_a = []
+    for word in a:
+        if word in unmatched_b:
+            unmatched_b.remove(word)
+        else:
+            unmatched_a.append(word)
+    changes = 0
+    for word in unmatched_a:
+        variant = next(
+            (
+                other for other in unmatched_b
+                if SequenceMatcher(None, word, other).ratio() >= _SPELLING_RATIO
+            ),
+            None,
+        )
+        if variant is None:
+            changes += 1
+        else:
+            unmatched_b.remove(variant)
+    # A replaced word counts once, not once per side
+    return max(changes, len(unmatched_b))
+
+
+def dice(a: FrozenSet[str], b: Iterable[str], b_size: int) -> float:
+    """Dice coefficient of gram set ``a`` and ``b_size`` distinct grams ``b``."""
+    if not a or not b_size:
+        return 0.0
+    return 2.0 * len(a.intersection(b)) / (len(a) + b_size)
+
+
+class _Entry:
+
+    __slots__ = ("source", "words", "grams", "guards", "result")
+
+    def __init__(self, source: str, grams: Tuple[str, ...], guards: Tuple[str, ...], result: Dict[str, Any]):
+        self.source = source
+        self.words = tuple(source.split())
+        # A tuple is a quarter the size of a frozenset and intersection()
+        # accepts any iterable, so stored entries keep grams as tuples.
+        self.grams = grams
+        self.guards = guards
+        self.result = result
+
+
+class FuzzyTranslationMemory:
+
+    """Approximate lookup over cached translations, partitioned by language pair."""
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        language_thresholds: Optional[Dict[str, float]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        min_chars: int = 4,
+        max_word_changes: int = DEFAULT_MAX_WORD_CHANGES,
+    ) -> None:
+        self.threshold = threshold
+        self.max_word_changes = max(0, int(max_word_changes))
+        self.language_thresholds = dict(language_thresholds or {})
+        self.max_entries = max(1, int(max_entries))
+        self.min_chars = min_chars
+        self._lock = threading.Lock()
+        self._next_id = 0
+        # id -> (pair, entry), oldest first for eviction
+        self._entries: "OrderedDict[int, Tuple[Tuple[str, str], _Entry]]" = OrderedDict()
+        self._by_source: Dict[Tuple[Tuple[str, str], str], int] = {}
+        # pair -> gram -> gram-set size -> entry ids; bucketing by size lets the
+        # length filter skip whole buckets instead of testing every candidate
+        self._postings: Dict[Tuple[str, str], Dict[str, Dict[int, Set[int]]]] = {}
+        self.lookups = 0
+        self.hits = 0
+
+    def threshold_for(self, source_language: Optional[str]) -> float:
+        return float(self.language_thresholds.get(source_language or "", self.threshold))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(
+        self,
+        source: str,
+        source_language: Optional[str],
+        target_language: str,
+        result: Dict[str, Any],
+    ) -> None:
+        key = normalize_source(source)
+        if len(key) < self.min_chars:
+            return
+        pair = (source_language or "unknown", target_language)
+        with self._lock:
+            existing = self._by_source.get((pair, key))
+            if existing is not None:
+                self._entries[existing][1].result = result
+                self._entries.move_to_end(existing)
+                return
+            entry_id = self._next_id
+            self._next_id += 1
+            entry = _Entry(key, tuple(char_ngrams(key)), guard_tokens(key), result)
+            self._entries[entry_id] = (pair, entry)
+            self._by_source[(pair, key)] = entry_id
+            postings = self._postings.setdefault(pair, {})
+            size = len(entry.grams)
+            for gram in entry.grams:
+                postings.setdefault(gram, {}).setdefault(size, set()).add(entry_id)
+            while len(self._entries) > self.max_entries:
+                self._evict_oldest_locked()
+
+    def discard(self, source: str, source_language: Optional[str], target_language: str) -> bool:
+        """Forget the entry for exactly this source text; True if one existed."""
+        pair = (source_language or "unknown", target_language)
+        with self._lock:
+            entry_id = self._by_source.get((pair, normalize_source(source)))
+            if entry_id is None:
+                return False
+            self._remove_locked(entry_id, *self._entries.pop(entry_id))
+            return True
+
+    def _evict_oldest_locked(self) -> None:
+        entry_id, (pair, entry) = self._entries.popitem(last=False)
+        self._remove_locked(entry_id, pair, entry)
+
+    def _remove_locked(self, entry_id: int, pair: Tuple[str, str], entry: _Entry) -> None:
+        self._by_source.pop((pair, entry.source), None)
+        postings = self._postings.get(pair, {})
+        size = len(entry.grams)
+        for gram in entry.grams:
+            buckets = postings.get(gram)
+            if buckets is None:
+                continue
+            ids = buckets.get(size)
+            if ids is not None:
+                ids.discard(entry_id)
+                if not ids:
+                    del buckets[size]
+            if not buckets:
+                del postings[gram]
+
+    def lookup(
+        self,
+        source: str,
+        source_language: Optional[str],
+        target_language: str,
+    ) -> Optional[Tuple[Dict[str, Any], float, str]]:
+        """
+        Best cached translation with Dice similarity >= the language threshold,
+        the same guard tokens and at most ``max_word_changes`` changed words.
+
+        Returns:
+            (cached result, similarity, matched normalized source) or None
+        """
+        key = normalize_source(source)
+        if len(key) < self.min_chars:
+            return None
+        threshold = self.threshold_for(source_language)
+        grams = char_ngrams(key)
+        guards = guard_tokens(key)
+        words = tuple(key.split())
+        pair = (source_language or "unknown", target_language)
+
+        with self._lock:
+            self.lookups += 1
+            postings = self._postings.get(pair)
+            if not postings:
+                return None
+
+            # Any match shares at least t*|A|/(2-t) grams with the query, so the
+            # |A| - min_overlap + 1 rarest query grams must contain one of them.
+            size = len(grams)
+            # That bound is also the smallest gram count a match can have.
+            min_overlap = int(math.ceil(threshold * size / (2.0 - threshold)))
+            max_len = int(size * (2.0 - threshold) / threshold)
+            sizes = range(min_overlap, max_len + 1)
+
+            def gram_buckets(gram: str) -> List[Set[int]]:
+                buckets = postings.get(gram)
+                if not buckets:
+                    return []
+                return [buckets[n] for n in sizes if n in buckets]
+
+            by_gram = [(gram, gram_buckets(gram)) for gram in grams]
+            by_gram.sort(key=lambda item: sum(len(ids) for ids in item[1]))
+            candidates: Set[int] = set()
+            for _gram, buckets in by_gram[: size - min_overlap + 1]:
+                candidates.update(*buckets)
+
+            best: Optional[Tuple[_Entry, float]] = None
+            for entry_id in candidates:
+                entry = self._entries[entry_id][1]
+                if entry.guards != guards:
+                    continue
+                score = dice(grams, entry.grams, len(entry.grams))
+                if score < threshold or (best is not None and score <= best[1]):
+                    continue
+                if word_changes(words, entry.words) > self.max_word_changes:
+                    continue
+                best = (entry, score)
+            if best is None:
+                return None
+            self.hits += 1
+            return best[0].result, round(best[1], 4), best[0].source
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_source.clear()
+            self._postings.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "hit_rate": round(self.hits / self.lookups, 4) if self.lookups else 0.0,
+                "threshold": self.threshold,
+                "max_word_changes": self.max_word_changes,
+                "language_thresholds": dict(self.language_thresholds),
+            }
@@ -0,0 +1,442 @@
+"""
+Pair-specific MarianMT routing for the transformers translation backend.
+
+Whisper already reports the source language, so a dedicated
+``opus-mt-{src}-{tgt}`` model can be used instead of the slower many-to-one
+``opus-mt-mul-{tgt}``. Pair models load lazily on a background thread and are
+evicted least-recently-used first once the loaded set exceeds a memory cap.
+A model the hub does not have is skipped for good; any other load failure
+(download interrupted, disk full) is retried after a growing backoff.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Many-to-one fallback per target language (what the service used to always load).
+MULTI_SOURCE_MODELS: Dict[str, str] = {
+    "en": "Helsinki-NLP/opus-mt-mul-en",
+    "es": "Helsinki-NLP/opus-mt-mul-es",
+    "fr": "Helsinki-NLP/opus-mt-mul-fr",
+    "de": "Helsinki-NLP/opus-mt-mul-de",
+    "ru": "Helsinki-NLP/opus-mt-mul-ru",
+    "zh": "Helsinki-NLP/opus-mt-mul-zh",
+    "ja": "Helsinki-NLP/opus-mt-mul-ja",
+    "ko": "Helsinki-NLP/opus-mt-mul-ko",
+    "pt": "Helsinki-NLP/opus-mt-mul-pt",
+    "it": "Helsinki-NLP/opus-mt-mul-it",
+    "ar": "Helsinki-NLP/opus-mt-mul-ar",
+    "hi": "Helsinki-NLP/opus-mt-mul-hi",
+    "tr": "Helsinki-NLP/opus-mt-mul-tr",
+    "pl": "Helsinki-NLP/opus-mt-mul-pl",
+    "uk": "Helsinki-NLP/opus-mt-mul-uk",
+}
+
+# (source, target) -> dedicated pair models, smallest first. Base opus-mt models
+# are ~75M parameters; tc-big variants (~230M) are listed only where no base
+# model is published.
+PAIR_MODELS: Dict[Tuple[str, str], List[str]] = {
+    ("es", "en"): ["Helsinki-NLP/opus-mt-es-en"],
+    ("fr", "en"): ["Helsinki-NLP/opus-mt-fr-en"],
+    ("de", "en"): ["Helsinki-NLP/opus-mt-de-en"],
+    ("ru", "en"): ["Helsinki-NLP/opus-mt-ru-en"],
+    ("zh", "en"): ["Helsinki-NLP/opus-mt-zh-en"],
+    ("ja", "en"): ["Helsinki-NLP/opus-mt-ja-en"],
+    ("ko", "en"): ["Helsinki-NLP/opus-mt-ko-en"],
+    ("it", "en"): ["Helsinki-NLP/opus-mt-it-en"],
+    ("ar", "en"): ["Helsinki-NLP/opus-mt-ar-en"],
+    ("hi", "en"): ["Helsinki-NLP/opus-mt-hi-en"],
+    ("tr", "en"): ["Helsinki-NLP/opus-mt-tr-en"],
+    ("pl", "en"): ["Helsinki-NLP/opus-mt-pl-en"],
+    ("uk", "en"): ["Helsinki-NLP/opus-mt-uk-en"],
+    ("en", "es"): ["Helsinki-NLP/opus-mt-en-es"],
+    ("en", "fr"): ["Helsinki-NLP/opus-mt-en-fr"],
+    ("en", "de"): ["Helsinki-NLP/opus-mt-en-de"],
+    ("en", "ru"): ["Helsinki-NLP/opus-mt-en-ru"],
+    ("en", "zh"): ["Helsinki-NLP/opus-mt-en-zh"],
+    ("en", "it"): ["Helsinki-NLP/opus-mt-en-it"],
+    ("en", "ar"): ["Helsinki-NLP/opus-mt-en-ar"],
+    ("en", "hi"): ["Helsinki-NLP/opus-mt-en-hi"],
+    ("en", "uk"): ["Helsinki-NLP/opus-mt-en-uk"],
+    ("en", "ko"): ["Helsinki-NLP/opus-mt-tc-big-en-ko"],
+    ("en", "pt"): ["Helsinki-NLP/opus-mt-tc-big-en-pt"],
+    ("en", "tr"): ["Helsinki-NLP/opus-mt-tc-big-en-tr"],
+    ("es", "fr"): ["Helsinki-NLP/opus-mt-es-fr"],
+    ("es", "de"): ["Helsinki-NLP/opus-mt-es-de"],
+    ("es", "ru"): ["Helsinki-NLP/opus-mt-es-ru"],
+    ("fr", "es"): ["Helsinki-NLP/opus-mt-fr-es"],
+    ("fr", "de"): ["Helsinki-NLP/opus-mt-fr-de"],
+    ("de", "es"): ["Helsinki-NLP/opus-mt-de-es"],
+    ("de", "fr"): ["Helsinki-NLP/opus-mt-de-fr"],
+    ("ru", "es"): ["Helsinki-NLP/opus-mt-ru-es"],
+    ("ru", "fr"): ["Helsinki-NLP/opus-mt-ru-fr"],
+}
+
+_LATENCY_WINDOW = 256
+# Backoff before retrying a model whose load failed for a transient reason
+_RETRY_BACKOFF_S = 30.0
+_MAX_RETRY_BACKOFF_S = 600.0
+
+
+def _normalize_code(language: Optional[str]) -> Optional[str]:
+    code = (language or "").strip().lower()
+    if not code or code in ("auto", "unknown"):
+        return None
+    return code.split("-")[0]
+
+
+def multi_source_model(target_language: str) -> str:
+    return MULTI_SOURCE_MODELS.get(
+        _normalize_code(target_language) or "en", MULTI_SOURCE_MODELS["en"]
+    )
+
+
+def candidate_models(
+    source_language: Optional[str], target_language: str
+) -> List[str]:
+    """Pair models for (source, target) smallest first, then the mul fallback."""
+    src = _normalize_code(source_language)
+    tgt = _normalize_code(target_language) or "en"
+    candidates: List[str] = []
+    if src and src != tgt:
+        candidates.extend(PAIR_MODELS.get((src, tgt), []))
+    candidates.append(multi_source_model(tgt))
+    return candidates
+
+
+def _model_missing(error: BaseException) -> bool:
+    """True when the failure says the model id does not exist (retrying cannot help)."""
+    seen: Optional[BaseException] = error
+    for _ in range(5):
+        if seen is None:
+            break
+        if type(seen).__name__ in ("RepositoryNotFoundError", "RevisionNotFoundError"):
+            return True
+        message = str(seen)
+        if "is not a valid model identifier" in message or "does not appear to have a file named" in message:
+            return True
+        seen = seen.__cause__ or seen.__context__
+    return False
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+class _PairStats:
+    """Rolling latency plus outcome counters for one (source, target) pair."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.latencies_ms: deque = deque(maxlen=_LATENCY_WINDOW)
+        self.models: Dict[str, int] = {}
+        self.outcomes: Dict[str, int] = {}
+
+    def as_dict(self) -> Dict[str, Any]:
+        latencies = list(self.latencies_ms)
+        rejected = self.outcomes.get("rejected", 0)
+        return {
+            "requests": self.requests,
+            "models": dict(self.models),
+            "latency_ms": {
+                "mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+                "p50": round(_percentile(latencies, 0.5), 2),
+                "p95": round(_percentile(latencies, 0.95), 2),
+            },
+            "outcomes": dict(self.outcomes),
+            # Share of local outputs thrown away by the bad-callout heuristic.
+            "rejection_rate": round(rejected / self.requests, 3) if self.requests else 0.0,
+        }
+
+
+class PairModelRouter:
+    """Lazily loaded, memory-capped set of MarianMT models keyed by model id."""
+
+    def __init__(
+        self,
+        models_dir: Path,
+        max_memory_mb: float = 1200.0,
+        loader: Optional[Callable[[str], Dict[str, Any]]] = None,
+    ) -> None:
+        self.models_dir = Path(models_dir)
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self._loader = loader or self._load_marian
+        self._lock = threading.Lock()
+        self._loaded: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._loading: Dict[str, threading.Event] = {}
+        # model_id -> {"error", "failures", "retry_at"}; retry_at None = never
+        self._unavailable: Dict[str, Dict[str, Any]] = {}
+        self._pinned: set[str] = set()
+        self._stats: Dict[str, _PairStats] = {}
+        self.evictions = 0
+
+    def _load_marian(self, model_id: str) -> Dict[str, Any]:
+        from transformers import MarianMTModel
+        import torch
+
+        from tokenization import TokenIdCache, load_tokenizer
+
+        model = MarianMTModel.from_pretrained(model_id, cache_dir=str(self.models_dir))
+        tokenizer = load_tokenizer(model_id, cache_dir=str(self.models_dir))
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        if device == "cuda":
+            model = model.to("cuda")
+        model.eval()
+        memory = sum(p.numel() * p.element_size() for p in model.parameters())
+        return {
+            "model": model,
+            "tokenizer": tokenizer,
+            "token_cache": TokenIdCache(tokenizer, device),
+            "device": device,
+            "memory_bytes": int(memory),
+        }
+
+    def pin(self, model_id: str) -> None:
+        """Exclude a model (e.g. the current mul fallback) from eviction."""
+        with self._lock:
+            self._pinned.add(model_id)
+
+    def unpin(self, model_id: str) -> None:
+        with self._lock:
+            self._pinned.discard(model_id)
+
+    def is_loaded(self, model_id: str) -> bool:
+        with self._lock:
+            return model_id in self._loaded
+
+    def _blocked_locked(self, model_id: str) -> bool:
+        """Model failed to load and is not due for a retry yet."""
+        failure = self._unavailable.get(model_id)
+        if failure is None:
+            return False
+        return failure["retry_at"] is None or time.monotonic() < failure["retry_at"]
+
+    def pending_preferred(
+        self, source_language: Optional[str], target_language: str
+    ) -> Optional[str]:
+        """
+        Preferred model for the pair while a lower-ranked model stands in for it.
+
+        Returns None when the best model that can ever load is already loaded,
+        so output produced now is final rather than provisional.
+        """
+        with self._lock:
+            for model_id in candidate_models(source_language, target_language):
+                if model_id in self._loaded:
+                    return None
+                failure = self._unavailable.get(model_id)
+                if failure is None or failure["retry_at"] is not None:
+                    return model_id
+        return None
+
+    def load(self, model_id: str) -> Dict[str, Any]:
+        """Load (or wait for a concurrent load of) ``model_id``; raises on failure."""
+        with self._lock:
+            entry = self._loaded.get(model_id)
+            if entry is not None:
+                self._loaded.move_to_end(model_id)
+                return entry
+            pending = self._loading.get(model_id)
+            if pending is None:
+                pending = threading.Event()
+                self._loading[model_id] = pending
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            pending.wait()
+            with self._lock:
+                entry = self._loaded.get(model_id)
+                if entry is None:
+                    failure = self._unavailable.get(model_id) or {}
+                    raise RuntimeError(f"{model_id} unavailable: {failure.get('error', 'load failed')}")
+                return entry
+
+        start = time.perf_counter()
+        try:
+            entry = dict(self._loader(model_id))
+            entry["model_id"] = model_id
+            entry["load_time_s"] = round(time.perf_counter() - start, 2)
+            with self._lock:
+                self._loaded[model_id] = entry
+                self._unavailable.pop(model_id, None)
+                self._evict_locked(keep=model_id)
+            print(
+                f"[OK] Translation model {model_id} loaded in {entry['load_time_s']}s",
+                flush=True,
+            )
+            return entry
+        except Exception as e:
+            with self._lock:
+                failures = self._unavailable.get(model_id, {}).get("failures", 0) + 1
+                if _model_missing(e):
+                    retry_s = None
+                else:
+                    retry_s = min(_MAX_RETRY_BACKOFF_S, _RETRY_BACKOFF_S * 2 ** (failures - 1))
+                self._unavailable[model_id] = {
+                    "error": str(e),
+                    "failures": failures,
+                    "retry_at": None if retry_s is None else time.monotonic() + retry_s,
+                }
+            if retry_s is None:
+                print(f"[WARN] Translation model {model_id} does not exist: {e}", flush=True)
+            else:
+                print(
+                    f"[WARN] Translation model {model_id} failed to load ({e}); retrying in {retry_s:.0f}s",
+                    flush=True,
+                )
+            raise
+        finally:
+            with self._lock:
+                self._loading.pop(model_id, None)
+            pending.set()
+
+    def prefetch(self, model_id: str) -> None:
+        """Start loading ``model_id`` on a daemon thread if it is not loaded yet."""
+        with self._lock:
+            if (
+                model_id in self._loaded
+                or model_id in self._loading
+                or self._blocked_locked(model_id)
+            ):
+                return
+
+        def _run() -> None:
+            try:
+                self.load(model_id)
+            except Exception:
+                pass
+
+        threading.Thread(
+            target=_run, name=f"translation-load-{model_id}", daemon=True
+        ).start()
+
+    def get(
+        self,
+        source_language: Optional[str],
+        target_language: str,
+        wait: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Best loaded model for the pair.
+
+        The preferred candidate is loaded in the background (or inline when
+        ``wait`` is set); until it is ready the next loaded candidate is used.
+        """
+        preferred_started = False
+        for model_id in candidate_models(source_language, target_language):
+            with self._lock:
+                if self._blocked_locked(model_id):
+                    continue
+                entry = self._loaded.get(model_id)
+                if entry is not None:
+                    self._loaded.move_to_end(model_id)
+                    return entry
+            if preferred_started:
+                continue
+            preferred_started = True
+            if wait:
+                try:
+                    return self.load(model_id)
+                except Exception:
+                    preferred_started = False
+                    continue
+            self.prefetch(model_id)
+        return None
+
+    def _evict_locked(self, keep: str) -> None:
+        used = sum(e.get("memory_bytes", 0) for e in self._loaded.values())
+        for model_id in list(self._loaded.keys()):
+            if used <= self.max_memory_bytes:
+                break
+            if model_id == keep or model_id in self._pinned:
+                continue
+            entry = self._loaded.pop(model_id)
+            used -= entry.get("memory_bytes", 0)
+            self.evictions += 1
+            print(f"[INFO] Evicted translation model {model_id} (memory cap)", flush=True)
+        try:
+            import torch
+
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except Exception:
+            pass
+
+    def _pair_stats_locked(
+        self, source_language: Optional[str], target_language: str
+    ) -> _PairStats:
+        key = f"{_normalize_code(source_language) or 'auto'}->{_normalize_code(target_language) or 'en'}"
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = _PairStats()
+            self._stats[key] = stats
+        return stats
+
+    def record_latency(
+        self,
+        source_language: Optional[str],
+        target_language: str,
+        model_id: Optional[str],
+        latency_s: float,
+    ) -> None:
+        with self._lock:
+            stats = self._pair_stats_locked(source_language, target_language)
+            stats.requests += 1
+            stats.latencies_ms.append(latency_s * 1000.0)
+            name = model_id or "unknown"
+            stats.models[name] = stats.models.get(name, 0) + 1
+
+    def record_outcome(
+        self, source_language: Optional[str], target_language: str, outcome: str
+    ) -> None:
+        """Count a quality signal for the pair (``rejected`` or ``api_fallback``)."""
+        with self._lock:
+            stats = self._pair_stats_locked(source_language, target_language)
+            stats.outcomes[outcome] = stats.outcomes.get(outcome, 0) + 1
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            loaded = [
+                {
+                    "model_id": model_id,
+                    "memory_mb": round(e.get("memory_bytes", 0) / (1024 * 1024), 1),
+                    "load_time_s": e.get("load_time_s"),
+                    "pinned": model_id in self._pinned,
+                    "token_cache": e["token_cache"].stats() if e.get("token_cache") else None,
+                    # Beam requests decoded greedily to stay within the deadline
+                    "deadline_greedy": e.get("deadline_greedy", 0),
+                }
+                for model_id, e in self._loaded.items()
+            ]
+            used = sum(e.get("memory_bytes", 0) for e in self._loaded.values())
+            now = time.monotonic()
+            unavailable = {
+                model_id: {
+                    "error": failure["error"],
+                    "failures": failure["failures"],
+                    # None: the model does not exist and is never retried
+                    "retry_in_s": (
+                        None if failure["retry_at"] is None
+                        else round(max(0.0, failure["retry_at"] - now), 1)
+                    ),
+                }
+                for model_id, failure in self._unavailable.items()
+            }
+            return {
+                "max_memory_mb": round(self.max_memory_bytes / (1024 * 1024), 1),
+                "used_memory_mb": round(used / (1024 * 1024), 1),
+                "loaded": loaded,
+                "loading": sorted(self._loading.keys()),
+                "unavailable": unavailable,
+                "evictions": self.evictions,
+                "pairs": {k: s.as_dict() for k, s in sorted(self._stats.items())},
+            }
@@ -5,10 +5,13 @@ Refactored from src/core/translation/translator.py
 import sys
 import os
 import json
+import math
 import re
 import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Iterator, Iterable
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
@@ -20,6 +23,12 @@ except ImportError:
 
         print(*args, **kwargs)
 
+from adaptive_learning import AdaptiveLearningStore
+from language_id import LanguageIdentifier
+from segmentation import DEFAULT_MAX_SEGMENT_CHARS, join_segments, split_segments
+from single_flight import SingleFlight
+from translation_memory import FuzzyTranslationMemory
+
 # Import torch conditionally
 try:
     import torch
@@ -35,6 +44,24 @@ _GAMING_CALLOUT_PATTERNS: list[tuple[str, str]] = [
     (r"one\s+short|uno.*cort", "One short"),
 ]
 
+# Generation budget: output length is capped relative to the input length so
+# short callouts cannot ramble, short inputs decode greedily, and every request
+# has a wall-clock deadline after which the best hypothesis so far is returned.
+_SHORT_INPUT_TOKENS = 16
+_OUTPUT_LENGTH_RATIO = 1.5
+_OUTPUT_LENGTH_SLACK = 6
+_MAX_OUTPUT_TOKENS = 512
+_LONG_INPUT_BEAMS = 4
+
+# Multi-sentence input is translated per segment, in padded batches of at most
+# this many segments, with model outputs cached per (model, segment).
+_SEGMENT_BATCH_SIZE = 16
+_SEGMENT_CACHE_SIZE = 4096
+
+# Output of a stand-in model (the mul model while the pair model loads) is
+# cached only this long, and dropped as soon as the pair model is ready.
+_PROVISIONAL_CACHE_TTL_S = 30.0
+
 
 class TranslationService:
 
@@ -46,7 +73,18 @@ class TranslationService:
         model_type: str = "local",
         model_name: str = "opus-mt",
         use_fallback: bool = True,
-        models_dir: Optional[str] = None
+        models_dir: Optional[str] = None,
+        pair_model_memory_mb: float = 1200.0,
+        backend: str = "transformers",
+        cpu_threads: int = 2,
+        generation_deadline_ms: float = 1500.0,
+        api_timeout_ms: float = 2000.0,
+        fuzzy_threshold: Optional[float] = 0.9,
+        fuzzy_language_thresholds: Optional[Dict[str, float]] = None,
+        fuzzy_max_entries: int = 10000,
+        language_id_min_confidence: Optional[float] = 0.6,
+        learned_preferences: Optional[AdaptiveLearningStore] = None,
+        segment_max_chars: int = DEFAULT_MAX_SEGMENT_CHARS,
     ):
         """
         Initialize translation service
@@ -57,11 +95,39 @@ class TranslationService:
             model_name: Model name ('opus-mt', 'nllb', 'easynmt')
             use_fallback: Use API fallback if local fails
             models_dir: Directory to store models
+            pair_model_memory_mb: Memory cap for lazily loaded pair models
+            backend: 'transformers' (fp32 PyTorch) or 'ctranslate2' (int8 CPU)
+            cpu_threads: Intra-op threads for the ctranslate2 backend
+            generation_deadline_ms: Per-request decode deadline (best hypothesis so far)
+            api_timeout_ms: Hard deadline for one API fallback call, retries included
+            fuzzy_threshold: Minimum similarity for a translation-memory hit (None disables)
+            fuzzy_language_thresholds: Per source-language overrides of fuzzy_threshold
+            fuzzy_max_entries: Translation-memory capacity (oldest entries evicted)
+            language_id_min_confidence: Identify the source language of
+                untagged text in-process when at least this sure (None disables)
+            learned_preferences: Preference store consulted before anything
+                else (None: learned preferences off, nothing opened on disk)
+            segment_max_chars: Longest sentence/clause sent to the local
+                model in one piece; longer input is segmented and batched
         """
         self.target_language = target_language
         self.model_type = model_type
         self.model_name = model_name
         self.use_fallback = use_fallback
+        self.pair_model_memory_mb = pair_model_memory_mb
+        self.backend = (backend or "transformers").strip().lower()
+        self.cpu_threads = cpu_threads
+        self.generation_deadline_s = max(0.05, generation_deadline_ms / 1000.0)
+        # Guards generation_stats and segment_stats: decodes run on several threads
+        self._stats_lock = threading.Lock()
+        self.generation_stats = {
+            "requests": 0, "greedy": 0, "length_capped": 0, "deadline_hits": 0,
+            "tokenize_ms": 0.0, "generate_ms": 0.0, "decode_ms": 0.0,
+        }
+        self.api_timeout_s = max(0.1, api_timeout_ms / 1000.0)
+        self.segment_max_chars = max(20, segment_max_chars)
+        self.segment_stats = {"segmented": 0, "segments": 0, "cache_hits": 0, "batches": 0}
+        self._segment_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
 
         # Model storage directory
         if models_dir:
@@ -76,13 +142,51 @@ class TranslationService:
         # Initialize translators (lazy loading)
         self.local_translator = None
         self.fallback_translator = None
+        self.pair_router = None
         self._model_loading = False
         self._model_loaded = False
         self._initialization_attempted = False
 
+        # One-time initializer: the first caller starts a background load, everyone
+        # else checks/awaits _ready_event instead of sleep-polling _model_loading.
+        self._init_lock = threading.Lock()
+        self._ready_event = threading.Event()
+        self._load_thread: Optional[threading.Thread] = None
+        self._load_stage = "idle"
+        self._load_progress = 0.0
+        self._load_started_at: Optional[float] = None
+        self._load_finished_at: Optional[float] = None
+        self._load_error: Optional[str] = None
+
         # Translation cache
         self.translation_cache = {}
         self.cache_lock = threading.Lock()
+        # cache_key -> (preferred model id, expiry) for stand-in model output
+        self._provisional_cache: Dict[str, Tuple[str, float]] = {}
+        # Concurrent misses for the same cache key share one model/API run
+        self._inflight = SingleFlight()
+        # Near-duplicate transcripts reuse an earlier translation
+        self.translation_memory = (
+            FuzzyTranslationMemory(
+                threshold=fuzzy_threshold,
+                language_thresholds=fuzzy_language_thresholds,
+                max_entries=fuzzy_max_entries,
+            )
+            if fuzzy_threshold
+            else None
+        )
+        # Untagged transcripts get a source language before pair selection
+        self.language_identifier = None
+        self.language_id_stats = {"requests": 0, "identified": 0, "abstained": 0, "detect_ms": 0.0}
+        if language_id_min_confidence:
+            try:
+                self.language_identifier = LanguageIdentifier(min_confidence=language_id_min_confidence)
+            except Exception as e:
+                safe_print(f"[WARN] Language identification disabled: {e}", flush=True)
+        # User-taught translations win over cache, callouts and models
+        self.learned_preferences = learned_preferences
+        # Live traffic marker; the startup warm-up backs off while it is recent
+        self._last_live_request = 0.0
         self.tactical_rules = self._load_tactical_rules()
 
     def _load_tactical_rules(self) -> Dict[str, Any]:
@@ -95,6 +199,29 @@ class TranslationService:
             safe_print(f"[WARN] Tactical rules unavailable: {e}", flush=True)
             return {}
 
+    def _set_load_stage(self, stage: str, progress: float) -> None:
+
+        self._load_stage = stage
+        self._load_progress = max(self._load_progress, min(1.0, progress))
+
+    def load_status(self) -> Dict[str, Any]:
+
+        """Model load progress for /health (stage, 0..1 progress, elapsed seconds)."""
+        if self._load_started_at is None:
+            elapsed = 0.0
+        else:
+            end = self._load_finished_at or time.time()
+            elapsed = end - self._load_started_at
+        return {
+            "stage": self._load_stage,
+            "progress": round(self._load_progress, 3),
+            "loading": self._model_loading,
+            "loaded": self._model_loaded,
+            "ready": self._ready_event.is_set(),
+            "elapsed_s": round(elapsed, 2),
+            "error": self._load_error,
+        }
+
     def _apply_regex_replacements(self, text: str, replacements: list[dict]) -> str:
 
         updated = text
@@ -220,6 +347,11 @@ class TranslationService:
         try:
             safe_print(f"[INFO] Initializing local translation model ({self.model_name})...", flush=True)
             self._model_loading = True
+            self._set_load_stage("importing", 0.05)
+
+            # Quantized CPU backend when selected and converted models exist
+            if self.backend == "ctranslate2" and self._initialize_ctranslate2():
+                return
 
             # Try EasyNMT first
             try:
@@ -232,6 +364,7 @@ class TranslationService:
                     model_name = "opus-mt"
 
                 safe_print(f"[INFO] Loading model: {model_name}...", flush=True)
+                self._set_load_stage("loading_model", 0.2)
                 self.local_translator = EasyNMT(model_name, cache_folder=str(self.models_dir))
                 self._model_loaded = True
                 self._model_loading = False
@@ -239,40 +372,25 @@ class TranslationService:
 
             except ImportError:
                 safe_print("[WARN] EasyNMT not available, trying transformers...", flush=True)
-                # Fallback to transformers
+                # Fallback to transformers, routed per language pair
                 try:
-                    from transformers import MarianMTModel, MarianTokenizer
+                    from transformers import MarianMTModel  # noqa: F401
                     import torch
 
-                    model_map = {
-                        "en": "Helsinki-NLP/opus-mt-mul-en",
-                        "es": "Helsinki-NLP/opus-mt-mul-es",
-                        "fr": "Helsinki-NLP/opus-mt-mul-fr",
-                        "de": "Helsinki-NLP/opus-mt-mul-de",
-                        "ru": "Helsinki-NLP/opus-mt-mul-ru",
-                        "zh": "Helsinki-NLP/opus-mt-mul-zh",
-                        "ja": "Helsinki-NLP/opus-mt-mul-ja",
-                        "ko": "Helsinki-NLP/opus-mt-mul-ko",
-                        "pt": "Helsinki-NLP/opus-mt-mul-pt",
-                        "it": "Helsinki-NLP/opus-mt-mul-it",
-                        "ar": "Helsinki-NLP/opus-mt-mul-ar",
-                        "hi": "Helsinki-NLP/opus-mt-mul-hi",
-                        "tr": "Helsinki-NLP/opus-mt-mul-tr",
-                        "pl": "Helsinki-NLP/opus-mt-mul-pl",
-                        "uk": "Helsinki-NLP/opus-mt-mul-uk"
-                    }
-
-                    model_name = model_map.get(self.target_language, "Helsinki-NLP/opus-mt-mul-en")
-                    safe_print(f"[INFO] Loading transformers model: {model_name}...", flush=True)
+                    from translation_router import PairModelRouter, multi_source_model
 
-                    self.local_translator = {
-                        "model": MarianMTModel.from_pretrained(model_name, cache_dir=str(self.models_dir)),
-                        "tokenizer": MarianTokenizer.from_pretrained(model_name, cache_dir=str(self.models_dir)),
-                        "device": "cuda" if torch and torch.cuda.is_available() else "cpu"
-                    }
+                    self.pair_router = PairModelRouter(
+                        self.models_dir,
+                        max_memory_mb=self.pair_model_memory_mb,
+                    )
+                    model_name = multi_source_model(self.target_language)
+                    safe_print(f"[INFO] Loading transformers model: {model_name}...", flush=True)
 
-                    if self.local_translator["device"] == "cuda":
-                        self.local_translator["model"] = self.local_translator["model"].to("cuda")
+                    self._set_load_stage("loading_model", 0.2)
+                    # The mul model is the always-available default; pair models
+                    # are loaded on demand once a source language is known.
+                    self.pair_router.pin(model_name)
+                    self.local_translator = self.pair_router.load(model_name)
 
                     self._model_loaded = True
                     self._model_loading = False
@@ -287,6 +405,7 @@ class TranslationService:
 
             except Exception as e:
                 safe_print(f"[ERROR] Error initializing local model: {e}", flush=True)
+                self._load_error = str(e)
                 self.local_translator = None
                 self._model_loading = False
                 if self.use_fallback:
@@ -294,46 +413,146 @@ class TranslationService:
 
         except Exception as e:
             safe_print(f"[ERROR] Unexpected error: {e}", flush=True)
+            self._load_error = str(e)
             self.local_translator = None
             self._model_loading = False
             if self.use_fallback:
                 self._initialize_api_translator()
 
+    def _initialize_ctranslate2(self) -> bool:
+
+        """Load the int8 CTranslate2 backend; False falls through to fp32 PyTorch."""
+        try:
+            from ctranslate2_backend import ctranslate2_available, make_loader
+            from translation_router import PairModelRouter, multi_source_model
+
+            if not ctranslate2_available():
+                safe_print("[WARN] ctranslate2 not installed, using fp32 transformers backend", flush=True)
+                return False
+
+            self.pair_router = PairModelRouter(
+                self.models_dir,
+                max_memory_mb=self.pair_model_memory_mb,
+                loader=make_loader(self.models_dir, cpu_threads=self.cpu_threads),
+            )
+            model_name = multi_source_model(self.target_language)
+            safe_print(f"[INFO] Loading int8 CTranslate2 model: {model_name}...", flush=True)
+            self._set_load_stage("loading_model", 0.2)
+            self.pair_router.pin(model_name)
+            self.local_translator = self.pair_router.load(model_name)
+
+            self._model_loaded = True
+            self._model_loading = False
+            safe_print(f"[OK] Local translator initialized (ctranslate2 int8)", flush=True)
+            return True
+        except Exception as e:
+            safe_print(f"[WARN] CTranslate2 backend unavailable ({e}), using fp32 transformers backend", flush=True)
+            self.pair_router = None
+            self.local_translator = None
+            return False
+
     def _initialize_api_translator(self):
 
         """Initialize API-based translator (fallback)"""
         try:
-            from deep_translator import GoogleTranslator
-            # Initialize with auto-detect source, will be overridden per-translation if needed
-            self.fallback_translator = GoogleTranslator(source='auto', target=self.target_language)
-            safe_print(f"[OK] API translator initialized (target: {self.target_language})", flush=True)
-        except ImportError as e:
-            safe_print(f"[ERROR] deep_translator not available: {e}", flush=True)
-            safe_print("[INFO] Install with: pip install deep-translator", flush=True)
-            self.fallback_translator = None
+            from api_translation_client import ApiTranslationClient
+            # One pooled client for every pair; per-pair translators are cached on it
+            self.fallback_translator = ApiTranslationClient(timeout_s=self.api_timeout_s)
+            safe_print(
+                f"[OK] API translator initialized (target: {self.target_language}, "
+                f"backend: {self.fallback_translator.backend})",
+                flush=True,
+            )
         except Exception as e:
             safe_print(f"[ERROR] Error initializing API translator: {e}", flush=True)
             import traceback
             safe_print(f"[ERROR] Traceback: {traceback.format_exc()}", flush=True)
             self.fallback_translator = None
 
-    def _ensure_initialized(self):
+    def _run_initialization(self):
 
-        """Ensure translator is initialized (lazy loading)"""
-        if self._initialization_attempted:
-            return
+        """Body of the one-time initializer; always releases waiters when done."""
+        self._load_started_at = time.time()
+        try:
+            if self.model_type == "local":
+                self._initialize_local_model()
+            else:
+                self._set_load_stage("initializing_api", 0.5)
+                self._initialize_api_translator()
+        except Exception as e:
+            safe_print(f"[ERROR] Translation initialization failed: {e}", flush=True)
+            self._load_error = str(e)
+        finally:
+            self._model_loading = False
+            self._load_finished_at = time.time()
+            self._set_load_stage(
+                "ready" if (self._model_loaded or self.fallback_translator) else "failed",
+                1.0,
+            )
+            self._ready_event.set()
+
+    def start_initialization(self, background: bool = True) -> bool:
+
+        """
+        Start the one-time translator initialization if nobody has yet.
+
+        Args:
+            background: Load on a daemon thread instead of the calling thread
+
+        Returns:
+            True if this call started the initialization
+        """
+        with self._init_lock:
+            if self._initialization_attempted:
+                return False
+            self._initialization_attempted = True
+            self._model_loading = self.model_type == "local"
+            self._set_load_stage("queued", 0.0)
+            if background:
+                self._load_thread = threading.Thread(
+                    target=self._run_initialization,
+                    name="translation-model-init",
+                    daemon=True,
+                )
+                self._load_thread.start()
+                return True
+
+        self._run_initialization()
+        return True
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+
+        """Block until initialization finished (starting it if needed)."""
+        self.start_initialization(background=False)
+        return self._ready_event.wait(timeout)
+
+    def is_ready(self) -> bool:
+
+        return self._ready_event.is_set()
 
-        self._initialization_attempted = True
+    def _ensure_initialized(self) -> bool:
 
+        """
+        Ensure translator initialization has started (lazy loading).
+
+        Local models load in the background so request threads never queue behind
+        them; the API translator is cheap and is initialized inline.
+
+        Returns:
+            True if initialization has finished
+        """
+        if self._ready_event.is_set():
+            return True
         if self.model_type == "local":
-            self._initialize_local_model()
-        else:
-            self._initialize_api_translator()
+            self.start_initialization(background=True)
+            return self._ready_event.is_set()
+        return self.wait_until_ready()
 
     def translate(
         self,
         text: str,
-        source_language: Optional[str] = None
+        source_language: Optional[str] = None,
+        target_prefix: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Translate text to target language
@@ -341,20 +560,174 @@ class TranslationService:
         Args:
             text: Text to translate
             source_language: Source language code (None for auto-detect)
+            target_prefix: Output the local model is forced to start with
+                (speculative translation of a transcript prefix); ignored by
+                EasyNMT and the API fallback. Forced results are neither
+                shared with unforced callers nor cached
+
+        Returns:
+            Dict with 'translated_text', 'source_language', 'target_language'
+        """
+        self._last_live_request = time.monotonic()
+        source_language = self._resolve_source_language(text, source_language)
+        early, original_text, normalized_text, cache_key = self._prepare_translation(
+            text, source_language
+        )
+        if early is not None:
+            return early
+
+        result, shared = self._inflight.do(
+            f"{cache_key}\x00{target_prefix}" if target_prefix else cache_key,
+            lambda: self._translate_uncached(
+                original_text, normalized_text, source_language, cache_key, target_prefix
+            ),
+        )
+        if shared:
+            safe_print(f"[INFO] Joined in-flight translation: {normalized_text[:50]}...", flush=True)
+        return result
+
+    def finish_speech_translation(
+        self,
+        translated_text: str,
+        source_text: str = "",
+        source_language: Optional[str] = None,
+    ) -> Dict[str, Any]:
+
+        """
+        Post-process English from Whisper's translate task the way translate()
+        treats model output
+
+        Learned preferences and the translation cache need the source
+        transcript, so they apply only when ``source_text`` is given; callout
+        resolution and tactical compression run on Whisper's English.
 
         Returns:
             Dict with 'translated_text', 'source_language', 'target_language'
+            (plus 'learned' when a preference replaced the output)
+        """
+        result = {
+            "translated_text": "",
+            "source_language": source_language or "unknown",
+            "target_language": "en",
+        }
+        english = (translated_text or "").strip()
+        source = (source_text or "").strip()
+        normalized_source = self._normalize_tactical_source(source) or source
+        if source:
+            if self.learned_preferences is not None:
+                preferred = self.learned_preferences.lookup(source, source_language, "en")
+                if preferred is not None:
+                    return {**result, "translated_text": preferred, "learned": True}
+            if self.target_language == "en":
+                with self.cache_lock:
+                    cached = self.translation_cache.get(f"{normalized_source}_{source_language}_en")
+                if cached is not None and cached.get("translated_text"):
+                    return {**result, "translated_text": cached["translated_text"]}
+        callout = (
+            self._resolve_gaming_callout(normalized_source, "en")
+            or self._resolve_gaming_callout(self._normalize_tactical_source(english) or english, "en")
+        )
+        if callout:
+            result["translated_text"] = callout
+        elif english:
+            result["translated_text"] = self._compress_tactical_output(english, "en")
+        return result
+
+    def warm(self, text: str, source_language: Optional[str] = None) -> str:
+
+        """
+        Translate ``text`` into the cache without counting it as live traffic.
+
+        Returns:
+            'translated', 'already_cached' (or otherwise short-circuited) or 'failed'
+        """
+        source_language = self._resolve_source_language(text, source_language)
+        early, original_text, normalized_text, cache_key = self._prepare_translation(
+            text, source_language
+        )
+        if early is not None:
+            return "failed" if early.get("status") == "warming" else "already_cached"
+        result, _shared = self._inflight.do(
+            cache_key,
+            lambda: self._translate_uncached(
+                original_text, normalized_text, source_language, cache_key
+            ),
+        )
+        if "error" in result or result.get("translated_text") in (original_text, normalized_text):
+            # Do not pin a passthrough into the cache or the fuzzy memory;
+            # a live request retries it
+            with self.cache_lock:
+                self.translation_cache.pop(cache_key, None)
+            if self.translation_memory is not None:
+                self.translation_memory.discard(normalized_text, source_language, self.target_language)
+            return "failed"
+        return "translated"
+
+    def seconds_since_live_request(self) -> float:
+
+        return time.monotonic() - self._last_live_request
+
+    def _resolve_source_language(self, text: str, source_language: Optional[str]) -> Optional[str]:
+
+        """
+        Source language to translate from.
+
+        A concrete code from the caller (usually Whisper) is kept. Missing,
+        "auto" and "unknown" are replaced by the in-process identifier's guess
+        so the same-language short-circuit and pair-model selection work
+        without the API; when it abstains the original value is returned.
+        """
+        if self.language_identifier is None or not text or not text.strip():
+            return source_language
+        if source_language and source_language not in ("auto", "unknown"):
+            return source_language
+
+        start = time.perf_counter()
+        detected, confidence = self.language_identifier.detect(text)
+        self.language_id_stats["detect_ms"] += (time.perf_counter() - start) * 1000.0
+        self.language_id_stats["requests"] += 1
+        if detected is None:
+            self.language_id_stats["abstained"] += 1
+            return source_language
+        self.language_id_stats["identified"] += 1
+        safe_print(f"[INFO] Identified source language: {detected} ({confidence:.2f})", flush=True)
+        return detected
+
+    def _prepare_translation(
+        self, text: str, source_language: Optional[str]
+    ) -> Tuple[Optional[Dict[str, Any]], str, str, str]:
+
+        """
+        Everything translate() does before running a model.
+
+        Returns:
+            (early result or None, original text, normalized text, cache key);
+            an early result (empty input, learned preference, callout, cache or
+            translation-memory hit, same language, model warming) is returned
+            to the caller as is.
         """
         if not text or len(text.strip()) == 0:
             return {
                 "translated_text": "",
                 "source_language": source_language or "unknown",
                 "target_language": self.target_language
-            }
+            }, "", "", ""
 
         original_text = text.strip()
         normalized_text = self._normalize_tactical_source(original_text) or original_text
 
+        if self.learned_preferences is not None:
+            preferred = self.learned_preferences.lookup(
+                original_text, source_language, self.target_language
+            )
+            if preferred is not None:
+                return {
+                    "translated_text": preferred,
+                    "source_language": source_language or "unknown",
+                    "target_language": self.target_language,
+                    "learned": True,
+                }, original_text, normalized_text, ""
+
         callout = self._resolve_gaming_callout(normalized_text, self.target_language)
         if callout:
             result = {
@@ -365,12 +738,12 @@ class TranslationService:
             cache_key = f"{normalized_text}_{source_language}_{self.target_language}"
             with self.cache_lock:
                 self.translation_cache[cache_key] = result
-            return result
+            return result, original_text, normalized_text, cache_key
 
         cache_key = f"{normalized_text}_{source_language}_{self.target_language}"
         with self.cache_lock:
-            if cache_key in self.translation_cache:
-                return self.translation_cache[cache_key]
+            if cache_key in self.translation_cache and not self._provisional_expired_locked(cache_key):
+                return self.translation_cache[cache_key], original_text, normalized_text, cache_key
 
         # Same language: return immediately without loading translation models.
         if source_language and source_language not in ("auto", "unknown"):
@@ -386,35 +759,94 @@ class TranslationService:
                 }
                 with self.cache_lock:
                     self.translation_cache[cache_key] = result
-                return result
-
-        # Lazy initialization (only when translation may be needed)
-        self._ensure_initialized()
+                return result, original_text, normalized_text, cache_key
 
-        # Wait for model loading
-        if self._model_loading:
-            import time
-            timeout = 60
-            start_time = time.time()
-            while self._model_loading and (time.time() - start_time) < timeout:
-                time.sleep(0.5)
+        # Near-duplicate of something already translated (e.g. "Rush B!" vs "rush b")
+        if self.translation_memory is not None:
+            match = self.translation_memory.lookup(
+                normalized_text, source_language, self.target_language
+            )
+            if match:
+                cached, similarity, matched_source = match
+                result = dict(cached)
+                result["similarity"] = similarity
+                result["matched_source"] = matched_source
+                # Not promoted into the exact cache: a fuzzy hit stays an
+                # approximation and must not outlive the entry it matched.
+                return result, original_text, normalized_text, cache_key
+
+        # Lazy initialization (only when translation may be needed). While the
+        # local model is still loading, fail fast instead of parking this thread.
+        if not self._ensure_initialized():
+            status = self.load_status()
+            safe_print(
+                f"[INFO] Translation model warming ({status['stage']}, "
+                f"{status['progress']:.0%}); returning source text",
+                flush=True,
+            )
+            return {
+                "translated_text": original_text,
+                "source_language": source_language or "unknown",
+                "target_language": self.target_language,
+                "status": "warming",
+            }, original_text, normalized_text, cache_key
+
+        return None, original_text, normalized_text, cache_key
+
+    def _provisional_expired_locked(self, cache_key: str) -> bool:
+
+        """Evict a stand-in model's cached output once stale; caller holds cache_lock."""
+        provisional = self._provisional_cache.get(cache_key)
+        if provisional is None:
+            return False
+        preferred, expires_at = provisional
+        if time.monotonic() < expires_at and not (
+            self.pair_router is not None and self.pair_router.is_loaded(preferred)
+        ):
+            return False
+        del self._provisional_cache[cache_key]
+        self.translation_cache.pop(cache_key, None)
+        return True
+
+    def _translate_uncached(
+        self,
+        original_text: str,
+        normalized_text: str,
+        source_language: Optional[str],
+        cache_key: str,
+        target_prefix: Optional[str] = None,
+    ) -> Dict[str, Any]:
 
+        """Run the model/API path for a cache miss; caches and returns the result."""
         try:
             # Try local translation first
             translated = None
+            model_output = None
+            standin_for = None
             if self.model_type == "local" and self.local_translator and self._model_loaded:
+                if self.pair_router is not None and isinstance(self.local_translator, dict):
+                    # Checked before decoding: a pair model finishing mid-call
+                    # only shortens how long this output stays cached
+                    standin_for = self.pair_router.pending_preferred(source_language, self.target_language)
                 safe_print(
                     f"[INFO] Attempting local translation: {normalized_text[:50]}...",
                     flush=True,
                 )
-                translated = self._translate_with_local(normalized_text, source_language)
+                translated = self._translate_with_local(
+                    normalized_text, source_language, target_prefix
+                )
                 if translated:
                     safe_print(f"[OK] Local translation: {translated[:50]}...", flush=True)
+                    if isinstance(self.local_translator, dict) and (
+                        target_prefix or len(split_segments(normalized_text, self.segment_max_chars)) == 1
+                    ):
+                        # One decoder pass: its raw text may seed a forced prefix later
+                        model_output = translated
                 else:
                     safe_print("[WARN] Local translation returned None", flush=True)
 
             # Fallback to API if local translation failed or returned same text
-            if translated is None or translated == text:
+            if translated is None or translated == original_text:
                 if self.use_fallback:
                     # Ensure API translator is initialized
                     if not self.fallback_translator:
@@ -422,10 +854,13 @@ class TranslationService:
                         self._initialize_api_translator()
 
                     if self.fallback_translator:
+                        self._record_pair_outcome(source_language, "api_fallback")
                         safe_print(f"[INFO] Using API fallback for: {normalized_text[:50]}... (source: {source_language}, target: {self.target_language})", flush=True)
                         api_translated = self._translate_with_api(normalized_text, source_language)
                         if api_translated and api_translated != normalized_text:
                             translated = api_translated
+                            model_output = None
+                            standin_for = None
                             safe_print(f"[OK] API translation: '{translated[:50]}...'", flush=True)
                         else:
                             safe_print("[WARN] API translation returned None or same text", flush=True)
@@ -434,51 +869,570 @@ class TranslationService:
                 else:
                     safe_print("[WARN] Fallback disabled, no translation available", flush=True)
 
-            if translated is None:
-                safe_print(f"[WARN] All translation methods failed, returning original text", flush=True)
-                translated = normalized_text
-
-            translated = self._compress_tactical_output(
+            if translated == original_text:
+                model_output = None
+            return self._finish_translation(
+                original_text,
+                normalized_text,
+                source_language,
+                cache_key,
                 translated,
-                self.target_language,
+                model_output=model_output,
+                cache=not target_prefix,
+                provisional_for=standin_for,
             )
 
-            if self._is_bad_callout_translation(original_text, translated):
-                fallback = (
-                    self._resolve_gaming_callout(original_text, self.target_language)
-                    or self._resolve_gaming_callout(
-                        normalized_text, self.target_language
-                    )
-                    or normalized_text
-                )
-                safe_print(
-                    f"[WARN] Bad callout translation {translated!r} -> {fallback!r}",
-                    flush=True,
-                )
-                translated = fallback
-
-            result = {
-                "translated_text": translated,
+        except Exception as e:
+            safe_print(f"[ERROR] Error translating: {e}", flush=True)
+            return {
+                "translated_text": original_text,
                 "source_language": source_language or "unknown",
-                "target_language": self.target_language
+                "target_language": self.target_language,
+                "error": str(e)
             }
 
-            # Cache result
+    def _finish_translation(
+        self,
+        original_text: str,
+        normalized_text: str,
+        source_language: Optional[str],
+        cache_key: str,
+        translated: Optional[str],
+        model_output: Optional[str] = None,
+        cache: bool = True,
+        provisional_for: Optional[str] = None,
+    ) -> Dict[str, Any]:
+
+        """
+        Compress, sanity-check and cache a model/API output (None = all failed).
+
+        Args:
+            model_output: raw text of the single decoder pass that produced
+                ``translated``; returned as 'model_output' (never cached) so a
+                speculative caller can force exactly what the decoder emitted
+            cache: False for prefix-forced output, which is not the plain
+                translation of the text
+            provisional_for: preferred model id when a stand-in model produced
+                ``translated``; cached briefly and kept out of the fuzzy memory
+        """
+        translation_failed = translated is None
+        if translation_failed:
+            safe_print(f"[WARN] All translation methods failed, returning original text", flush=True)
+            translated = normalized_text
+
+        translated = self._compress_tactical_output(
+            translated,
+            self.target_language,
+        )
+
+        if self._is_bad_callout_translation(original_text, translated):
+            fallback = (
+                self._resolve_gaming_callout(original_text, self.target_language)
+                or self._resolve_gaming_callout(
+                    normalized_text, self.target_language
+                )
+                or normalized_text
+            )
+            safe_print(
+                f"[WARN] Bad callout translation {translated!r} -> {fallback!r}",
+                flush=True,
+            )
+            self._record_pair_outcome(source_language, "rejected")
+            translated = fallback
+            rejected = True
+        else:
+            rejected = False
+
+        result = {
+            "translated_text": translated,
+            "source_language": source_language or "unknown",
+            "target_language": self.target_language
+        }
+
+        # Cache result
+        if cache:
             with self.cache_lock:
                 self.translation_cache[cache_key] = result
+                if provisional_for:
+                    self._provisional_cache[cache_key] = (
+                        provisional_for, time.monotonic() + _PROVISIONAL_CACHE_TTL_S
+                    )
+                else:
+                    self._provisional_cache.pop(cache_key, None)
+        # Fuzzy hits must never serve a fallback, an untranslated passthrough
+        # or a stand-in model's output
+        remember = (
+            not (translation_failed or rejected or provisional_for)
+            and translated not in (original_text, normalized_text)
+        )
+        if self.translation_memory is not None and remember and cache:
+            self.translation_memory.add(
+                normalized_text, source_language, self.target_language, result
+            )
+
+        if model_output and not (translation_failed or rejected):
+            return {**result, "model_output": model_output}
+        return result
+
+    def dedup_stats(self) -> Dict[str, int]:
+
+        """How many concurrent identical translations were served by one run."""
+        return self._inflight.stats()
+
+    def _record_pair_outcome(self, source_language: Optional[str], outcome: str) -> None:
+
+        if self.pair_router is not None:
+            self.pair_router.record_outcome(source_language, self.target_language, outcome)
+
+    def pair_report(self) -> Dict[str, Any]:
+
+        """Per-pair latency/quality report and loaded-model inventory."""
+        if self.pair_router is None:
+            report = {"enabled": False}
+        else:
+            report = self.pair_router.report()
+            report["enabled"] = True
+            with self._stats_lock:
+                report["generation"] = dict(self.generation_stats)
+                report["segmentation"] = dict(self.segment_stats)
+        if self.translation_memory is not None:
+            report["translation_memory"] = self.translation_memory.stats()
+        if self.learned_preferences is not None:
+            report["learned_preferences"] = self.learned_preferences.stats()
+        if self.language_identifier is not None:
+            stats = dict(self.language_id_stats)
+            stats["backend"] = self.language_identifier.backend
+            stats["detect_ms"] = round(stats["detect_ms"], 3)
+            report["language_id"] = stats
+        return report
+
+    def _generation_budget(self, input_tokens: int) -> Dict[str, Any]:
+
+        """Decode limits for an input of ``input_tokens`` source tokens."""
+        max_new_tokens = min(
+            _MAX_OUTPUT_TOKENS,
+            int(math.ceil(input_tokens * _OUTPUT_LENGTH_RATIO)) + _OUTPUT_LENGTH_SLACK,
+        )
+        num_beams = 1 if input_tokens <= _SHORT_INPUT_TOKENS else _LONG_INPUT_BEAMS
+        return {
+            "max_new_tokens": max_new_tokens,
+            "num_beams": num_beams,
+            "deadline_s": self.generation_deadline_s,
+        }
+
+    def _record_generation(self, budget: Dict[str, Any], output_tokens: int, elapsed: float) -> None:
+
+        deadline_hit = elapsed >= budget["deadline_s"]
+        with self._stats_lock:
+            stats = self.generation_stats
+            stats["requests"] += 1
+            if budget["num_beams"] == 1:
+                stats["greedy"] += 1
+            if output_tokens >= budget["max_new_tokens"]:
+                stats["length_capped"] += 1
+            if deadline_hit:
+                stats["deadline_hits"] += 1
+        if deadline_hit:
+            safe_print(
+                f"[WARN] Translation hit {budget['deadline_s'] * 1000:.0f} ms deadline; "
+                f"returning best hypothesis so far",
+                flush=True,
+            )
+
+    def _generate_with_entry(
+        self, entry: Dict[str, Any], text: str, target_prefix: Optional[str] = None
+    ) -> Optional[str]:
+
+        """Run one loaded model entry (fp32 MarianMT or int8 CTranslate2) within budget."""
+        tokenizer = entry["tokenizer"]
+        token_cache = entry.get("token_cache")
+        start = time.perf_counter()
+        prefix_ids = (
+            list(tokenizer(text_target=target_prefix, add_special_tokens=False)["input_ids"])
+            if target_prefix
+            else []
+        )
+
+        if entry.get("backend") == "ctranslate2":
+            from ctranslate2_backend import translate_with_entry
+
+            if token_cache is not None:
+                input_ids = token_cache.ids(text)
+            else:
+                input_ids = tokenizer.encode(text, truncation=True, max_length=512)
+            tokenized = time.perf_counter()
+            budget = self._generation_budget(len(input_ids))
+            decoded, output_tokens = translate_with_entry(
+                entry,
+                text,
+                max_decoding_length=budget["max_new_tokens"],
+                beam_size=budget["num_beams"],
+                deadline_s=budget["deadline_s"],
+                input_ids=input_ids,
+                target_prefix_ids=prefix_ids,
+            )
+            done = time.perf_counter()
+            self._record_generation(budget, output_tokens, done - start)
+            self._record_phases(tokenized - start, done - tokenized, 0.0)
+            return decoded
+
+        if torch is None:
+            return None
+
+        model = entry["model"]
+        device = entry["device"]
+
+        if token_cache is not None:
+            # Cached input_ids already on the model device + a sliced, preallocated mask
+            inputs, input_tokens = token_cache.inputs(text)
+        else:
+            inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True, max_length=512)
+            inputs = {k: v.to(device) for k, v in inputs.items()}
+            input_tokens = int(inputs["input_ids"].shape[-1])
+        if prefix_ids:
+            # Decoder continues after the forced prefix instead of regenerating it
+            start_id = model.config.decoder_start_token_id
+            inputs = dict(
+                inputs,
+                decoder_input_ids=torch.tensor([[start_id] + prefix_ids], device=device),
+            )
+        tokenized = time.perf_counter()
+        budget = self._generation_budget(input_tokens)
+
+        with torch.no_grad():
+            # max_time stops decoding at the deadline; beam search then
+            # finalizes and returns the best hypothesis found so far.
+            translated_tokens = model.generate(
+                **inputs,
+                max_new_tokens=budget["max_new_tokens"],
+                num_beams=budget["num_beams"],
+                early_stopping=budget["num_beams"] > 1,
+                max_time=budget["deadline_s"],
+            )
+        generated = time.perf_counter()
+
+        decoded = tokenizer.decode(translated_tokens[0], skip_special_tokens=True)
+        done = time.perf_counter()
+        self._record_generation(
+            budget, int(translated_tokens.shape[-1]) - 1, generated - start
+        )
+        self._record_phases(tokenized - start, generated - tokenized, done - generated)
+        return decoded
+
+    def _translate_segments(self, entry: Dict[str, Any], segments: list) -> Optional[str]:
+
+        """
+        Translate segments of one long input and join them back in order.
+
+        Segments already translated by this model come from the segment
+        cache; the rest run as padded batches of up to _SEGMENT_BATCH_SIZE.
+        """
+        model_key = entry.get("model_id") or str(id(entry))
+        outputs: Dict[str, str] = {}
+        with self.cache_lock:
+            for segment in segments:
+                cached = self._segment_cache.get((model_key, segment))
+                if cached is not None:
+                    self._segment_cache.move_to_end((model_key, segment))
+                    outputs[segment] = cached
+        missing = list(dict.fromkeys(s for s in segments if s not in outputs))
+
+        for i in range(0, len(missing), _SEGMENT_BATCH_SIZE):
+            batch = missing[i:i + _SEGMENT_BATCH_SIZE]
+            decoded = self._generate_batch_with_entry(entry, batch)
+            if decoded is None:
+                return None
+            with self._stats_lock:
+                self.segment_stats["batches"] += 1
+            with self.cache_lock:
+                for segment, output in zip(batch, decoded):
+                    outputs[segment] = output
+                    self._segment_cache[(model_key, segment)] = output
+                while len(self._segment_cache) > _SEGMENT_CACHE_SIZE:
+                    self._segment_cache.popitem(last=False)
+
+        with self._stats_lock:
+            self.segment_stats["segmented"] += 1
+            self.segment_stats["segments"] += len(segments)
+            self.segment_stats["cache_hits"] += sum(1 for s in segments if s not in missing)
+        return join_segments([outputs[s] for s in segments], self.target_language)
+
+    def _generate_batch_with_entry(self, entry: Dict[str, Any], texts: list) -> Optional[list]:
+
+        """_generate_with_entry for several segments in one padded batch."""
+        tokenizer = entry["tokenizer"]
+        token_cache = entry.get("token_cache")
+        start = time.perf_counter()
+
+        if entry.get("backend") == "ctranslate2":
+            from ctranslate2_backend import translate_batch_with_entry
+
+            input_ids = [
+                token_cache.ids(text) if token_cache is not None
+                else tokenizer.encode(text, truncation=True, max_length=512)
+                for text in texts
+            ]
+            tokenized = time.perf_counter()
+            budget = self._generation_budget(max(len(ids) for ids in input_ids))
+            results = translate_batch_with_entry(
+                entry,
+                input_ids,
+                max_decoding_length=budget["max_new_tokens"],
+                beam_size=budget["num_beams"],
+                deadline_s=budget["deadline_s"],
+            )
+            done = time.perf_counter()
+            self._record_generation(budget, max(n for _text, n in results), done - start)
+            self._record_phases(tokenized - start, done - tokenized, 0.0)
+            return [text for text, _n in results]
+
+        if torch is None:
+            return None
+
+        model = entry["model"]
+        inputs = tokenizer(texts, return_tensors="pt", padding=True, truncation=True, max_length=512)
+        inputs = {k: v.to(entry["device"]) for k, v in inputs.items()}
+        tokenized = time.perf_counter()
+        budget = self._generation_budget(int(inputs["attention_mask"].sum(dim=1).max()))
+
+        with torch.no_grad():
+            translated_tokens = model.generate(
+                **inputs,
+                max_new_tokens=budget["max_new_tokens"],
+                num_beams=budget["num_beams"],
+                early_stopping=budget["num_beams"] > 1,
+                max_time=budget["deadline_s"],
+            )
+        generated = time.perf_counter()
+
+        decoded = tokenizer.batch_decode(translated_tokens, skip_special_tokens=True)
+        done = time.perf_counter()
+        self._record_generation(
+            budget, int(translated_tokens.shape[-1]) - 1, generated - start
+        )
+        self._record_phases(tokenized - start, generated - tokenized, done - generated)
+        return decoded
+
+    def _record_phases(self, tokenize_s: float, generate_s: float, decode_s: float) -> None:
+
+        """Cumulative per-phase time, reported under /translation/pairs generation."""
+        with self._stats_lock:
+            stats = self.generation_stats
+            stats["tokenize_ms"] = round(stats["tokenize_ms"] + tokenize_s * 1000.0, 3)
+            stats["generate_ms"] = round(stats["generate_ms"] + generate_s * 1000.0, 3)
+            stats["decode_ms"] = round(stats["decode_ms"] + decode_s * 1000.0, 3)
+
+    def _streaming_entry(self, source_language: Optional[str]) -> Optional[Dict[str, Any]]:
+
+        """Loaded transformers/CTranslate2 entry for this pair, or None (EasyNMT, API, not loaded)."""
+        if self.model_type != "local" or not self._model_loaded:
+            return None
+        if not isinstance(self.local_translator, dict) or "model" not in self.local_translator:
+            return None
+        if self.pair_router is not None:
+            return self.pair_router.get(source_language, self.target_language)
+        return self.local_translator
+
+    def _stream_with_entry(self, entry: Dict[str, Any], text: str) -> Iterator[str]:
+
+        """
+        Greedy-decode ``text`` with a loaded entry, yielding the decoded output so far.
+
+        Streaming cannot be combined with beam search, so streamed requests
+        always decode greedily; the length budget and deadline still apply.
+        """
+        tokenizer = entry["tokenizer"]
+        token_cache = entry.get("token_cache")
+        start = time.perf_counter()
+
+        if entry.get("backend") == "ctranslate2":
+            from ctranslate2_backend import stream_with_entry
+
+            if token_cache is not None:
+                input_ids = token_cache.ids(text)
+            else:
+                input_ids = tokenizer.encode(text, truncation=True, max_length=512)
+            budget = dict(self._generation_budget(len(input_ids)), num_beams=1)
+            steps = 0
+            for decoded in stream_with_entry(
+                entry,
+                input_ids,
+                max_decoding_length=budget["max_new_tokens"],
+                deadline_s=budget["deadline_s"],
+            ):
+                steps += 1
+                yield decoded
+            self._record_generation(budget, steps, time.perf_counter() - start)
+            return
+
+        if torch is None:
+            return
+        from transformers import TextIteratorStreamer
 
-            return result
+        if token_cache is not None:
+            inputs, input_tokens = token_cache.inputs(text)
+        else:
+            inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True, max_length=512)
+            inputs = {k: v.to(entry["device"]) for k, v in inputs.items()}
+            input_tokens = int(inputs["input_ids"].shape[-1])
+        budget = dict(self._generation_budget(input_tokens), num_beams=1)
+        streamer = TextIteratorStreamer(
+            tokenizer, skip_special_tokens=True, timeout=budget["deadline_s"] + 5.0
+        )
+        errors = []
+
+        def run_generate():
+
+            try:
+                with torch.no_grad():
+                    entry["model"].generate(
+                        **inputs,
+                        streamer=streamer,
+                        max_new_tokens=budget["max_new_tokens"],
+                        num_beams=1,
+                        max_time=budget["deadline_s"],
+                    )
+            except Exception as e:
+                errors.append(e)
+                streamer.end()
+
+        worker = threading.Thread(target=run_generate, name="translation-stream", daemon=True)
+        worker.start()
+        decoded = ""
+        for piece in streamer:
+            decoded += piece
+            yield decoded
+        worker.join()
+        if errors:
+            raise errors[0]
+        # The streamer hands out text, not token ids, so length capping is not counted here
+        self._record_generation(budget, 0, time.perf_counter() - start)
+
+    def _compress_incrementally(self, outputs: Iterable[str]) -> Iterator[Dict[str, Any]]:
+
+        """
+        Turn growing raw model output into overlay updates on word boundaries.
+
+        Only completed words are compressed (a half-decoded word could still
+        change), and because compression may rewrite earlier words ("on the
+        left side" -> "left") every event carries the full text so far;
+        ``append`` tells subscribers whether it merely extends the last one.
+        """
+        emitted = ""
+        for raw in outputs:
+            boundary = max(raw.rfind(" "), raw.rfind("\n"))
+            if boundary <= 0:
+                continue
+            compressed = self._compress_tactical_output(raw[:boundary], self.target_language)
+            if compressed and compressed != emitted:
+                yield {
+                    "type": "partial",
+                    "text": compressed,
+                    "append": compressed.startswith(emitted),
+                }
+                emitted = compressed
+
+    def translate_stream(
+        self,
+        text: str,
+        source_language: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Translate text, yielding partial output while the local model decodes
+
+        Args:
+            text: Text to translate
+            source_language: Source language code (None for auto-detect)
+
+        Yields:
+            {'type': 'partial', 'text', 'append'} events with the compressed
+            output of every completed word, then one {'type': 'final', ...}
+            event carrying the dict translate() would return. Short-circuit
+            results, EasyNMT and the API fallback only produce the final event.
+        """
+        self._last_live_request = time.monotonic()
+        source_language = self._resolve_source_language(text, source_language)
+        early, original_text, normalized_text, cache_key = self._prepare_translation(
+            text, source_language
+        )
+        if early is not None:
+            yield {"type": "final", **early}
+            return
+
+        def translate_uncached():
+
+            result, _shared = self._inflight.do(
+                cache_key,
+                lambda: self._translate_uncached(
+                    original_text, normalized_text, source_language, cache_key
+                ),
+            )
+            result = {k: v for k, v in result.items() if k != "model_output"}
+            return {"type": "final", **result}
+
+        entry = self._streaming_entry(source_language)
+        if entry is None:
+            yield translate_uncached()
+            return
+
+        # Segment by segment, the way translate() splits it, so long
+        # multi-sentence utterances stream too instead of one truncated sequence
+        segments = split_segments(normalized_text, self.segment_max_chars) or [normalized_text]
+        model_key = entry.get("model_id") or str(id(entry))
+        standin_for = (
+            self.pair_router.pending_preferred(source_language, self.target_language)
+            if self.pair_router is not None
+            else None
+        )
+        outputs = []
+
+        def collect():
 
+            done = []
+            for segment in segments:
+                with self.cache_lock:
+                    decoded = self._segment_cache.get((model_key, segment))
+                if decoded is None:
+                    decoded = ""
+                    for decoded in self._stream_with_entry(entry, segment):
+                        outputs.append(join_segments(done + [decoded], self.target_language))
+                        yield outputs[-1]
+                done.append(decoded)
+                outputs.append(join_segments(done, self.target_language))
+                yield outputs[-1]
+
+        start = time.perf_counter()
+        try:
+            yield from self._compress_incrementally(collect())
         except Exception as e:
-            safe_print(f"[ERROR] Error translating: {e}", flush=True)
-            return {
-                "translated_text": text,
-                "source_language": source_language or "unknown",
-                "target_language": self.target_language,
-                "error": str(e)
-            }
+            safe_print(f"[WARN] Streaming translation failed ({e}); translating in one shot", flush=True)
+            yield translate_uncached()
+            return
 
-    def _translate_with_local(self, text: str, source_language: Optional[str] = None) -> Optional[str]:
+        translated = outputs[-1].strip() if outputs else ""
+        if not translated or translated == original_text:
+            # Same fallback chain as translate() (API when enabled)
+            yield translate_uncached()
+            return
+        if self.pair_router is not None:
+            self.pair_router.record_latency(
+                source_language,
+                self.target_language,
+                entry.get("model_id"),
+                time.perf_counter() - start,
+            )
+        result = self._finish_translation(
+            original_text, normalized_text, source_language, cache_key, translated,
+            provisional_for=standin_for,
+        )
+        yield {"type": "final", **result}
+
+    def _translate_with_local(
+        self,
+        text: str,
+        source_language: Optional[str] = None,
+        target_prefix: Optional[str] = None,
+    ) -> Optional[str]:
 
         """Translate using local model"""
         if not self.local_translator or not self._model_loaded:
@@ -494,20 +1448,35 @@ class TranslationService:
 
             # Transformers
             elif isinstance(self.local_translator, dict) and "model" in self.local_translator:
-                if torch is None:
+                entry = self.local_translator
+                if self.pair_router is not None:
+                    # Pair model when loaded; otherwise the mul model for the
+                    # current target while the pair model loads in background.
+                    entry = self.pair_router.get(source_language, self.target_language)
+                    if entry is None:
+                        safe_print(
+                            f"[WARN] No translation model loaded yet for {source_language}->{self.target_language}",
+                            flush=True,
+                        )
+                        return None
+
+                # A forced prefix belongs to the whole output, so never segment then
+                segments = [text] if target_prefix else split_segments(text, self.segment_max_chars)
+                start = time.perf_counter()
+                if len(segments) > 1:
+                    decoded = self._translate_segments(entry, segments)
+                else:
+                    decoded = self._generate_with_entry(entry, text, target_prefix)
+                if decoded is None:
                     return None
-
-                tokenizer = self.local_translator["tokenizer"]
-                model = self.local_translator["model"]
-                device = self.local_translator["device"]
-
-                inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True, max_length=512)
-                inputs = {k: v.to(device) for k, v in inputs.items()}
-
-                with torch.no_grad():
-                    translated_tokens = model.generate(**inputs, max_length=512)
-
-                return tokenizer.decode(translated_tokens[0], skip_special_tokens=True)
+                if self.pair_router is not None:
+                    self.pair_router.record_latency(
+                        source_language,
+                        self.target_language,
+                        entry.get("model_id"),
+                        time.perf_counter() - start,
+                    )
+                return decoded
 
         except Exception as e:
             safe_print(f"[ERROR] Local translation error: {e}", flush=True)
@@ -521,16 +1490,13 @@ class TranslationService:
         if not self.fallback_translator:
             return None
 
+        from api_translation_client import ApiTranslationError, CircuitOpenError
+
+        if source_language in ("auto", "unknown"):
+            source_language = None
         try:
-            # If source language is specified and different from target, use it
-            if source_language and source_language != "auto" and source_language != "unknown":
-                # Recreate translator with specific source language
-                from deep_translator import GoogleTranslator
-                translator = GoogleTranslator(source=source_language, target=self.target_language)
-                result = translator.translate(text)
-            else:
-                # Use auto-detect
-                result = self.fallback_translator.translate(text)
+            translator = self.fallback_translator.translator(source_language, self.target_language)
+            result = translator.translate(text)
 
             # Validate result
             if result and result.strip() and result != text:
@@ -545,25 +1511,42 @@ class TranslationService:
                 safe_print(f"[WARN] API translation returned empty or invalid result", flush=True)
                 return None
 
+        except CircuitOpenError:
+            # Endpoint is failing; skip it quietly until the breaker half-opens
+            return None
+        except ApiTranslationError as e:
+            safe_print(f"[WARN] API translation failed: {e}", flush=True)
+            return None
         except Exception as e:
             safe_print(f"[ERROR] API translation error: {e}", flush=True)
             import traceback
             safe_print(f"[ERROR] Traceback: {traceback.format_exc()}", flush=True)
             return None
 
+    def api_status(self) -> Dict[str, Any]:
+
+        """Connection-pool and circuit-breaker stats for the API fallback."""
+        if self.fallback_translator is None:
+            return {"enabled": False}
+        status = self.fallback_translator.stats()
+        status["enabled"] = True
+        return status
+
     def set_target_language(self, language_code: str):
 
         """Change target language"""
         if language_code != self.target_language:
+            previous = self.target_language
             self.target_language = language_code
             with self.cache_lock:
                 self.translation_cache.clear()
+                self._provisional_cache.clear()
+
+            if self.pair_router is not None:
+                from translation_router import multi_source_model
+
+                self.pair_router.unpin(multi_source_model(previous))
+                default_model = multi_source_model(self.target_language)
+                self.pair_router.pin(default_model)
+                self.pair_router.prefetch(default_model)
 
-            # Reinitialize API translator with new target language
-            try:
-                from deep_translator import GoogleTranslator
-                self.fallback_translator = GoogleTranslator(source='auto', target=self.target_language)
-                safe_print(f"[OK] API translator updated (target: {self.target_language})", flush=True)
-            except Exception as e:
-                safe_print(f"[WARN] Could not update API translator: {e}", flush=True)
-                self.fallback_translator = None
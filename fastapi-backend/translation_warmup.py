@@ -0,0 +1,211 @@
+"""
+Background warm-up of the translation cache with the tactical vocabulary.
+
+After a launch ``translation_cache`` is empty, so the first callouts of a
+match pay full model latency. Once the model is ready, TranslationWarmup
+translates a known phrase list into the cache:
+
+- ``warmup_phrases`` from data/tactical_terms.json (per source language),
+- the demo callouts in data/demo_callouts.json (scripts/generate_demo_callouts.py),
+- the most frequent phrases this user actually translated (PhraseHistory).
+
+It runs on one low-priority thread, one phrase at a time with a minimum
+interval, backs off while live requests are running or arrived recently, and
+can be cancelled at any point.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+DEMO_CALLOUTS_PATH = DATA_DIR / "demo_callouts.json"
+HISTORY_FILENAME = "translation_history.json"
+
+DEFAULT_HISTORY_PHRASES = 200
+DEFAULT_MIN_INTERVAL_MS = 100.0
+DEFAULT_IDLE_MS = 750.0
+
+
+class PhraseHistory:
+
+    """Frequency count of translated (text, source language) pairs, persisted as JSON."""
+
+    def __init__(self, path: Path, max_entries: int = 5000, save_every: int = 50) -> None:
+        self.path = Path(path)
+        self.max_entries = max(1, max_entries)
+        self.save_every = max(1, save_every)
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+        self._unsaved = 0
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"[WARN] Ignoring unreadable translation history {self.path}: {e}", flush=True)
+            return
+        for entry in data.get("phrases", []):
+            text = (entry.get("text") or "").strip()
+            if text:
+                self._counts[(text, entry.get("language"))] = int(entry.get("count", 1))
+
+    def record(self, text: str, source_language: Optional[str]) -> None:
+        text = (text or "").strip()
+        if not text:
+            return
+        if source_language in ("auto", "unknown"):
+            source_language = None
+        with self._lock:
+            self._counts[(text, source_language)] += 1
+            if len(self._counts) > self.max_entries:
+                # Keep the most frequent 80% so pruning is not paid per record
+                self._counts = Counter(dict(self._counts.most_common(int(self.max_entries * 0.8))))
+            self._unsaved += 1
+            due = self._unsaved >= self.save_every
+        if due:
+            self.save()
+
+    def most_common(self, n: int) -> List[Tuple[str, Optional[str]]]:
+        with self._lock:
+            return [key for key, _count in self._counts.most_common(n)]
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._unsaved:
+                return
+            phrases = [
+                {"text": text, "language": language, "count": count}
+                for (text, language), count in self._counts.most_common()
+            ]
+            self._unsaved = 0
+        try:
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"phrases": phrases}, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(self.path)
+        except Exception as e:
+            print(f"[WARN] Could not save translation history: {e}", flush=True)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._counts)
+
+
+def collect_warmup_phrases(
+    tactical_rules: Dict[str, Any],
+    history: Optional[PhraseHistory] = None,
+    history_phrases: int = DEFAULT_HISTORY_PHRASES,
+    demo_callouts_path: Path = DEMO_CALLOUTS_PATH,
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    Phrase list to warm, most valuable first and without duplicates.
+
+    Returns:
+        [(text, source language or None), ...]
+    """
+    phrases: List[Tuple[str, Optional[str]]] = []
+    if history is not None and history_phrases > 0:
+        phrases.extend(history.most_common(history_phrases))
+
+    for language, texts in (tactical_rules.get("warmup_phrases") or {}).items():
+        phrases.extend((text, language) for text in texts)
+
+    try:
+        demo = json.loads(Path(demo_callouts_path).read_text(encoding="utf-8"))
+        phrases.extend((text, demo.get("language")) for text in demo.get("callouts", {}).values())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"[WARN] Could not read demo callouts for warm-up: {e}", flush=True)
+
+    seen = set()
+    unique = []
+    for text, language in phrases:
+        key = (text.strip().lower(), language)
+        if text.strip() and key not in seen:
+            seen.add(key)
+            unique.append((text.strip(), language))
+    return unique
+
+
+class TranslationWarmup:
+
+    """Low-priority, rate-limited, cancellable cache fill on a daemon thread."""
+
+    def __init__(
+        self,
+        service: Any,
+        phrases: List[Tuple[str, Optional[str]]],
+        min_interval_ms: float = DEFAULT_MIN_INTERVAL_MS,
+        idle_ms: float = DEFAULT_IDLE_MS,
+    ) -> None:
+        self.service = service
+        self.phrases = list(phrases)
+        self.min_interval_s = max(0.0, min_interval_ms / 1000.0)
+        self.idle_s = max(0.0, idle_ms / 1000.0)
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.state = "pending"
+        self.stats = {"total": len(self.phrases), "translated": 0, "already_cached": 0, "failed": 0, "yielded": 0}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="translation-warmup", daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def _wait_for_idle(self) -> bool:
+        """Block while live translations run; False once cancelled."""
+        while not self._cancel.is_set():
+            idle_for = self.service.seconds_since_live_request()
+            if self.service.dedup_stats()["in_flight"] == 0 and idle_for >= self.idle_s:
+                return True
+            self.stats["yielded"] += 1
+            self._cancel.wait(max(0.05, self.idle_s - idle_for))
+        return False
+
+    def _run(self) -> None:
+        self.state = "running"
+        self.started_at = time.monotonic()
+        print(f"[INFO] Translation warm-up: {len(self.phrases)} phrases", flush=True)
+        for text, language in self.phrases:
+            if not self._wait_for_idle():
+                break
+            try:
+                outcome = self.service.warm(text, language)
+            except Exception as e:
+                print(f"[WARN] Warm-up translation failed for {text!r}: {e}", flush=True)
+                outcome = "failed"
+            self.stats[outcome] += 1
+            if self._cancel.wait(self.min_interval_s):
+                break
+        self.finished_at = time.monotonic()
+        self.state = "cancelled" if self._cancel.is_set() else "done"
+        print(
+            f"[INFO] Translation warm-up {self.state}: {self.stats['translated']} translated, "
+            f"{self.stats['already_cached']} already cached in {self.finished_at - self.started_at:.1f}s",
+            flush=True,
+        )
+
+    def status(self) -> Dict[str, Any]:
+        status: Dict[str, Any] = {"state": self.state, **self.stats}
+        if self.started_at is not None:
+            end = self.finished_at if self.finished_at is not None else time.monotonic()
+            status["elapsed_s"] = round(end - self.started_at, 2)
+        return status
@@ -0,0 +1,171 @@
+"""
+Cache of synthesized TTS audio.
+
+Outbound team callouts repeat constantly ("Rush B", "One short"), and every
+synthesis costs a pyttsx3 engine round trip through a temp WAV or a gTTS
+network request plus MP3 decode. Synthesized mono float32 PCM is kept in an
+in-memory LRU (bounded in bytes) backed by ``.npz`` files on disk, keyed on
+(normalized text, language, rate, engine, voice, sample rate), so a repeated
+callout is ready in well under a millisecond from memory and a few from disk.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_MEMORY_MB = 64.0
+DEFAULT_DISK_MB = 256.0
+
+_SPACE_RE = re.compile(r"\s+")
+
+
+def cache_key(
+    text: str,
+    language: str,
+    rate: float,
+    engine: str,
+    voice: Optional[str],
+    sample_rate: Optional[int],
+) -> str:
+    """Stable key; text is case-sensitive (engines read "OK" and "ok" differently)."""
+    normalized = _SPACE_RE.sub(" ", (text or "").strip())
+    parts = [normalized, language, round(float(rate), 3), engine, voice or "default", sample_rate or 0]
+    return hashlib.sha1(json.dumps(parts, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class PcmCache:
+
+    """Byte-bounded memory LRU over a byte-bounded directory of .npz files."""
+
+    def __init__(
+        self,
+        disk_dir: Optional[Path] = None,
+        memory_mb: float = DEFAULT_MEMORY_MB,
+        disk_mb: float = DEFAULT_DISK_MB,
+    ) -> None:
+        self.max_memory_bytes = int(memory_mb * 1024 * 1024)
+        self.max_disk_bytes = int(disk_mb * 1024 * 1024)
+        self.disk_dir = Path(disk_dir) if disk_dir is not None and disk_mb > 0 else None
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[np.ndarray, int]]" = OrderedDict()
+        self._memory_bytes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.npz"  # type: ignore[operator]
+
+    def _remember(self, key: str, entry: Tuple[np.ndarray, int]) -> None:
+        """Insert into the memory LRU; caller holds the lock."""
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous[0].nbytes
+        if entry[0].nbytes > self.max_memory_bytes:
+            return
+        self._memory[key] = entry
+        self._memory_bytes += entry[0].nbytes
+        while self._memory_bytes > self.max_memory_bytes and self._memory:
+            _key, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted[0].nbytes
+
+    def _get(self, key: str) -> Optional[Tuple[np.ndarray, int]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return entry
+        if self.disk_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                entry = (data["samples"], int(data["sample_rate"]))
+            os.utime(path)  # disk eviction is least recently used
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[WARN] Dropping unreadable TTS cache file {path.name}: {e}", flush=True)
+            path.unlink(missing_ok=True)
+            return None
+        entry[0].setflags(write=False)
+        with self._lock:
+            self.disk_hits += 1
+            self._remember(key, entry)
+        return entry
+
+    def get(self, *keys: str) -> Optional[Tuple[np.ndarray, int]]:
+        """
+        First cached entry among ``keys`` (e.g. one key per candidate engine).
+
+        Returns:
+            (read-only samples, sample rate), or None (counted as one miss)
+        """
+        for key in keys:
+            entry = self._get(key)
+            if entry is not None:
+                return entry
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Store ``samples``; returns the read-only cached array."""
+        samples = np.ascontiguousarray(samples, dtype=np.float32).reshape(-1)
+        samples.setflags(write=False)
+        with self._lock:
+            self._remember(key, (samples, int(sample_rate)))
+        if self.disk_dir is not None:
+            path = self._path(key)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            try:
+                with open(tmp, "wb") as f:
+                    np.savez(f, samples=samples, sample_rate=np.int32(sample_rate))
+                tmp.replace(path)
+                self._trim_disk()
+            except Exception as e:
+                tmp.unlink(missing_ok=True)
+                print(f"[WARN] Could not write TTS cache file: {e}", flush=True)
+        return samples
+
+    def _trim_disk(self) -> None:
+        files = []
+        total = 0
+        for path in self.disk_dir.glob("*.npz"):  # type: ignore[union-attr]
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        if total <= self.max_disk_bytes:
+            return
+        for _mtime, size, path in sorted(files):
+            path.unlink(missing_ok=True)
+            total -= size
+            if total <= self.max_disk_bytes:
+                break
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_entries": len(self._memory),
+                "memory_mb": round(self._memory_bytes / (1024 * 1024), 2),
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "disk": self.disk_dir is not None,
+            }
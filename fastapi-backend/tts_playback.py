@@ -0,0 +1,149 @@
+"""
+Sentence-streamed TTS playback.
+
+A callout is synthesized one sentence (or clause) at a time and each piece is
+queued on the device's already-open output stream, so the first sentence
+plays while the rest is still being synthesized. Time-to-first-audio (request
+to first samples mixed into the stream, plus the device's estimated output
+latency) is returned per utterance and summarized by ``stats()``.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from audio_output import AudioOutputPlayer, PlaybackVoice
+from tts_service import TTSService
+
+_METRIC_WINDOW = 200
+# Extra wait past the queued audio length before giving up on a device
+_DRAIN_GRACE_S = 5.0
+_CANCEL_POLL_S = 0.02
+
+
+class StreamedSpeaker:
+
+    """Plays TTSService.synthesize_segments() output on one or more devices."""
+
+    def __init__(self, tts: TTSService, player: AudioOutputPlayer) -> None:
+        self.tts = tts
+        self.player = player
+        self._lock = threading.Lock()
+        self._first_audio_ms: deque = deque(maxlen=_METRIC_WINDOW)
+        self.utterances = 0
+
+    def speak(
+        self,
+        text: str,
+        devices: List[Optional[int]],
+        language: str = "en",
+        rate: float = 1.0,
+        volume: float = 1.0,
+        sample_rate: Optional[int] = None,
+        voice: Optional[str] = None,
+        streamed: bool = True,
+        cancel: Optional[threading.Event] = None,
+    ) -> Dict[str, Any]:
+        """
+        Speak ``text`` on every device in ``devices`` (None = system default).
+
+        Args:
+            sample_rate: rate to synthesize at (the first device's native
+                rate); when None segments are resampled to each device
+            streamed: False synthesizes the whole text before playing it
+            cancel: set to stop synthesis and playback early (interrupted)
+
+        Returns:
+            Dict with samples, duration_s, segments, first_segment_ms,
+            time_to_first_audio_ms and interrupted
+        """
+        start = time.perf_counter()
+        outputs: List[PlaybackVoice] = []
+        total_samples = 0
+        duration_s = 0.0
+        segments = 0
+        first_segment_ms: Optional[float] = None
+        interrupted = False
+        if streamed:
+            pieces = self.tts.synthesize_segments(
+                text,
+                language=language,
+                rate=rate,
+                volume=volume,
+                target_sample_rate=sample_rate,
+                voice=voice,
+            )
+        else:
+            pieces = iter([
+                self.tts.synthesize(
+                    text,
+                    language=language,
+                    rate=rate,
+                    volume=volume,
+                    target_sample_rate=sample_rate,
+                    voice=voice,
+                )
+            ])
+        try:
+            # Voices are registered before synthesis; the devices play
+            # silence for them until the first segment arrives
+            outputs = [self.player.open_voice(device, sample_rate) for device in devices]
+            for samples, sr in pieces:
+                if cancel is not None and cancel.is_set():
+                    break
+                if first_segment_ms is None:
+                    first_segment_ms = (time.perf_counter() - start) * 1000.0
+                for output in outputs:
+                    output.write(samples, sr)
+                total_samples += int(samples.size)
+                duration_s += samples.size / float(sr)
+                segments += 1
+        except BaseException:
+            for output in outputs:
+                output.abort()
+            raise
+
+        deadline = time.perf_counter() + duration_s + _DRAIN_GRACE_S
+        for output in outputs:
+            output.close()
+        for output in outputs:
+            while not output.wait(_CANCEL_POLL_S):
+                if (cancel is not None and cancel.is_set()) or time.perf_counter() > deadline:
+                    break
+        if cancel is not None and cancel.is_set():
+            interrupted = True
+            for output in outputs:
+                output.abort()
+
+        started = [o.first_audio_at + o.output_latency_s for o in outputs if o.first_audio_at is not None]
+        first_audio_ms = (min(started) - start) * 1000.0 if started else None
+        with self._lock:
+            self.utterances += 1
+            if first_audio_ms is not None:
+                self._first_audio_ms.append(first_audio_ms)
+        return {
+            "samples": total_samples,
+            "duration_s": round(duration_s, 3),
+            "segments": segments,
+            "first_segment_ms": round(first_segment_ms, 2) if first_segment_ms is not None else None,
+            "time_to_first_audio_ms": round(first_audio_ms, 2) if first_audio_ms is not None else None,
+            "interrupted": interrupted,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            values = sorted(self._first_audio_ms)
+            utterances = self.utterances
+
+        def pct(p: float) -> Optional[float]:
+            if not values:
+                return None
+            return round(values[min(len(values) - 1, int(p * len(values)))], 2)
+
+        return {
+            "utterances": utterances,
+            "time_to_first_audio_ms_p50": pct(0.5),
+            "time_to_first_audio_ms_p95": pct(0.95),
+        }
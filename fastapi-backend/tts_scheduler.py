@@ -0,0 +1,294 @@
+"""
+Prioritized, cancellable TTS job queue.
+
+``/tts/speak`` used to hold a shared executor thread for synthesis plus the
+whole playback, and callouts fired in a burst played one after another long
+after they mattered. TtsScheduler owns one dedicated thread and a priority
+queue instead:
+
+- higher ``priority`` is spoken first, and interrupts lower-priority speech;
+- a job that waited longer than ``max_queue_age_ms`` is dropped as stale;
+- consecutive short queued phrases with the same voice settings are merged
+  into one utterance;
+- ``submit`` returns a job id immediately; ``status`` and ``cancel`` take it;
+- ``on_event("started" | "finished", job)`` is called from the playback
+  thread around each spoken utterance (merged jobs ride along in ``merged``).
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tts_playback import StreamedSpeaker
+
+DEFAULT_MAX_QUEUE_AGE_MS = 3000.0
+DEFAULT_MERGE_WINDOW_MS = 400.0
+DEFAULT_MERGE_MAX_CHARS = 60
+_JOB_HISTORY = 500
+
+QUEUED = "queued"
+SPEAKING = "speaking"
+DONE = "done"
+DROPPED = "dropped"
+MERGED = "merged"
+CANCELLED = "cancelled"
+INTERRUPTED = "interrupted"
+FAILED = "failed"
+
+
+class TtsJob:
+
+    """One /tts/speak request and its lifecycle."""
+
+    def __init__(
+        self,
+        job_id: str,
+        text: str,
+        devices: List[Optional[int]],
+        language: str,
+        rate: float,
+        volume: float,
+        sample_rate: Optional[int],
+        priority: int,
+        streamed: bool,
+        utterance_id: Optional[str] = None,
+    ) -> None:
+        self.job_id = job_id
+        self.text = text
+        self.devices = devices
+        self.language = language
+        self.rate = rate
+        self.volume = volume
+        self.sample_rate = sample_rate
+        self.priority = priority
+        self.streamed = streamed
+        self.utterance_id = utterance_id
+        self.created_at = time.perf_counter()
+        self.status = QUEUED
+        self.merged_into: Optional[str] = None
+        self.merged: List["TtsJob"] = []
+        self.error: Optional[str] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.cancel_event = threading.Event()
+
+    def voice_settings(self) -> Tuple[Any, ...]:
+        return (tuple(self.devices), self.language, self.rate, self.volume, self.sample_rate, self.streamed)
+
+    def age_ms(self) -> float:
+        return (time.perf_counter() - self.created_at) * 1000.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "utterance_id": self.utterance_id,
+            "status": self.status,
+            "priority": self.priority,
+            "text": self.text,
+            "age_ms": round(self.age_ms(), 1),
+            "merged_into": self.merged_into,
+            "error": self.error,
+            "result": self.result,
+        }
+
+
+class TtsScheduler:
+
+    """Single playback thread serving a priority queue of TtsJob."""
+
+    def __init__(
+        self,
+        speaker: StreamedSpeaker,
+        max_queue_age_ms: float = DEFAULT_MAX_QUEUE_AGE_MS,
+        merge_window_ms: float = DEFAULT_MERGE_WINDOW_MS,
+        merge_max_chars: int = DEFAULT_MERGE_MAX_CHARS,
+        on_event: Optional[Callable[[str, TtsJob], None]] = None,
+    ) -> None:
+        self.speaker = speaker
+        self.on_event = on_event
+        self.configure(max_queue_age_ms, merge_window_ms, merge_max_chars)
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[int, int, TtsJob]] = []
+        self._seq = itertools.count()
+        self._ids = itertools.count(1)
+        self._jobs: "OrderedDict[str, TtsJob]" = OrderedDict()
+        self._current: Optional[TtsJob] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self.counts: Dict[str, int] = {DONE: 0, DROPPED: 0, MERGED: 0, CANCELLED: 0, INTERRUPTED: 0, FAILED: 0}
+
+    def configure(
+        self,
+        max_queue_age_ms: float = DEFAULT_MAX_QUEUE_AGE_MS,
+        merge_window_ms: float = DEFAULT_MERGE_WINDOW_MS,
+        merge_max_chars: int = DEFAULT_MERGE_MAX_CHARS,
+    ) -> None:
+        """Update limits (0 disables stale dropping / merging)."""
+        self.max_queue_age_ms = float(max_queue_age_ms)
+        self.merge_window_ms = float(merge_window_ms)
+        self.merge_max_chars = int(merge_max_chars)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="tts-scheduler", daemon=True)
+            self._thread.start()
+
+    def submit(
+        self,
+        text: str,
+        devices: List[Optional[int]],
+        language: str = "en",
+        rate: float = 1.0,
+        volume: float = 1.0,
+        sample_rate: Optional[int] = None,
+        priority: int = 0,
+        streamed: bool = True,
+        utterance_id: Optional[str] = None,
+    ) -> str:
+        """
+        Queue an utterance without waiting for it.
+
+        Returns:
+            Job id for status() / cancel()
+        """
+        with self._cond:
+            job_id = f"tts-{next(self._ids)}"
+            job = TtsJob(
+                job_id, text, devices, language, rate, volume, sample_rate, priority, streamed, utterance_id
+            )
+            self._jobs[job_id] = job
+            while len(self._jobs) > _JOB_HISTORY:
+                self._jobs.popitem(last=False)
+            heapq.heappush(self._heap, (-priority, next(self._seq), job))
+            current = self._current
+            if current is not None and priority > current.priority:
+                current.cancel_event.set()
+            self._ensure_thread()
+            self._cond.notify()
+        return job_id
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._cond:
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job is not None else None
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job or stop it mid-utterance."""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None or job.status not in (QUEUED, SPEAKING):
+                return False
+            job.cancel_event.set()
+            if job.status == QUEUED:
+                self._finish(job, CANCELLED)
+            return True
+
+    def _finish(self, job: TtsJob, status: str) -> None:
+        """Record a terminal status; caller holds the lock."""
+        job.status = status
+        self.counts[status] = self.counts.get(status, 0) + 1
+
+    def _pop_runnable(self) -> Optional[TtsJob]:
+        """Highest-priority live job with mergeable followers folded in; caller holds the lock."""
+        while self._heap:
+            _neg, _seq, job = heapq.heappop(self._heap)
+            if job.status != QUEUED:
+                continue
+            if self.max_queue_age_ms > 0 and job.age_ms() > self.max_queue_age_ms:
+                self._finish(job, DROPPED)
+                continue
+            self._merge_followers(job)
+            return job
+        return None
+
+    def _merge_followers(self, job: TtsJob) -> None:
+        if self.merge_window_ms <= 0 or len(job.text) > self.merge_max_chars:
+            return
+        followers = sorted(
+            (entry for entry in self._heap if entry[2].status == QUEUED and entry[2].priority == job.priority),
+            key=lambda entry: entry[1],
+        )
+        last_created = job.created_at
+        for _neg, _seq, follower in followers:
+            if (
+                follower.voice_settings() != job.voice_settings()
+                or len(job.text) + 1 + len(follower.text) > self.merge_max_chars
+                or (follower.created_at - last_created) * 1000.0 > self.merge_window_ms
+            ):
+                break
+            job.text = f"{_terminated(job.text)} {follower.text}"
+            follower.merged_into = job.job_id
+            job.merged.append(follower)
+            self._finish(follower, MERGED)
+            last_created = follower.created_at
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                job = self._pop_runnable()
+                while job is None and not self._stopped:
+                    self._cond.wait()
+                    job = self._pop_runnable()
+                if self._stopped:
+                    return
+                job.status = SPEAKING
+                self._current = job
+            self._notify("started", job)
+            status = DONE
+            try:
+                job.result = self.speaker.speak(
+                    job.text,
+                    job.devices,
+                    language=job.language,
+                    rate=job.rate,
+                    volume=job.volume,
+                    sample_rate=job.sample_rate,
+                    streamed=job.streamed,
+                    cancel=job.cancel_event,
+                )
+                if job.result.get("interrupted"):
+                    status = INTERRUPTED
+                else:
+                    print(f"[TTS] Spoke {len(job.text)} chars ({job.language}) [{job.job_id}]", flush=True)
+            except Exception as e:
+                job.error = str(e)
+                status = FAILED
+                print(f"[TTS] Job {job.job_id} failed: {e}", flush=True)
+            with self._cond:
+                self._current = None
+                self._finish(job, status)
+            self._notify("finished", job)
+
+    def _notify(self, what: str, job: TtsJob) -> None:
+        if self.on_event is None:
+            return
+        try:
+            self.on_event(what, job)
+        except Exception as e:
+            print(f"[TTS] Job event handler failed: {e}", flush=True)
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            if self._current is not None:
+                self._current.cancel_event.set()
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "queued": sum(1 for _neg, _seq, job in self._heap if job.status == QUEUED),
+                "speaking": self._current.job_id if self._current is not None else None,
+                "max_queue_age_ms": self.max_queue_age_ms,
+                "merge_window_ms": self.merge_window_ms,
+                **self.counts,
+            }
+
+
+def _terminated(text: str) -> str:
+    """Ensure a sentence end so the merged text is still split per phrase."""
+    text = text.rstrip()
+    return text if text[-1:] in ".!?…。！？" else f"{text}."
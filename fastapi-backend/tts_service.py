@@ -1,35 +1,31 @@
 """
 Text-to-speech synthesis for outbound voice translation.
 
-Uses pyttsx3 (Windows SAPI) when available, gTTS + pydub as fallback for
-non-English or when pyttsx3 fails.
+Engines: the local SAPI/pyttsx3 voice through a long-lived worker
+(tts_worker.py, Windows only), espeak-ng in-process (espeak_engine.py, offline on every
+OS) and gTTS + pydub (network). ``tts.engine`` picks the preferred one;
+otherwise they are ordered by measured latency, and the next one is tried
+when an engine fails. Synthesized audio is cached (tts_cache.py), and
+callouts in the prebuilt voice pack (voice_pack.py) skip synthesis entirely.
 """
 from __future__ import annotations
 
 import io
-import os
-import sys
-import tempfile
+import shutil
+import subprocess
 import threading
-from typing import Optional, Tuple
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 
-try:
-    import soundfile as sf
-
-    _SOUNDFILE_AVAILABLE = True
-except ImportError:
-    sf = None  # type: ignore
-    _SOUNDFILE_AVAILABLE = False
-
-try:
-    import pyttsx3
-
-    _PYTTSX3_AVAILABLE = True
-except ImportError:
-    pyttsx3 = None  # type: ignore
-    _PYTTSX3_AVAILABLE = False
+from resampling import pcm_to_float32, resample
+from espeak_engine import EspeakEngine, espeak_available
+from segmentation import split_segments
+from tts_cache import DEFAULT_DISK_MB, DEFAULT_MEMORY_MB, PcmCache, cache_key
+from tts_worker import TtsWorker, worker_available
+from voice_pack import VoicePack
 
 try:
     from gtts import gTTS
@@ -41,7 +37,18 @@ except ImportError:
     AudioSegment = None  # type: ignore
     _GTTS_AVAILABLE = False
 
-_engine_lock = threading.Lock()
+# Sentences longer than this are spoken clause by clause, so the first chunk
+# of a long callout is short and reaches the speakers early.
+STREAM_SEGMENT_CHARS = 120
+
+# Typical per-callout latency before an engine has been measured; keeps local
+# engines ahead of the network one until real numbers exist.
+_PRIOR_LATENCY_MS = {"pyttsx3": 60.0, "espeak": 80.0, "gtts": 600.0}
+_LATENCY_EWMA_ALPHA = 0.2
+# Counted against an engine each time it fails, so a broken engine sinks
+_FAILURE_PENALTY_MS = 5000.0
+# tts.engine values -> engine names ("default"/"auto" = latency order)
+_ENGINE_ALIASES = {"sapi": "pyttsx3", "pyttsx3": "pyttsx3", "espeak": "espeak", "espeak-ng": "espeak", "gtts": "gtts"}
 
 # ISO 639-1 codes supported by gTTS (subset used by the app)
 _GTTS_LANG_MAP = {
@@ -70,76 +77,117 @@ def _normalize_language(language: str) -> str:
     return code.split("-")[0]
 
 
-def _resample_linear(samples: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
-    if src_rate == dst_rate or samples.size == 0:
-        return samples.astype(np.float32, copy=False)
-    duration = samples.shape[0] / float(src_rate)
-    out_len = max(1, int(round(duration * dst_rate)))
-    x_old = np.linspace(0.0, 1.0, num=samples.shape[0], endpoint=False)
-    x_new = np.linspace(0.0, 1.0, num=out_len, endpoint=False)
-    return np.interp(x_new, x_old, samples).astype(np.float32)
-
-
-def _load_wav_mono_float32(path: str) -> Tuple[np.ndarray, int]:
-    if not _SOUNDFILE_AVAILABLE or sf is None:
-        raise RuntimeError("soundfile is required for TTS playback")
-    data, sample_rate = sf.read(path, dtype="float32", always_2d=False)
-    arr = np.asarray(data, dtype=np.float32)
-    if arr.ndim == 2:
-        arr = np.mean(arr, axis=1)
-    return arr.reshape(-1).astype(np.float32, copy=False), int(sample_rate)
-
-
-def _synthesize_pyttsx3(text: str, rate: float, volume: float) -> Tuple[np.ndarray, int]:
-    if not _PYTTSX3_AVAILABLE or pyttsx3 is None:
-        raise RuntimeError("pyttsx3 not installed")
-
-    driver = "sapi5" if sys.platform == "win32" else None
-    with _engine_lock:
-        engine = pyttsx3.init(driver) if driver else pyttsx3.init()
-        try:
-            engine.setProperty("volume", max(0.0, min(1.0, volume)))
-            base_rate = engine.getProperty("rate") or 200
-            engine.setProperty("rate", int(max(80, min(300, base_rate * rate))))
-            fd, path = tempfile.mkstemp(suffix=".wav")
-            os.close(fd)
-            try:
-                engine.save_to_file(text, path)
-                engine.runAndWait()
-                if not os.path.isfile(path) or os.path.getsize(path) < 44:
-                    raise RuntimeError("pyttsx3 produced empty audio")
-                return _load_wav_mono_float32(path)
-            finally:
-                try:
-                    os.remove(path)
-                except OSError:
-                    pass
-        finally:
-            try:
-                engine.stop()
-            except Exception:
-                pass
+def _decode_mp3(data: bytes, sample_rate: Optional[int] = None) -> Tuple[np.ndarray, int]:
+    """
+    MP3 bytes -> mono float32.
 
+    With a target rate, ffmpeg decodes, downmixes and resamples in one pass
+    and writes float32 straight to the pipe; otherwise pydub's decoded PCM is
+    viewed with np.frombuffer (no Python-level sample array).
+    """
+    ffmpeg = shutil.which(getattr(AudioSegment, "converter", None) or "ffmpeg")
+    if sample_rate and ffmpeg:
+        cmd = [ffmpeg, "-v", "error", "-i", "pipe:0", "-f", "f32le", "-ac", "1", "-ar", str(sample_rate), "pipe:1"]
+        result = subprocess.run(cmd, input=data, capture_output=True)
+        if result.returncode == 0 and result.stdout:
+            return np.frombuffer(result.stdout, dtype="<f4").copy(), int(sample_rate)
+    segment = AudioSegment.from_file(io.BytesIO(data), format="mp3")
+    return pcm_to_float32(segment.raw_data, segment.sample_width, segment.channels), int(segment.frame_rate)
 
-def _synthesize_gtts(text: str, language: str) -> Tuple[np.ndarray, int]:
+
+def _synthesize_gtts(text: str, language: str, sample_rate: Optional[int] = None) -> Tuple[np.ndarray, int]:
     if not _GTTS_AVAILABLE or gTTS is None or AudioSegment is None:
         raise RuntimeError("gTTS/pydub not installed")
 
     lang = _GTTS_LANG_MAP.get(_normalize_language(language), "en")
     mp3_buf = io.BytesIO()
     gTTS(text=text, lang=lang).write_to_fp(mp3_buf)
-    mp3_buf.seek(0)
-    segment = AudioSegment.from_file(mp3_buf, format="mp3")
-    segment = segment.set_channels(1)
-    samples = np.array(segment.get_array_of_samples(), dtype=np.float32)
-    if segment.sample_width > 0:
-        samples /= float(2 ** (8 * segment.sample_width - 1))
-    return samples, int(segment.frame_rate)
+    return _decode_mp3(mp3_buf.getvalue(), sample_rate)
 
 
 class TTSService:
     """Synthesize speech as mono float32 PCM."""
 
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        memory_cache_mb: float = DEFAULT_MEMORY_MB,
+        disk_cache_mb: float = DEFAULT_DISK_MB,
+        voice_pack: Optional[VoicePack] = None,
+        engine: str = "default",
+    ) -> None:
+        if cache_dir is None and disk_cache_mb > 0:
+            from app_paths import get_app_data_dir
+
+            cache_dir = get_app_data_dir() / "tts_cache"
+        self.cache = PcmCache(cache_dir, memory_mb=memory_cache_mb, disk_mb=disk_cache_mb)
+        # One engine for the process, created on first use
+        self.local_engine = TtsWorker() if worker_available() else None
+        self.voice_pack = voice_pack
+        self.preferred_engine = _ENGINE_ALIASES.get((engine or "").strip().lower())
+        self._espeak: Optional[EspeakEngine] = None
+        self._espeak_error: Optional[str] = None if espeak_available() else "libespeak-ng not found"
+        self._espeak_lock = threading.Lock()
+        self._latency_ms: Dict[str, float] = {}
+        self._failures: Dict[str, int] = {}
+
+    def set_engine(self, engine: str) -> None:
+        """``tts.engine``: sapi | espeak | gtts, or default/auto for latency order."""
+        self.preferred_engine = _ENGINE_ALIASES.get((engine or "").strip().lower())
+
+    def _espeak_engine(self) -> EspeakEngine:
+        if self._espeak is None:
+            with self._espeak_lock:
+                if self._espeak is None:
+                    try:
+                        self._espeak = EspeakEngine()
+                    except Exception as e:
+                        self._espeak_error = str(e)
+                        print(f"[TTS] espeak-ng unavailable: {e}", flush=True)
+                        raise
+        return self._espeak
+
+    def _engines(self) -> List[str]:
+        """Engines in the order synthesize() tries them."""
+        engines = []
+        if self.local_engine is not None and self.local_engine.error is None:
+            engines.append("pyttsx3")
+        if self._espeak_error is None:
+            engines.append("espeak")
+        if _GTTS_AVAILABLE:
+            engines.append("gtts")
+        engines.sort(key=lambda engine: self._latency_ms.get(engine, _PRIOR_LATENCY_MS[engine]))
+        if self.preferred_engine in engines:
+            engines.remove(self.preferred_engine)
+            engines.insert(0, self.preferred_engine)
+        return engines
+
+    def _record_latency(self, engine: str, elapsed_ms: float) -> None:
+        previous = self._latency_ms.get(engine)
+        self._latency_ms[engine] = (
+            elapsed_ms if previous is None else previous + _LATENCY_EWMA_ALPHA * (elapsed_ms - previous)
+        )
+
+    def _synthesize_with(
+        self,
+        engine: str,
+        text: str,
+        language: str,
+        rate: float,
+        voice: Optional[str],
+        target_sample_rate: Optional[int] = None,
+    ) -> Tuple[np.ndarray, int]:
+        """Unit-volume PCM from one engine; volume is applied after the cache."""
+        if engine == "pyttsx3":
+            return self.local_engine.synthesize(text, rate=rate, volume=1.0, voice=voice)
+        if engine == "espeak":
+            return self._espeak_engine().synthesize(text, language=language, rate=rate, voice=voice)
+        samples, sr = _synthesize_gtts(text, language, target_sample_rate)
+        peak = float(np.max(np.abs(samples))) if samples.size else 0.0
+        if peak > 0:
+            samples = np.clip(samples / peak, -1.0, 1.0)
+        return samples, sr
+
     def synthesize(
         self,
         text: str,
@@ -147,36 +195,123 @@ class TTSService:
         rate: float = 1.0,
         volume: float = 1.0,
         target_sample_rate: Optional[int] = None,
+        voice: Optional[str] = None,
     ) -> Tuple[np.ndarray, int]:
         cleaned = (text or "").strip()
         if not cleaned:
             raise ValueError("TTS text is empty")
 
         lang = _normalize_language(language)
-        last_err: Optional[Exception] = None
+        vol = max(0.0, min(1.0, float(volume)))
+        packed = self._from_voice_pack(cleaned, lang, rate, voice, target_sample_rate)
+        if packed is not None:
+            return packed[0] * vol, packed[1]
 
-        if _PYTTSX3_AVAILABLE and sys.platform == "win32":
-            try:
-                samples, sr = _synthesize_pyttsx3(cleaned, rate=rate, volume=volume)
-                if target_sample_rate and target_sample_rate != sr:
-                    samples = _resample_linear(samples, sr, target_sample_rate)
-                    sr = target_sample_rate
-                return samples, sr
-            except Exception as e:
-                last_err = e
-                print(f"[TTS] pyttsx3 failed, trying gTTS: {e}", flush=True)
+        engines = self._engines()
+        samples: Optional[np.ndarray] = None
+        sr = 0
+        cached = self.cache.get(
+            *(cache_key(cleaned, lang, rate, engine, voice, target_sample_rate) for engine in engines)
+        )
+        if cached is not None:
+            samples, sr = cached
 
-        if _GTTS_AVAILABLE:
-            try:
-                samples, sr = _synthesize_gtts(cleaned, lang)
-                peak = float(np.max(np.abs(samples))) if samples.size else 0.0
-                if peak > 0:
-                    samples = np.clip(samples * volume / peak, -1.0, 1.0)
+        last_err: Optional[Exception] = None
+        if samples is None:
+            for engine in engines:
+                start = time.perf_counter()
+                try:
+                    samples, sr = self._synthesize_with(engine, cleaned, lang, rate, voice, target_sample_rate)
+                except Exception as e:
+                    last_err = e
+                    self._failures[engine] = self._failures.get(engine, 0) + 1
+                    self._record_latency(engine, _FAILURE_PENALTY_MS)
+                    if engine != engines[-1]:
+                        print(f"[TTS] {engine} failed, trying the next engine: {e}", flush=True)
+                    continue
+                self._record_latency(engine, (time.perf_counter() - start) * 1000.0)
                 if target_sample_rate and target_sample_rate != sr:
-                    samples = _resample_linear(samples, sr, target_sample_rate)
+                    samples = resample(samples, sr, target_sample_rate)
                     sr = target_sample_rate
-                return samples, sr
-            except Exception as e:
-                last_err = e
+                samples = self.cache.put(
+                    cache_key(cleaned, lang, rate, engine, voice, target_sample_rate), samples, sr
+                )
+                break
+
+        if samples is None:
+            raise RuntimeError(f"TTS synthesis failed: {last_err or 'no TTS engine available'}")
+        # Cached arrays are read-only and shared; scaling makes a private copy
+        return (samples * vol if vol != 1.0 else samples), sr
+
+    def _from_voice_pack(
+        self, text: str, language: str, rate: float, voice: Optional[str], target_sample_rate: Optional[int]
+    ) -> Optional[Tuple[np.ndarray, int]]:
+        """Prebuilt clip for an exact callout; the pack has one voice at default rate."""
+        if self.voice_pack is None or voice is not None or abs(float(rate) - 1.0) > 1e-3:
+            return None
+        hit = self.voice_pack.lookup(text, language)
+        if hit is None:
+            return None
+        samples, sr = hit
+        if target_sample_rate and target_sample_rate != sr:
+            samples = resample(samples, sr, target_sample_rate)
+            sr = target_sample_rate
+        return samples, sr
+
+    def synthesize_segments(
+        self,
+        text: str,
+        language: str = "en",
+        rate: float = 1.0,
+        volume: float = 1.0,
+        target_sample_rate: Optional[int] = None,
+        voice: Optional[str] = None,
+    ) -> Iterator[Tuple[np.ndarray, int]]:
+        """
+        Synthesize ``text`` sentence by sentence (clause by clause when long).
+
+        Each segment is synthesized (and cached) on its own and yielded as soon
+        as it is ready, so the caller can play it while the next one is made.
+        """
+        packed = self._from_voice_pack(
+            (text or "").strip(), _normalize_language(language), rate, voice, target_sample_rate
+        )
+        if packed is not None:
+            vol = max(0.0, min(1.0, float(volume)))
+            yield packed[0] * vol, packed[1]
+            return
+        segments = split_segments(text, max_chars=STREAM_SEGMENT_CHARS)
+        if not segments:
+            raise ValueError("TTS text is empty")
+        for segment in segments:
+            yield self.synthesize(
+                segment,
+                language=language,
+                rate=rate,
+                volume=volume,
+                target_sample_rate=target_sample_rate,
+                voice=voice,
+            )
+
+    def cache_stats(self) -> Dict[str, Any]:
+        stats = self.cache.stats()
+        stats["voice_pack"] = self.voice_pack.stats() if self.voice_pack is not None else None
+        return stats
 
-        raise RuntimeError(f"TTS synthesis failed: {last_err or 'no TTS engine available'}")
+    def engine_stats(self) -> Dict[str, Any]:
+        """Engine order and measured latency, plus the local worker's startup cost."""
+        stats: Dict[str, Any] = (
+            self.local_engine.stats() if self.local_engine is not None else {"backend": None, "started": False}
+        )
+        stats.update({
+            "preferred_engine": self.preferred_engine or "auto",
+            "engine_order": self._engines(),
+            "engine_latency_ms": {engine: round(ms, 1) for engine, ms in self._latency_ms.items()},
+            "engine_failures": dict(self._failures),
+            "espeak": {
+                "available": self._espeak_error is None,
+                "error": self._espeak_error,
+                "sample_rate": self._espeak.sample_rate if self._espeak is not None else None,
+            },
+        })
+        return stats
@@ -0,0 +1,282 @@
+"""
+Long-lived speech engine worker for local TTS (SAPI on Windows).
+
+Initializing a pyttsx3/SAPI engine costs far more than speaking a short
+callout, and SAPI objects belong to the COM apartment of the thread that
+created them. One worker thread therefore owns a single engine for the life
+of the process and takes jobs from a queue.
+
+With ``comtypes`` (pyttsx3's own SAPI binding) the voice speaks into an
+``SpMemoryStream`` and PCM is returned straight from memory. Without it the
+worker keeps one pyttsx3 engine and one reusable temp WAV path, so only the
+per-utterance file round trip remains.
+"""
+from __future__ import annotations
+
+import math
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+try:
+    import soundfile as sf
+
+    _SOUNDFILE_AVAILABLE = True
+except ImportError:
+    sf = None  # type: ignore
+    _SOUNDFILE_AVAILABLE = False
+
+try:
+    import pyttsx3
+
+    _PYTTSX3_AVAILABLE = True
+except ImportError:
+    pyttsx3 = None  # type: ignore
+    _PYTTSX3_AVAILABLE = False
+
+try:
+    import comtypes
+    import comtypes.client
+
+    _COMTYPES_AVAILABLE = sys.platform == "win32"
+except ImportError:
+    comtypes = None  # type: ignore
+    _COMTYPES_AVAILABLE = False
+
+# SpeechAudioFormatType SAFT22kHz16BitMono
+_SAPI_FORMAT = 22
+_SAPI_SAMPLE_RATE = 22050
+_SAPI_ASYNC_FLAGS = 0  # SVSFDefault: Speak() returns when done
+_LATENCY_WINDOW = 200
+
+
+def worker_available() -> bool:
+    # Windows only: pyttsx3's NSSpeechSynthesizer/espeak drivers are known to
+    # hang on repeated runAndWait() with one reused engine, and a hung thread
+    # cannot be killed (pyttsx3.init() would even hand back the same engine).
+    # Elsewhere espeak_engine covers offline TTS. Whether the engine actually
+    # starts is only known on first use; a failed start removes it from
+    # TTSService's engine order.
+    return sys.platform == "win32" and (_COMTYPES_AVAILABLE or _PYTTSX3_AVAILABLE)
+
+
+def _load_wav_mono_float32(path: str) -> Tuple[np.ndarray, int]:
+    if not _SOUNDFILE_AVAILABLE or sf is None:
+        raise RuntimeError("soundfile is required for TTS playback")
+    data, sample_rate = sf.read(path, dtype="float32", always_2d=False)
+    arr = np.asarray(data, dtype=np.float32)
+    if arr.ndim == 2:
+        arr = np.mean(arr, axis=1)
+    return arr.reshape(-1).astype(np.float32, copy=False), int(sample_rate)
+
+
+def _sapi_rate(rate: float) -> int:
+    """SAPI Rate (-10..10, x3 per 10 steps) for a speed multiplier."""
+    multiplier = max(0.4, min(1.5, float(rate or 1.0)))
+    return int(round(10 * math.log(multiplier) / math.log(3)))
+
+
+class _SapiEngine:
+
+    """SAPI voice speaking into memory streams (no files)."""
+
+    name = "sapi"
+
+    def __init__(self) -> None:
+        comtypes.CoInitialize()
+        self._voice = comtypes.client.CreateObject("SAPI.SpVoice")
+        self._default_voice = self._voice.Voice
+
+    def speak(self, text: str, rate: float, volume: float, voice: Optional[str]) -> Tuple[np.ndarray, int]:
+        stream = comtypes.client.CreateObject("SAPI.SpMemoryStream")
+        audio_format = comtypes.client.CreateObject("SAPI.SpAudioFormat")
+        audio_format.Type = _SAPI_FORMAT
+        stream.Format = audio_format
+        self._voice.Voice = self._find_voice(voice) if voice else self._default_voice
+        self._voice.Rate = _sapi_rate(rate)
+        self._voice.Volume = int(max(0.0, min(1.0, volume)) * 100)
+        self._voice.AudioOutputStream = stream
+        try:
+            self._voice.Speak(text, _SAPI_ASYNC_FLAGS)
+            data = bytes(stream.GetData())
+        finally:
+            self._voice.AudioOutputStream = None
+        samples = np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+        if samples.size == 0:
+            raise RuntimeError("SAPI produced empty audio")
+        return samples, _SAPI_SAMPLE_RATE
+
+    def _find_voice(self, voice: str):
+        for token in self._voice.GetVoices():
+            if voice in (token.Id, token.GetDescription()):
+                return token
+        return self._default_voice
+
+    def close(self) -> None:
+        self._voice = None
+        comtypes.CoUninitialize()
+
+
+class _Pyttsx3Engine:
+
+    """One pyttsx3 engine reused for every utterance; audio goes through one temp WAV."""
+
+    name = "pyttsx3"
+
+    def __init__(self) -> None:
+        self._engine = pyttsx3.init("sapi5")
+        self._base_rate = self._engine.getProperty("rate") or 200
+        self._default_voice = self._engine.getProperty("voice")
+        fd, self._path = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+
+    def speak(self, text: str, rate: float, volume: float, voice: Optional[str]) -> Tuple[np.ndarray, int]:
+        self._engine.setProperty("volume", max(0.0, min(1.0, volume)))
+        self._engine.setProperty("rate", int(max(80, min(300, self._base_rate * rate))))
+        self._engine.setProperty("voice", voice or self._default_voice)
+        self._engine.save_to_file(text, self._path)
+        self._engine.runAndWait()
+        if os.path.getsize(self._path) < 44:
+            raise RuntimeError("pyttsx3 produced empty audio")
+        return _load_wav_mono_float32(self._path)
+
+    def close(self) -> None:
+        try:
+            self._engine.stop()
+        except Exception:
+            pass
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
+
+
+class TtsWorker:
+
+    """Single thread owning one speech engine; jobs are served in order."""
+
+    def __init__(self) -> None:
+        self._jobs: "queue.Queue[Optional[Tuple[Future, Tuple[Any, ...]]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self.backend: Optional[str] = None
+        self.error: Optional[str] = None
+        self.startup_ms: Optional[float] = None
+        self.utterances = 0
+        self._latencies_ms: deque = deque(maxlen=_LATENCY_WINDOW)
+
+    def start(self) -> None:
+        """Create the engine in the background now instead of on first use."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="tts-engine", daemon=True)
+                self._thread.start()
+
+    def _create_engine(self):
+        if _COMTYPES_AVAILABLE:
+            try:
+                return _SapiEngine()
+            except Exception as e:
+                print(f"[TTS] SAPI memory stream unavailable, using pyttsx3: {e}", flush=True)
+        if _PYTTSX3_AVAILABLE:
+            return _Pyttsx3Engine()
+        raise RuntimeError("pyttsx3 not installed")
+
+    def _run(self) -> None:
+        start = time.perf_counter()
+        try:
+            engine = self._create_engine()
+        except Exception as e:
+            self.error = str(e)
+            self._ready.set()
+            print(f"[TTS] Speech engine worker failed to start: {e}", flush=True)
+            self._fail_pending()
+            return
+        self.startup_ms = (time.perf_counter() - start) * 1000.0
+        self.backend = engine.name
+        self._ready.set()
+        print(f"[TTS] Speech engine worker ready ({self.backend}) in {self.startup_ms:.0f} ms", flush=True)
+
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            future, args = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            job_start = time.perf_counter()
+            try:
+                result = engine.speak(*args)
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            self._latencies_ms.append((time.perf_counter() - job_start) * 1000.0)
+            self.utterances += 1
+            future.set_result(result)
+        engine.close()
+
+    def _fail_pending(self) -> None:
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                return
+            if job is not None:
+                job[0].set_exception(RuntimeError(self.error or "speech engine unavailable"))
+
+    def submit(self, text: str, rate: float = 1.0, volume: float = 1.0, voice: Optional[str] = None) -> Future:
+        future: Future = Future()
+        if self.error is not None:
+            future.set_exception(RuntimeError(self.error))
+            return future
+        self.start()
+        self._jobs.put((future, (text, rate, volume, voice)))
+        if self.error is not None:
+            self._fail_pending()
+        return future
+
+    def synthesize(
+        self,
+        text: str,
+        rate: float = 1.0,
+        volume: float = 1.0,
+        voice: Optional[str] = None,
+        timeout_s: float = 30.0,
+    ) -> Tuple[np.ndarray, int]:
+        return self.submit(text, rate, volume, voice).result(timeout=timeout_s)
+
+    def stop(self, timeout_s: float = 2.0) -> None:
+        """Let queued jobs finish, close the engine and wait for the thread."""
+        thread = self._thread
+        if thread is not None:
+            self._jobs.put(None)
+            # Daemon thread: without the join, exit can kill it before engine.close()
+            thread.join(timeout_s)
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies_ms)
+
+        def pct(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 2)
+
+        return {
+            "backend": self.backend,
+            "started": self._ready.is_set() and self.error is None,
+            "error": self.error,
+            "startup_ms": round(self.startup_ms, 1) if self.startup_ms is not None else None,
+            "utterances": self.utterances,
+            "queued": self._jobs.qsize(),
+            "latency_ms_p50": pct(0.5),
+            "latency_ms_p95": pct(0.95),
+        }
@@ -0,0 +1,215 @@
+"""
+Precomputed callout voice pack.
+
+``scripts/build_voice_pack.py`` synthesizes the tactical callout vocabulary
+(``callout_vocabulary()``) for every supported language ahead of time and
+stores it as one int16 mono PCM bank plus a JSON index of
+(language, normalized phrase) -> (offset, length). The bank is memory-mapped,
+so loading costs nothing up front and an exact phrase match is served without
+synthesis or network access; only the pages of the clips actually spoken are
+read from disk.
+
+Each build writes a new, numbered bank file and then switches the index to
+it, since a mapped file cannot be replaced on Windows; banks the index no
+longer names are deleted once nothing maps them.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from translation_memory import normalize_source
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+PACK_DIRNAME = "voice_pack"
+BANK_FILENAME = "voice_pack.pcm"
+BANK_PATTERN = "voice_pack.*.pcm"
+INDEX_FILENAME = "voice_pack.json"
+PACK_VERSION = 1
+DEFAULT_SAMPLE_RATE = 48000
+
+
+def default_pack_dir() -> Path:
+    from app_paths import get_app_data_dir
+
+    return get_app_data_dir() / PACK_DIRNAME
+
+
+def callout_vocabulary(data_dir: Path = DATA_DIR) -> Dict[str, List[str]]:
+    """
+    Callouts per spoken language, from the data files the app already ships.
+
+    - tactical_terms.json ``warmup_phrases`` (callouts in each language),
+    - callout_phrases.json (the remaining TTS languages),
+    - demo_callouts.json (its ``language``),
+    - callout_eval.json sources and English references.
+    """
+    vocabulary: Dict[str, List[str]] = {}
+
+    def add(language: str, phrase: str) -> None:
+        phrase = (phrase or "").strip()
+        if phrase and normalize_source(phrase):
+            vocabulary.setdefault(language, [])
+            if phrase not in vocabulary[language]:
+                vocabulary[language].append(phrase)
+
+    terms = json.loads((data_dir / "tactical_terms.json").read_text(encoding="utf-8"))
+    for language, phrases in (terms.get("warmup_phrases") or {}).items():
+        for phrase in phrases:
+            add(language, phrase)
+    extra = json.loads((data_dir / "callout_phrases.json").read_text(encoding="utf-8"))
+    for language, phrases in (extra.get("languages") or {}).items():
+        for phrase in phrases:
+            add(language, phrase)
+    demo = json.loads((data_dir / "demo_callouts.json").read_text(encoding="utf-8"))
+    for phrase in (demo.get("callouts") or {}).values():
+        add(demo.get("language", "es"), phrase)
+    evaluation = json.loads((data_dir / "callout_eval.json").read_text(encoding="utf-8"))
+    for item in evaluation.get("items", []):
+        add(item["language"], item["source"])
+        add(evaluation.get("target_language", "en"), item["reference"])
+    return vocabulary
+
+
+def write_bank(
+    directory: Path,
+    clips: Mapping[Tuple[str, str], np.ndarray],
+    sample_rate: int,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Write ``clips`` ((language, phrase) -> mono float32) as a voice pack.
+
+    The bank goes to a new numbered file and the index is swapped in last,
+    so a running app never maps a half-written bank and the bank it does map
+    is never overwritten.
+
+    Returns:
+        The index that was written
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    entries: Dict[str, Dict[str, List[int]]] = {}
+    offset = 0
+    generation = _current_generation(directory) + 1
+    bank_name = f"voice_pack.{generation}.pcm"
+    with open(directory / bank_name, "wb") as f:
+        for (language, phrase), samples in sorted(clips.items()):
+            key = normalize_source(phrase)
+            pcm = np.clip(np.asarray(samples, dtype=np.float32).reshape(-1), -1.0, 1.0)
+            if not key or pcm.size == 0:
+                continue
+            f.write((pcm * 32767.0).astype("<i2").tobytes())
+            entries.setdefault(language, {})[key] = [offset, int(pcm.size)]
+            offset += int(pcm.size)
+    index = {
+        "version": PACK_VERSION,
+        "generation": generation,
+        "bank": bank_name,
+        "sample_rate": int(sample_rate),
+        "dtype": "int16",
+        "samples": offset,
+        "metadata": metadata or {},
+        "entries": entries,
+    }
+    index_tmp = directory / f"{INDEX_FILENAME}.tmp"
+    index_tmp.write_text(json.dumps(index, ensure_ascii=False, indent=1), encoding="utf-8")
+    os.replace(index_tmp, directory / INDEX_FILENAME)
+    _remove_stale_banks(directory, bank_name)
+    return index
+
+
+def _current_generation(directory: Path) -> int:
+    try:
+        index = json.loads((directory / INDEX_FILENAME).read_text(encoding="utf-8"))
+        return int(index.get("generation", 0))
+    except (OSError, ValueError):
+        return 0
+
+
+def _remove_stale_banks(directory: Path, current: str) -> None:
+    for path in [directory / BANK_FILENAME, *directory.glob(BANK_PATTERN)]:
+        if path.name == current or not path.exists():
+            continue
+        try:
+            path.unlink()
+        except OSError:
+            # Still mapped by a running app (Windows); the next build retries
+            pass
+
+
+class VoicePack:
+
+    """Read-only, memory-mapped phrase bank."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        index = json.loads((self.directory / INDEX_FILENAME).read_text(encoding="utf-8"))
+        if index.get("version") != PACK_VERSION or index.get("dtype") != "int16":
+            raise ValueError(f"unsupported voice pack format in {self.directory}")
+        self.sample_rate = int(index["sample_rate"])
+        self.metadata: Dict[str, Any] = index.get("metadata") or {}
+        self._entries: Dict[str, Dict[str, Tuple[int, int]]] = {
+            language: {key: (int(span[0]), int(span[1])) for key, span in phrases.items()}
+            for language, phrases in index.get("entries", {}).items()
+        }
+        total = int(index.get("samples", 0))
+        # Packs from before numbered banks name no bank file
+        bank_path = self.directory / index.get("bank", BANK_FILENAME)
+        self._bank = np.memmap(bank_path, dtype="<i2", mode="r", shape=(total,)) if total else None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, directory: Optional[Path] = None) -> Optional["VoicePack"]:
+        """The pack in ``directory`` (default: app data), or None when absent or unreadable."""
+        directory = Path(directory) if directory is not None else default_pack_dir()
+        if not (directory / INDEX_FILENAME).exists():
+            return None
+        try:
+            pack = cls(directory)
+        except Exception as e:
+            print(f"[WARN] Voice pack in {directory} not loaded: {e}", flush=True)
+            return None
+        print(f"[TTS] Voice pack loaded: {len(pack)} phrases, {len(pack._entries)} languages", flush=True)
+        return pack
+
+    def __len__(self) -> int:
+        return sum(len(phrases) for phrases in self._entries.values())
+
+    def lookup(self, text: str, language: str) -> Optional[Tuple[np.ndarray, int]]:
+        """
+        Clip for an exact phrase match (case, punctuation and spacing ignored).
+
+        Returns:
+            (float32 samples, sample rate), or None
+        """
+        span = self._entries.get(language, {}).get(normalize_source(text))
+        with self._lock:
+            if span is None or self._bank is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        offset, length = span
+        samples = self._bank[offset:offset + length].astype(np.float32) / 32767.0
+        return samples, self.sample_rate
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "phrases": len(self),
+                "languages": sorted(self._entries),
+                "sample_rate": self.sample_rate,
+                "size_mb": round((self._bank.nbytes if self._bank is not None else 0) / (1024 * 1024), 2),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "metadata": self.metadata,
+            }
@@ -5,6 +5,7 @@ Refactored from src/core/speech/recognizer.py
 import sys
 import os
 import re
+import hashlib
 import time
 import numpy as np
 from scipy import signal
@@ -26,6 +27,8 @@ except ImportError:
     torch = None  # type: ignore
     TORCH_AVAILABLE = False
 
+from single_flight import SingleFlight
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
@@ -51,6 +54,7 @@ class WhisperService:
         self.model = None
         self.model_loaded = False
         self.sample_rate = 16000
+        self._inflight = SingleFlight()
 
         # Setup model directory
         if models_dir:
@@ -94,13 +98,15 @@ class WhisperService:
             safe_print(f"[ERROR] Error loading Whisper model: {e}", flush=True)
             raise
 
-    def _build_whisper_kwargs(self, language: Optional[str]) -> dict:
+    def _build_whisper_kwargs(
+        self, language: Optional[str], task: str = "transcribe"
+    ) -> dict:
         """Tuned for loopback chunks: game chat, music/vocals, and video dialogue."""
         use_fp16 = bool(
             TORCH_AVAILABLE and torch is not None and torch.cuda.is_available()
         )
         kwargs: dict = {
-            "task": "transcribe",
+            "task": task,
             "fp16": use_fp16,
             "condition_on_previous_text": False,
             "no_speech_threshold": 0.35,
@@ -110,6 +116,10 @@ class WhisperService:
         }
         if language:
             kwargs["language"] = language
+        if task == "translate":
+            # The decoder writes English here, so prime it with English context.
+            kwargs["initial_prompt"] = "English gaming callouts and voice chat."
+            return kwargs
         prompt_by_lang = {
             "en": "English gaming callouts and voice chat.",
             "es": "Spanish gaming callouts: rush B, plantan, rotar, último en sitio.",
@@ -241,9 +251,9 @@ class WhisperService:
         )
 
     def _run_whisper_pass(
-        self, audio_data: np.ndarray, language: Optional[str]
+        self, audio_data: np.ndarray, language: Optional[str], task: str = "transcribe"
     ) -> dict:
-        whisper_kwargs = self._build_whisper_kwargs(language)
+        whisper_kwargs = self._build_whisper_kwargs(language, task=task)
         if language:
             whisper_kwargs["language"] = language
         return self.model.transcribe(audio_data, **whisper_kwargs)
@@ -253,13 +263,17 @@ class WhisperService:
         audio_data: np.ndarray,
         language: Optional[str],
         duration_s: float,
+        task: str = "transcribe",
     ) -> tuple[str, str, list]:
         """Try auto/en/es until we get usable text (loopback clips vary)."""
         tried: list[Optional[str]] = []
         order: list[Optional[str]] = []
         if language not in order:
             order.append(language)
-        for candidate in (None, "en", "es"):
+        # Forcing "en" on a translate pass just transcribes, so only retry
+        # with auto-detect and Spanish there.
+        retry_languages = (None, "es") if task == "translate" else (None, "en", "es")
+        for candidate in retry_languages:
             if candidate not in order:
                 order.append(candidate)
 
@@ -274,7 +288,7 @@ class WhisperService:
             tried.append(lang)
             label = lang or "auto"
             try:
-                result = self._run_whisper_pass(audio_data, lang)
+                result = self._run_whisper_pass(audio_data, lang, task=task)
             except Exception as exc:
                 print(f"[WARN] Whisper pass ({label}) failed: {exc}", flush=True)
                 continue
@@ -309,6 +323,19 @@ class WhisperService:
             return best_text, best_lang, best_segments
         return "", language or "unknown", []
 
+    def _transcribe_original(
+        self, audio_data: np.ndarray, detected_language: str, english_text: str
+    ) -> str:
+        """Single transcribe pass pinned to the detected language (no retries)."""
+        if not english_text or detected_language in ("en", "unknown", None):
+            return english_text
+        try:
+            result = self._run_whisper_pass(audio_data, detected_language, task="transcribe")
+            return (result.get("text") or "").strip()
+        except Exception as exc:
+            print(f"[WARN] Original-text pass failed: {exc}", flush=True)
+            return ""
+
     def transcribe(
         self,
         audio_data: np.ndarray,
@@ -316,6 +343,8 @@ class WhisperService:
         language: Optional[str] = None,
         min_audio_threshold: float = 0.01,
         channels: int = 1,
+        task: str = "transcribe",
+        include_original: bool = False,
     ) -> Dict[str, Any]:
         """
         Transcribe audio data
@@ -325,10 +354,52 @@ class WhisperService:
             sample_rate: Sample rate of audio
             language: Language code (None for auto-detect)
             min_audio_threshold: Minimum RMS level for valid speech
+            task: 'transcribe' or 'translate' (Whisper X->English)
+            include_original: With task='translate', also run a single
+                transcribe pass in the detected language for 'original_text'
 
         Returns:
             Dict with 'text', 'language', 'segments', 'confidence'
         """
+        if not isinstance(audio_data, np.ndarray):
+            audio_data = np.array(audio_data, dtype=np.float32)
+        # Byte-identical submissions (same clip from loopback and mic, or
+        # several clients) that overlap in time share one Whisper run.
+        digest = hashlib.blake2b(
+            np.ascontiguousarray(audio_data).tobytes(), digest_size=16
+        ).hexdigest()
+        key = (
+            digest, str(audio_data.dtype), sample_rate, language,
+            min_audio_threshold, channels, task, include_original,
+        )
+        result, shared = self._inflight.do(
+            key,
+            lambda: self._transcribe_audio(
+                audio_data, sample_rate, language, min_audio_threshold,
+                channels, task, include_original,
+            ),
+        )
+        if shared:
+            safe_print(f"[INFO] Joined in-flight transcription ({len(audio_data)} samples)")
+        # Callers annotate the dict they get back; keep the shared one pristine
+        return dict(result)
+
+    def dedup_stats(self) -> Dict[str, int]:
+
+        """How many concurrent byte-identical transcriptions were served by one run."""
+        return self._inflight.stats()
+
+    def _transcribe_audio(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int,
+        language: Optional[str],
+        min_audio_threshold: float,
+        channels: int,
+        task: str,
+        include_original: bool,
+    ) -> Dict[str, Any]:
+
         # Ensure model is loaded
         if not self.model_loaded or self.model is None:
             self.load_model()
@@ -562,22 +633,29 @@ class WhisperService:
             print(f"[DEBUG] Calling Whisper transcribe with {len(audio_data)} samples")
             duration_s = len(audio_data) / self.sample_rate
             text, detected_language, segments = self._transcribe_with_retries(
-                audio_data, language, duration_s
+                audio_data, language, duration_s, task=task
             )
 
             filtered = self._filter_transcription_text(
                 text, detected_language, segments, rms_level
             )
             if filtered is not None:
+                filtered["task"] = task
                 return filtered
 
-            return {
+            result = {
                 "text": text,
                 "language": detected_language,
                 "segments": segments,
                 "confidence": 1.0,  # Whisper doesn't provide confidence scores
-                "rms_level": rms_level
+                "rms_level": rms_level,
+                "task": task,
             }
+            if task == "translate" and include_original:
+                result["original_text"] = self._transcribe_original(
+                    audio_data, detected_language, text
+                )
+            return result
         except Exception as e:
             safe_print(f"[ERROR] Error transcribing audio: {e}", flush=True)
             raise
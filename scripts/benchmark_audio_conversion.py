@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+TTS audio conversion benchmarks: polyphase vs linear resampling, and PCM
+decode into float32 (np.frombuffer vs pydub's get_array_of_samples path).
+
+Usage:
+  python scripts/benchmark_audio_conversion.py
+  python scripts/benchmark_audio_conversion.py --seconds 3 10 --repeats 20
+  python scripts/benchmark_audio_conversion.py --mp3 callout.mp3   # real MP3 decode (pydub + ffmpeg)
+"""
+from __future__ import annotations
+
+import argparse
+import array
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "fastapi-backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from resampling import _filter_bank, pcm_to_float32, resample, resample_linear  # noqa: E402
+
+# (engine/native rate, device rate) pairs seen in practice
+RATE_PAIRS = [(22050, 48000), (24000, 48000), (24000, 44100), (44100, 48000), (48000, 16000)]
+
+
+def _time_ms(fn: Callable[[], object], repeats: int) -> float:
+    fn()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(times)
+
+
+def _tone(freq: float, rate: int, seconds: float) -> np.ndarray:
+    return np.sin(2 * np.pi * freq * np.arange(int(rate * seconds)) / rate).astype(np.float32)
+
+
+def _spurious_db(fn: Callable[[np.ndarray, int, int], np.ndarray], src: int, dst: int) -> float:
+    """
+    Energy that should not be in the output, relative to the input tone (dB).
+
+    Upsampling: a 0.4*src tone; anything above src/2 is an image.
+    Downsampling: a tone between the new and the old Nyquist; all of it is alias.
+    """
+    freq = 0.4 * src if dst > src else dst / 2 + 0.3 * (src / 2 - dst / 2)
+    out = fn(_tone(freq, src, 1.0), src, dst)[500:-500].astype(np.float64)
+    spectrum = np.abs(np.fft.rfft(out * np.hanning(out.size))) ** 2
+    freqs = np.fft.rfftfreq(out.size, 1.0 / dst)
+    spurious = spectrum[freqs > src / 2].sum() if dst > src else spectrum.sum()
+    reference = np.abs(np.fft.rfft(np.hanning(out.size) * np.sin(2 * np.pi * 1000 * np.arange(out.size) / dst))) ** 2
+    return 10 * np.log10(max(spurious, 1e-20) / reference.sum())
+
+
+def bench_resample(seconds_list: List[float], repeats: int) -> None:
+    print("Resampling (median ms; max error on a 1 kHz tone; spurious energy in dB, see _spurious_db)")
+    print(f"  {'pair':>15} {'sec':>5} {'linear':>9} {'poly':>9} {'err lin':>9} {'err poly':>9} {'spur lin':>9} {'spur poly':>9}")
+    rng = np.random.default_rng(0)
+    for src, dst in RATE_PAIRS:
+        _filter_bank.cache_clear()
+        start = time.perf_counter()
+        resample(np.zeros(16, dtype=np.float32), src, dst)
+        design_ms = (time.perf_counter() - start) * 1000.0
+        tone = _tone(1000, src, 1.0)
+        expected = _tone(1000, dst, 1.0)
+        err_lin = np.abs(resample_linear(tone, src, dst)[200:-200] - expected[200:-200]).max()
+        err_poly = np.abs(resample(tone, src, dst)[200:-200] - expected[200:-200]).max()
+        spur_lin = _spurious_db(resample_linear, src, dst)
+        spur_poly = _spurious_db(resample, src, dst)
+        for seconds in seconds_list:
+            noise = rng.standard_normal(int(src * seconds)).astype(np.float32) * 0.1
+            lin_ms = _time_ms(lambda: resample_linear(noise, src, dst), repeats)
+            poly_ms = _time_ms(lambda: resample(noise, src, dst), repeats)
+            print(
+                f"  {src:>6}->{dst:<6} {seconds:>5.1f} {lin_ms:>9.2f} {poly_ms:>9.2f} "
+                f"{err_lin:>9.5f} {err_poly:>9.5f} {spur_lin:>9.1f} {spur_poly:>9.1f}"
+            )
+        print(f"  {'':>15} filter bank design (once per pair, cached): {design_ms:.2f} ms")
+
+
+def bench_pcm_decode(seconds_list: List[float], repeats: int) -> None:
+    print("\nDecoded 16-bit PCM -> float32 (median ms)")
+    print(f"  {'sec':>5} {'array path':>11} {'frombuffer':>11}")
+    for seconds in seconds_list:
+        raw = (np.random.default_rng(1).standard_normal(int(24000 * seconds)) * 3000).astype("<i2").tobytes()
+
+        def old_path() -> np.ndarray:
+            # pydub's get_array_of_samples() returns array.array, then np.array copies it
+            samples = np.array(array.array("h", raw), dtype=np.float32)
+            samples /= 32768.0
+            return samples
+
+        old_ms = _time_ms(old_path, repeats)
+        new_ms = _time_ms(lambda: pcm_to_float32(raw, 2), repeats)
+        print(f"  {seconds:>5.1f} {old_ms:>11.3f} {new_ms:>11.3f}")
+
+
+def bench_mp3(path: Path, repeats: int) -> None:
+    from pydub import AudioSegment
+
+    import tts_service
+
+    data = path.read_bytes()
+
+    def old_path() -> np.ndarray:
+        segment = AudioSegment.from_file(path, format="mp3").set_channels(1)
+        samples = np.array(segment.get_array_of_samples(), dtype=np.float32)
+        samples /= float(2 ** (8 * segment.sample_width - 1))
+        return resample_linear(samples, segment.frame_rate, 48000)
+
+    old_ms = _time_ms(old_path, repeats)
+    new_ms = _time_ms(lambda: tts_service._decode_mp3(data, 48000), repeats)
+    print(f"\nMP3 {path.name} -> float32 @ 48 kHz (median ms): pydub+linear {old_ms:.1f}, ffmpeg f32le {new_ms:.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, nargs="+", default=[1.0, 3.0, 10.0])
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--mp3", type=Path, default=None, help="MP3 file for the end-to-end decode comparison")
+    args = parser.parse_args()
+    bench_resample(args.seconds, args.repeats)
+    bench_pcm_decode(args.seconds, args.repeats)
+    if args.mp3 is not None:
+        bench_mp3(args.mp3, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
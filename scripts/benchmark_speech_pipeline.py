@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+End-to-end speech -> English latency and memory: Whisper translate vs transcribe + NMT.
+
+Each pipeline runs in its own subprocess so resident memory is comparable.
+
+Usage:
+  python scripts/benchmark_speech_pipeline.py                       # demo callouts
+  python scripts/benchmark_speech_pipeline.py clip1.wav clip2.mp3 --model small
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+BACKEND_DIR = ROOT / "fastapi-backend"
+DEFAULT_AUDIO_DIR = ROOT / "docs" / "pitch" / "assets" / "demo_audio"
+
+PIPELINES = ("two_model", "whisper_translate")
+
+
+def _rss_mb() -> float:
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_pipeline(pipeline: str, files: List[str], model: str, repeats: int) -> dict:
+    sys.path.insert(0, str(BACKEND_DIR))
+    import whisper
+
+    from translation_service import TranslationService
+    from whisper_service import WhisperService
+
+    baseline_mb = _rss_mb()
+    load_start = time.perf_counter()
+    stt = WhisperService(model_name=model)
+    stt.load_model()
+    nmt = None
+    if pipeline == "two_model":
+        nmt = TranslationService(target_language="en", model_type="local", use_fallback=False)
+        nmt.wait_until_ready()
+    load_s = time.perf_counter() - load_start
+    loaded_mb = _rss_mb()
+
+    clips = [whisper.load_audio(f) for f in files]
+    latencies: List[float] = []
+    outputs: List[str] = []
+    for _ in range(repeats):
+        for audio in clips:
+            start = time.perf_counter()
+            if pipeline == "whisper_translate":
+                result = stt.transcribe(audio, sample_rate=16000, task="translate")
+                english = result.get("text", "")
+            else:
+                result = stt.transcribe(audio, sample_rate=16000)
+                english = nmt.translate(result.get("text", ""), result.get("language")).get(
+                    "translated_text", ""
+                )
+            latencies.append((time.perf_counter() - start) * 1000.0)
+            outputs.append(english)
+
+    ordered = sorted(latencies)
+    return {
+        "pipeline": pipeline,
+        "load_s": round(load_s, 2),
+        "model_rss_mb": round(loaded_mb - baseline_mb, 1),
+        "peak_rss_mb": round(_rss_mb(), 1),
+        "p50_ms": round(ordered[len(ordered) // 2], 1),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(0.95 * (len(ordered) - 1) + 0.5))], 1),
+        "outputs": outputs[: len(files)],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", help="Audio clips (default: demo callouts)")
+    parser.add_argument("--model", default="base", help="Whisper model name")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--pipeline", choices=PIPELINES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    files = args.files or sorted(
+        str(p) for p in DEFAULT_AUDIO_DIR.glob("*.mp3") if "combined" not in p.name
+    )
+    if not files:
+        raise SystemExit("No audio clips found")
+
+    if args.pipeline:
+        print(json.dumps(run_pipeline(args.pipeline, files, args.model, args.repeats)))
+        return
+
+    rows = []
+    for pipeline in PIPELINES:
+        proc = subprocess.run(
+            [sys.executable, __file__, *files, "--model", args.model,
+             "--repeats", str(args.repeats), "--pipeline", pipeline],
+            capture_output=True,
+            text=True,
+        )
+        lines = [l for l in proc.stdout.splitlines() if l.startswith("{")]
+        if proc.returncode != 0 or not lines:
+            print(f"[ERROR] {pipeline} failed:\n{proc.stderr[-2000:]}")
+            continue
+        rows.append(json.loads(lines[-1]))
+
+    print(f"{'pipeline':<20}{'load s':>8}{'model MB':>10}{'peak MB':>9}{'p50 ms':>9}{'p95 ms':>9}")
+    for row in rows:
+        print(
+            f"{row['pipeline']:<20}{row['load_s']:>8.1f}{row['model_rss_mb']:>10.0f}"
+            f"{row['peak_rss_mb']:>9.0f}{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}"
+        )
+    for row in rows:
+        print(f"\n{row['pipeline']} outputs:")
+        for path, text in zip(files, row["outputs"]):
+            print(f"  {Path(path).name}: {text}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+Translation latency/quality benchmarks on the short-callout eval set.
+
+Usage:
+  python scripts/benchmark_translation.py pairs              # pair models vs opus-mt-mul
+  python scripts/benchmark_translation.py pairs --languages es ru
+  python scripts/benchmark_translation.py quantized --threads 2  # int8 CTranslate2 vs fp32
+  python scripts/benchmark_translation.py memory --sizes 10000 100000  # fuzzy translation memory
+  python scripts/benchmark_translation.py profile --repeats 3  # tokenize/generate/decode split
+  python scripts/benchmark_translation.py langid              # source-language ID accuracy
+  python scripts/benchmark_translation.py learned --sizes 100000  # learned-preference store
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "fastapi-backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+EVAL_PATH = BACKEND_DIR / "data" / "callout_eval.json"
+
+
+def load_eval_set(languages: Optional[List[str]] = None) -> List[dict]:
+    data = json.loads(EVAL_PATH.read_text(encoding="utf-8"))
+    items = data.get("items", [])
+    if languages:
+        items = [item for item in items if item["language"] in languages]
+    return items
+
+
+def _ngrams(tokens: List[str], n: int) -> Counter:
+    return Counter(tuple(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+
+
+def corpus_bleu(hypotheses: List[str], references: List[str]) -> float:
+    """Corpus BLEU (sacrebleu when installed, else 4-gram BLEU with add-one smoothing for n>1)."""
+    try:
+        import sacrebleu
+
+        return float(sacrebleu.corpus_bleu(hypotheses, [references]).score)
+    except ImportError:
+        pass
+
+    matches = [0] * 4
+    totals = [0] * 4
+    hyp_len = ref_len = 0
+    for hyp, ref in zip(hypotheses, references):
+        hyp_tokens = hyp.lower().split()
+        ref_tokens = ref.lower().split()
+        hyp_len += len(hyp_tokens)
+        ref_len += len(ref_tokens)
+        for n in range(1, 5):
+            hyp_ngrams = _ngrams(hyp_tokens, n)
+            ref_ngrams = _ngrams(ref_tokens, n)
+            matches[n - 1] += sum(min(c, ref_ngrams[g]) for g, c in hyp_ngrams.items())
+            totals[n - 1] += max(0, len(hyp_tokens) - n + 1)
+    if hyp_len == 0 or matches[0] == 0:
+        return 0.0
+    log_precision = (
+        math.log(matches[0] / totals[0])
+        + sum(math.log((matches[i] + 1) / (totals[i] + 1)) for i in range(1, 4))
+    ) / 4
+    brevity = 1.0 if hyp_len > ref_len else math.exp(1 - ref_len / hyp_len)
+    return 100.0 * brevity * math.exp(log_precision)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))]
+
+
+def run_items(
+    items: List[dict], translate: Callable[[str, str], str], warmup: int = 2
+) -> Dict[str, float]:
+    """Translate every item once; returns latency percentiles (ms) and BLEU."""
+    for item in items[:warmup]:
+        translate(item["source"], item["language"])
+    latencies: List[float] = []
+    hypotheses: List[str] = []
+    for item in items:
+        start = time.perf_counter()
+        hypotheses.append(translate(item["source"], item["language"]) or "")
+        latencies.append((time.perf_counter() - start) * 1000.0)
+    return {
+        "n": len(items),
+        "p50_ms": round(percentile(latencies, 0.5), 2),
+        "p95_ms": round(percentile(latencies, 0.95), 2),
+        "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        "bleu": round(corpus_bleu(hypotheses, [i["reference"] for i in items]), 2),
+    }
+
+
+def _marian_translate(entry: dict) -> Callable[[str, str], str]:
+    import torch
+
+    def translate(text: str, _language: str) -> str:
+        inputs = entry["tokenizer"](text, return_tensors="pt", truncation=True)
+        inputs = {k: v.to(entry["device"]) for k, v in inputs.items()}
+        with torch.no_grad():
+            out = entry["model"].generate(**inputs, max_length=512)
+        return entry["tokenizer"].decode(out[0], skip_special_tokens=True)
+
+    return translate
+
+
+def bench_pairs(args: argparse.Namespace) -> None:
+    from app_paths import get_models_dir
+    from translation_router import PairModelRouter, candidate_models, multi_source_model
+
+    items = load_eval_set(args.languages)
+    router = PairModelRouter(get_models_dir(), max_memory_mb=args.memory_mb)
+    mul_entry = router.load(multi_source_model(args.target))
+    router.pin(mul_entry["model_id"])
+
+    print(f"{'pair':<10}{'model':<42}{'p50 ms':>9}{'p95 ms':>9}{'BLEU':>8}")
+    for language in sorted({item["language"] for item in items}):
+        subset = [item for item in items if item["language"] == language]
+        rows = [(mul_entry["model_id"], mul_entry)]
+        pair_ids = candidate_models(language, args.target)[:-1]
+        for model_id in pair_ids:
+            try:
+                rows.insert(0, (model_id, router.load(model_id)))
+                break
+            except Exception as e:
+                print(f"  [skip] {model_id}: {e}")
+        for model_id, entry in rows:
+            stats = run_items(subset, _marian_translate(entry))
+            print(
+                f"{language + '->' + args.target:<10}{model_id.split('/')[-1]:<42}"
+                f"{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}{stats['bleu']:>8.1f}"
+            )
+
+
+def bench_quantized(args: argparse.Namespace) -> None:
+    import torch
+
+    from app_paths import get_models_dir
+    from ctranslate2_backend import make_loader, translate_with_entry
+    from translation_router import PairModelRouter, candidate_models
+
+    torch.set_num_threads(args.threads)
+    items = load_eval_set(args.languages)
+    models_dir = get_models_dir()
+    fp32 = PairModelRouter(models_dir, max_memory_mb=args.memory_mb)
+    int8 = PairModelRouter(
+        models_dir,
+        max_memory_mb=args.memory_mb,
+        loader=make_loader(models_dir, cpu_threads=args.threads),
+    )
+
+    print(f"{'pair':<10}{'backend':<12}{'p50 ms':>9}{'p95 ms':>9}{'BLEU':>8}{'MB':>8}")
+    for language in sorted({item["language"] for item in items}):
+        subset = [item for item in items if item["language"] == language]
+        model_id = candidate_models(language, args.target)[0]
+        try:
+            fp32_entry = fp32.load(model_id)
+            int8_entry = int8.load(model_id)
+        except Exception as e:
+            print(f"  [skip] {model_id}: {e}")
+            continue
+        rows = [
+            ("fp32", fp32_entry, _marian_translate(fp32_entry)),
+            ("int8-ct2", int8_entry, lambda text, _l, e=int8_entry: translate_with_entry(e, text)[0]),
+        ]
+        for name, entry, translate in rows:
+            stats = run_items(subset, translate)
+            print(
+                f"{language + '->' + args.target:<10}{name:<12}{stats['p50_ms']:>9.1f}"
+                f"{stats['p95_ms']:>9.1f}{stats['bleu']:>8.1f}"
+                f"{entry.get('memory_bytes', 0) / (1024 * 1024):>8.0f}"
+            )
+
+
+def _synthetic_sources(items: List[dict], count: int, rng: random.Random) -> List[str]:
+    """Callout-like strings: eval sources recombined with numbers and filler words."""
+    words = sorted({w for item in items for w in item["source"].lower().split()})
+    sources = set()
+    while len(sources) < count:
+        length = rng.randint(2, 9)
+        phrase = " ".join(rng.choice(words) for _ in range(length))
+        sources.add(f"{phrase} {rng.randint(1, 5)}" if rng.random() < 0.3 else phrase)
+    return list(sources)
+
+
+def _perturb(text: str, rng: random.Random) -> str:
+    """Whisper-style variation: casing, punctuation or one dropped character."""
+    choice = rng.random()
+    if choice < 0.3:
+        return text.capitalize() + "!"
+    if choice < 0.6:
+        return text + "."
+    words = text.split()
+    idx = max(range(len(words)), key=lambda i: len(words[i]))
+    if len(words[idx]) > 4:
+        words[idx] = words[idx][:-1]
+    return " ".join(words)
+
+
+def bench_memory(args: argparse.Namespace) -> None:
+    from translation_memory import FuzzyTranslationMemory
+
+    items = load_eval_set()
+    rng = random.Random(args.seed)
+    print(f"{'entries':>9}{'index MB':>10}{'build s':>9}{'hit p50':>9}{'hit p95':>9}"
+          f"{'miss p50':>10}{'miss p95':>10}{'hit rate':>10}")
+    for size in args.sizes:
+        sources = _synthetic_sources(items, size, rng)
+        memory = FuzzyTranslationMemory(threshold=args.threshold, max_entries=size)
+        tracemalloc.start()
+        start = time.perf_counter()
+        for source in sources:
+            memory.add(source, "es", "en", {"translated_text": source})
+        build_s = time.perf_counter() - start
+        index_mb = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+        tracemalloc.stop()
+
+        queries = rng.sample(sources, min(args.queries, len(sources)))
+        hit_latencies: List[float] = []
+        hits = 0
+        for query in queries:
+            query = _perturb(query, rng)
+            start = time.perf_counter()
+            hits += memory.lookup(query, "es", "en") is not None
+            hit_latencies.append((time.perf_counter() - start) * 1000.0)
+        miss_latencies: List[float] = []
+        for query in _synthetic_sources(items, args.queries, random.Random(args.seed + 1)):
+            start = time.perf_counter()
+            memory.lookup(query + " zzz", "es", "en")
+            miss_latencies.append((time.perf_counter() - start) * 1000.0)
+
+        print(
+            f"{size:>9}{index_mb:>10.1f}{build_s:>9.2f}"
+            f"{percentile(hit_latencies, 0.5):>9.3f}{percentile(hit_latencies, 0.95):>9.3f}"
+            f"{percentile(miss_latencies, 0.5):>10.3f}{percentile(miss_latencies, 0.95):>10.3f}"
+            f"{hits / len(queries):>10.2%}"
+        )
+
+
+def _profile_phases(
+    items: List[dict], tokenize: Callable[[str], dict], model, tokenizer, repeats: int
+) -> Dict[str, float]:
+    """Mean ms per call spent tokenizing, generating and decoding."""
+    import torch
+
+    totals = {"tokenize": 0.0, "generate": 0.0, "decode": 0.0}
+    calls = 0
+    for _ in range(repeats):
+        for item in items:
+            start = time.perf_counter()
+            inputs = tokenize(item["source"])
+            tokenized = time.perf_counter()
+            with torch.no_grad():
+                out = model.generate(**inputs, max_new_tokens=64, num_beams=1)
+            generated = time.perf_counter()
+            tokenizer.decode(out[0], skip_special_tokens=True)
+            done = time.perf_counter()
+            totals["tokenize"] += tokenized - start
+            totals["generate"] += generated - tokenized
+            totals["decode"] += done - generated
+            calls += 1
+    return {k: 1000.0 * v / max(1, calls) for k, v in totals.items()}
+
+
+def bench_profile(args: argparse.Namespace) -> None:
+    import torch
+    from transformers import MarianMTModel, MarianTokenizer
+
+    from app_paths import get_models_dir
+    from tokenization import TokenIdCache, load_tokenizer
+    from translation_router import candidate_models
+
+    torch.set_num_threads(args.threads)
+    items = load_eval_set(args.languages)
+    cache_dir = str(get_models_dir())
+
+    print(f"{'pair':<10}{'setup':<28}{'tok ms':>9}{'gen ms':>9}{'dec ms':>9}{'tok %':>8}")
+    for language in sorted({item["language"] for item in items}):
+        subset = [item for item in items if item["language"] == language]
+        model_id = candidate_models(language, args.target)[0]
+        try:
+            model = MarianMTModel.from_pretrained(model_id, cache_dir=cache_dir).eval()
+            slow = MarianTokenizer.from_pretrained(model_id, cache_dir=cache_dir)
+            fast = load_tokenizer(model_id, cache_dir=cache_dir)
+        except Exception as e:
+            print(f"  [skip] {model_id}: {e}")
+            continue
+        cache = TokenIdCache(fast, "cpu")
+
+        def before(text: str) -> dict:
+            return dict(slow(text, return_tensors="pt", padding=True, truncation=True, max_length=512))
+
+        def after(text: str) -> dict:
+            return cache.inputs(text)[0]
+
+        fast_name = "fast" if getattr(fast, "is_fast", False) else "slow (no fast tokenizer)"
+        rows = [
+            ("before: MarianTokenizer", before, slow),
+            (f"after: {fast_name}+cache", after, fast),
+        ]
+        for name, tokenize, tokenizer in rows:
+            _profile_phases(subset[:2], tokenize, model, tokenizer, 1)  # warm-up
+            phases = _profile_phases(subset, tokenize, model, tokenizer, args.repeats)
+            total = sum(phases.values()) or 1.0
+            print(
+                f"{language + '->' + args.target:<10}{name:<28}{phases['tokenize']:>9.2f}"
+                f"{phases['generate']:>9.2f}{phases['decode']:>9.2f}"
+                f"{100.0 * phases['tokenize'] / total:>7.1f}%"
+            )
+        print(f"{'':<10}token cache: {cache.stats()}")
+
+
+def bench_langid(args: argparse.Namespace) -> None:
+    from language_id import LanguageIdentifier
+
+    start = time.perf_counter()
+    identifier = LanguageIdentifier(min_confidence=args.min_confidence)
+    load_ms = (time.perf_counter() - start) * 1000.0
+    print(f"backend={identifier.backend} load={load_ms:.1f}ms min_confidence={args.min_confidence}")
+
+    # Eval sources plus their English references; bare map callouts such as
+    # "Rush B" carry no language signal and are skipped.
+    items = load_eval_set(args.languages)
+    samples = [(item["language"], item["source"]) for item in items]
+    samples += [("en", item["reference"]) for item in items]
+    samples = [(lang, text) for lang, text in samples if text not in args.skip]
+
+    per_language: Dict[str, Counter] = {}
+    latencies: List[float] = []
+    for language, text in samples:
+        start = time.perf_counter()
+        detected, _confidence = identifier.detect(text)
+        latencies.append((time.perf_counter() - start) * 1e6)
+        outcome = "correct" if detected == language else "abstain" if detected is None else "wrong"
+        per_language.setdefault(language, Counter())[outcome] += 1
+        if outcome == "wrong" and args.verbose:
+            print(f"  {language} -> {detected}: {text!r}")
+
+    # An abstention falls back to the multilingual model, so only confident
+    # wrong answers count against accuracy; coverage is the share identified.
+    print(f"{'language':<10}{'n':>5}{'correct':>9}{'wrong':>7}{'abstain':>9}{'accuracy':>10}{'coverage':>10}")
+    totals: Counter = Counter()
+    for language in sorted(per_language):
+        counts = per_language[language]
+        totals.update(counts)
+        n = sum(counts.values())
+        print(f"{language:<10}{n:>5}{counts['correct']:>9}{counts['wrong']:>7}{counts['abstain']:>9}"
+              f"{1 - counts['wrong'] / n:>10.2%}{counts['correct'] / n:>10.2%}")
+    n = sum(totals.values())
+    print(f"{'all':<10}{n:>5}{totals['correct']:>9}{totals['wrong']:>7}{totals['abstain']:>9}"
+          f"{1 - totals['wrong'] / n:>10.2%}{totals['correct'] / n:>10.2%}")
+    print(f"detect latency: p50={percentile(latencies, 0.5):.1f}us p95={percentile(latencies, 0.95):.1f}us")
+
+
+def bench_learned(args: argparse.Namespace) -> None:
+    import tempfile
+
+    from adaptive_learning import AdaptiveLearningStore
+
+    items = load_eval_set()
+    rng = random.Random(args.seed)
+    languages = ["es", "ru", "de", "fr", "pt", None]
+    print(f"{'entries':>9}{'import s':>10}{'reload s':>10}{'index MB':>10}{'db MB':>8}"
+          f"{'hit p50 us':>12}{'hit p95 us':>12}{'miss p50 us':>13}{'miss p95 us':>13}")
+    for size in args.sizes:
+        sources = _synthetic_sources(items, size, rng)
+        entries = [
+            {
+                "context": source,
+                "translation": source.upper(),
+                "source_language": rng.choice(languages),
+                "target_language": "en",
+            }
+            for source in sources
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "preferences.sqlite3"
+            store = AdaptiveLearningStore(path)
+            start = time.perf_counter()
+            store.import_entries(entries)
+            import_s = time.perf_counter() - start
+            store.close()
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            store = AdaptiveLearningStore(path)
+            reload_s = time.perf_counter() - start
+            index_mb = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+            tracemalloc.stop()
+            db_mb = path.stat().st_size / (1024 * 1024)
+
+            hit_latencies: List[float] = []
+            for entry in rng.sample(entries, min(args.queries, len(entries))):
+                # As Whisper would produce it: different case and punctuation
+                query = entry["context"].capitalize() + "!"
+                start = time.perf_counter()
+                found = store.lookup(query, entry["source_language"], "en")
+                hit_latencies.append((time.perf_counter() - start) * 1e6)
+                assert found is not None
+            miss_latencies: List[float] = []
+            for source in _synthetic_sources(items, args.queries, random.Random(args.seed + 1)):
+                start = time.perf_counter()
+                store.lookup(source + " zzz", "es", "en")
+                miss_latencies.append((time.perf_counter() - start) * 1e6)
+            store.close()
+
+        print(
+            f"{size:>9}{import_s:>10.2f}{reload_s:>10.2f}{index_mb:>10.1f}{db_mb:>8.1f}"
+            f"{percentile(hit_latencies, 0.5):>12.1f}{percentile(hit_latencies, 0.95):>12.1f}"
+            f"{percentile(miss_latencies, 0.5):>13.1f}{percentile(miss_latencies, 0.95):>13.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    pairs = sub.add_parser("pairs", help="Pair-specific models vs the mul fallback")
+    pairs.add_argument("--languages", nargs="*", help="Source languages to include")
+    pairs.add_argument("--target", default="en")
+    pairs.add_argument("--memory-mb", type=float, default=4096.0)
+    pairs.set_defaults(func=bench_pairs)
+
+    quantized = sub.add_parser("quantized", help="int8 CTranslate2 vs fp32 PyTorch on CPU")
+    quantized.add_argument("--languages", nargs="*", help="Source languages to include")
+    quantized.add_argument("--target", default="en")
+    quantized.add_argument("--threads", type=int, default=2)
+    quantized.add_argument("--memory-mb", type=float, default=4096.0)
+    quantized.set_defaults(func=bench_quantized)
+
+    memory = sub.add_parser("memory", help="Fuzzy translation memory size and lookup latency")
+    memory.add_argument("--sizes", nargs="*", type=int, default=[10000, 100000])
+    memory.add_argument("--queries", type=int, default=2000)
+    memory.add_argument("--threshold", type=float, default=0.9)
+    memory.add_argument("--seed", type=int, default=13)
+    memory.set_defaults(func=bench_memory)
+
+    profile = sub.add_parser("profile", help="Tokenize/generate/decode time split, before vs after token caching")
+    profile.add_argument("--languages", nargs="*", help="Source languages to include")
+    profile.add_argument("--target", default="en")
+    profile.add_argument("--threads", type=int, default=2)
+    profile.add_argument("--repeats", type=int, default=3, help="Passes over the eval set (callouts repeat in play)")
+    profile.set_defaults(func=bench_profile)
+
+    langid = sub.add_parser("langid", help="Source-language identification accuracy and latency")
+    langid.add_argument("--languages", nargs="*", help="Source languages to include")
+    langid.add_argument("--min-confidence", type=float, default=0.6)
+    langid.add_argument("--skip", nargs="*", default=["Rush B"], help="Language-neutral callouts to leave out")
+    langid.add_argument("--verbose", action="store_true", help="Print misidentified phrases")
+    langid.set_defaults(func=bench_langid)
+
+    learned = sub.add_parser("learned", help="Learned-preference store import/reload time and lookup latency")
+    learned.add_argument("--sizes", nargs="*", type=int, default=[10000, 100000])
+    learned.add_argument("--queries", type=int, default=2000)
+    learned.add_argument("--seed", type=int, default=13)
+    learned.set_defaults(func=bench_learned)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
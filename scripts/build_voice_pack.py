@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Build the precomputed callout voice pack served by TTSService.
+
+Synthesizes every phrase of voice_pack.callout_vocabulary() with edge-tts,
+normalizes it with the same ffmpeg chain as generate_demo_callouts.py and
+writes a memory-mapped int16 PCM bank + index (fastapi-backend/voice_pack.py).
+Phrases are processed in parallel, one ffmpeg process per core.
+
+Usage:
+  python scripts/build_voice_pack.py                      # all languages -> <app data>/voice_pack
+  python scripts/build_voice_pack.py --languages es ru -o dist/voice_pack
+  python scripts/build_voice_pack.py --workers 4 --sample-rate 44100
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from generate_demo_callouts import FFMPEG, NORMALIZE_FILTER, edge_tts
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "fastapi-backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from voice_pack import DEFAULT_SAMPLE_RATE, callout_vocabulary, default_pack_dir, write_bank  # noqa: E402
+
+# One neural voice per language the callout vocabulary covers
+VOICES: Dict[str, str] = {
+    "en": "en-US-GuyNeural",
+    "es": "es-MX-JorgeNeural",
+    "pt": "pt-BR-AntonioNeural",
+    "ru": "ru-RU-DmitryNeural",
+    "de": "de-DE-ConradNeural",
+    "fr": "fr-FR-HenriNeural",
+    "it": "it-IT-DiegoNeural",
+    "pl": "pl-PL-MarekNeural",
+    "tr": "tr-TR-AhmetNeural",
+    "uk": "uk-UA-OstapNeural",
+    "zh": "zh-CN-YunxiNeural",
+    "ja": "ja-JP-KeitaNeural",
+    "ko": "ko-KR-InJoonNeural",
+    "ar": "ar-SA-HamedNeural",
+    "hi": "hi-IN-MadhurNeural",
+}
+
+# Same urgency as the demo callouts
+DEFAULT_RATE = "+12%"
+
+
+def synthesize_clip(text: str, voice: str, rate: str, sample_rate: int) -> np.ndarray:
+    """edge-tts MP3 -> normalized mono float32 PCM at ``sample_rate`` (ffmpeg on stdout)."""
+    with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
+        raw_path = Path(tmp.name)
+    try:
+        asyncio.run(edge_tts.Communicate(text, voice, rate=rate).save(str(raw_path)))
+        cmd = [
+            FFMPEG,
+            "-v",
+            "error",
+            "-i",
+            str(raw_path),
+            "-af",
+            f"aformat=channel_layouts=mono,{NORMALIZE_FILTER}",
+            "-ar",
+            str(sample_rate),
+            "-f",
+            "f32le",
+            "pipe:1",
+        ]
+        result = subprocess.run(cmd, capture_output=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.decode("utf-8", errors="replace"))
+        return np.frombuffer(result.stdout, dtype="<f4").copy()
+    finally:
+        raw_path.unlink(missing_ok=True)
+
+
+def build(
+    out_dir: Path,
+    languages: List[str],
+    rate: str,
+    sample_rate: int,
+    workers: int,
+) -> None:
+    vocabulary = callout_vocabulary()
+    jobs: List[Tuple[str, str]] = [
+        (language, phrase)
+        for language in languages
+        for phrase in vocabulary.get(language, [])
+    ]
+    print(f"Synthesizing {len(jobs)} phrases in {len(languages)} languages with {workers} workers")
+
+    clips: Dict[Tuple[str, str], np.ndarray] = {}
+    failures = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(synthesize_clip, phrase, VOICES[language], rate, sample_rate): (language, phrase)
+            for language, phrase in jobs
+        }
+        for future in as_completed(futures):
+            language, phrase = futures[future]
+            try:
+                clips[(language, phrase)] = future.result()
+            except Exception as e:
+                failures += 1
+                print(f"  FAILED [{language}] {phrase}: {e}", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+
+    index = write_bank(
+        out_dir,
+        clips,
+        sample_rate,
+        metadata={"voices": {lang: VOICES[lang] for lang in languages}, "rate": rate},
+    )
+    size_mb = index["samples"] * 2 / (1024 * 1024)
+    seconds = index["samples"] / float(sample_rate)
+    print(
+        f"Wrote {len(clips)} clips ({seconds:.0f} s of audio, {size_mb:.1f} MB) to {out_dir} "
+        f"in {elapsed:.1f} s; {failures} failed"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="Pack directory (default: <app data>/voice_pack, where the backend loads it)",
+    )
+    parser.add_argument(
+        "--languages",
+        nargs="+",
+        default=sorted(VOICES),
+        choices=sorted(VOICES),
+        help="Languages to build (default: all)",
+    )
+    parser.add_argument("--rate", default=DEFAULT_RATE, help="edge-tts rate (default: +12%%)")
+    parser.add_argument(
+        "--sample-rate",
+        type=int,
+        default=DEFAULT_SAMPLE_RATE,
+        help=f"Bank sample rate; match the output device to avoid resampling (default: {DEFAULT_SAMPLE_RATE})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 4,
+        help="Parallel synthesis + ffmpeg jobs (default: CPU count)",
+    )
+    args = parser.parse_args()
+    build(
+        args.output or default_pack_dir(),
+        args.languages,
+        args.rate,
+        args.sample_rate,
+        max(1, args.workers),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Script to convert MarianMT translation models to int8 CTranslate2 for CPU inference
+
+Converted models are written to <models>/ct2/<model-id>-int8, where the ML
+service looks for them when config translation.backend is "ctranslate2".
+"""
+import sys
+import shutil
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "fastapi-backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+def convert_model(model_id, quantization="int8", force=False):
+
+    """
+    Convert one Hugging Face MarianMT model to CTranslate2
+
+    Args:
+        model_id: Hugging Face model id (e.g. Helsinki-NLP/opus-mt-es-en)
+        quantization: CTranslate2 compute type to store weights in
+        force: Overwrite an existing conversion
+    """
+    try:
+        import ctranslate2
+        from transformers import MarianTokenizer
+    except ImportError:
+        print("[ERROR] ctranslate2/transformers not installed.")
+        print("[ERROR] Install with: pip install ctranslate2 transformers sentencepiece")
+        return False
+
+    from app_paths import get_models_dir
+    from ctranslate2_backend import quantized_model_dir
+
+    models_dir = get_models_dir()
+    out_dir = quantized_model_dir(models_dir, model_id, quantization)
+    if (out_dir / "model.bin").is_file() and not force:
+        print(f"[OK] Already converted: {out_dir}")
+        return True
+
+    print(f"[INFO] Converting {model_id} -> {out_dir} ({quantization})...")
+    try:
+        converter = ctranslate2.converters.TransformersConverter(model_id)
+        converter.convert(str(out_dir), quantization=quantization, force=True)
+        # Keep the SentencePiece tokenizer next to the weights so the service
+        # can load both from one directory.
+        tokenizer = MarianTokenizer.from_pretrained(model_id, cache_dir=str(models_dir))
+        tokenizer.save_pretrained(str(out_dir))
+        size_mb = sum(f.stat().st_size for f in out_dir.rglob("*") if f.is_file()) / (1024 * 1024)
+        print(f"[OK] Converted {model_id} ({size_mb:.1f} MB)")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Failed to convert {model_id}: {e}")
+        shutil.rmtree(out_dir, ignore_errors=True)
+        return False
+
+def models_for_target(target_language, sources=None):
+
+    """mul fallback plus every pair model that translates into target_language"""
+    from translation_router import PAIR_MODELS, multi_source_model
+
+    model_ids = [multi_source_model(target_language)]
+    for (src, tgt), candidates in PAIR_MODELS.items():
+        if tgt != target_language or not candidates:
+            continue
+        if sources and src not in sources:
+            continue
+        model_ids.append(candidates[0])
+    return model_ids
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print(f"  python {sys.argv[0]} <target_language> [source ...]  # mul + pair models into target")
+        print(f"  python {sys.argv[0]} --model <hf_model_id>           # one specific model")
+        print(f"  add --force to re-convert existing models")
+        print()
+        print("Examples:")
+        print(f"  python {sys.argv[0]} en            # all X->en models")
+        print(f"  python {sys.argv[0]} en es ru      # mul-en, es-en, ru-en")
+        sys.exit(1)
+
+    args = [a for a in sys.argv[1:] if a != "--force"]
+    force = "--force" in sys.argv
+
+    if args[0] == "--model":
+        targets = args[1:]
+    else:
+        targets = models_for_target(args[0], args[1:] or None)
+
+    ok = 0
+    for model_id in targets:
+        if convert_model(model_id, force=force):
+            ok += 1
+    print(f"[COMPLETE] Converted {ok}/{len(targets)} models")
+    sys.exit(0 if ok == len(targets) else 1)
@@ -12,6 +12,8 @@ import argparse
 
 import asyncio
 
+import json
+
 import subprocess
 
 import sys
@@ -50,19 +52,13 @@ FFMPEG = imageio_ffmpeg.get_ffmpeg_exe()
 
 
 
-# filename -> Spanish text (short, punchy ranked callouts)
-
-CALLOUTS: dict[str, str] = {
-
-    "01_rush_b.mp3": "¡Rush B!",
-
-    "02_planting.mp3": "¡Plantan!",
+# filename -> Spanish text (short, punchy ranked callouts); shared with the
 
-    "03_rotate.mp3": "¡Rotar, rotar!",
+# translation cache warm-up in fastapi-backend/translation_warmup.py
 
-    "04_last_site.mp3": "¡Último en sitio!",
+CALLOUTS_PATH = Path(__file__).resolve().parent.parent / "fastapi-backend" / "data" / "demo_callouts.json"
 
-}
+CALLOUTS: dict[str, str] = json.loads(CALLOUTS_PATH.read_text(encoding="utf-8"))["callouts"]
 
 
 
@@ -76,23 +72,31 @@ DEFAULT_RATE = "+12%"
 
 
 
-def _ffmpeg_normalize(src: Path, dest: Path) -> None:
+# Loudness-normalized, slightly compressed for loopback capture; shared with
 
-    """Mono 44.1kHz, loudness-normalized, slightly compressed for loopback capture."""
+# scripts/build_voice_pack.py
 
-    filter_chain = (
+NORMALIZE_FILTER = (
 
-        "aformat=sample_rates=44100:channel_layouts=mono,"
+    "highpass=f=80,"
 
-        "highpass=f=80,"
+    "acompressor=threshold=-18dB:ratio=3:attack=5:release=80,"
 
-        "acompressor=threshold=-18dB:ratio=3:attack=5:release=80,"
+    "loudnorm=I=-14:TP=-1.5:LRA=7,"
 
-        "loudnorm=I=-14:TP=-1.5:LRA=7,"
+    "volume=3dB"
 
-        "volume=3dB"
+)
 
-    )
+
+
+
+
+def _ffmpeg_normalize(src: Path, dest: Path) -> None:
+
+    """Mono 44.1kHz, loudness-normalized, slightly compressed for loopback capture."""
+
+    filter_chain = f"aformat=sample_rates=44100:channel_layouts=mono,{NORMALIZE_FILTER}"
 
     cmd = [
 
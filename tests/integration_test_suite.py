@@ -118,6 +118,7 @@ def test_ml_service_health():
         data = response.json()
         assert "status" in data, "Response missing 'status' field"
         assert data["status"] == "healthy", f"Expected 'healthy', got '{data['status']}'"
+        assert "translation_status" in data, "Response missing 'translation_status' field"
         results.add_pass(test_name)
     except Exception as e:
         results.add_fail(test_name, str(e))
@@ -0,0 +1,52 @@
+"""
+Learned-preference store: normalization, language scopes and persistence.
+
+Run: python -m pytest tests/test_adaptive_learning.py -q
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "fastapi-backend"))
+
+from adaptive_learning import AdaptiveLearningStore  # noqa: E402
+
+
+def test_lookup_normalizes_context_and_prefers_specific_scope(tmp_path):
+    store = AdaptiveLearningStore(tmp_path / "prefs.sqlite3")
+    store.learn("Vamos por la larga!", "Go long", target_language="en")
+    store.learn("vamos por la larga", "Long, go long", source_language="es", target_language="en")
+
+    assert store.lookup("VAMOS  por la larga.", "es", "en") == "Long, go long"
+    assert store.lookup("vamos por la larga", "pt", "en") == "Go long"
+    assert store.lookup("vamos por la corta", "es", "en") is None
+
+
+def test_preference_without_target_is_not_applied_to_other_targets(tmp_path):
+    store = AdaptiveLearningStore(tmp_path / "prefs.sqlite3")
+    store.learn("rush b", "Rush B, vamos")
+
+    assert store.lookup("rush b", "en", "es") is None
+    assert store.lookup("rush b", "en", "de") is None
+    assert store.lookup("rush b") == "Rush B, vamos"
+
+
+def test_preferences_survive_restart_and_round_trip_export(tmp_path):
+    path = tmp_path / "prefs.sqlite3"
+    store = AdaptiveLearningStore(path)
+    assert store.import_entries([
+        {"context": "Uno en medio", "translation": "One mid", "source_language": "es", "target_language": "en"},
+        {"context": "!!!", "translation": "ignored"},
+    ]) == 1
+    store.close()
+
+    reopened = AdaptiveLearningStore(path)
+    assert reopened.lookup("uno en medio", "es", "en") == "One mid"
+    exported = reopened.export_entries()
+    assert [(e["context"], e["source_language"]) for e in exported] == [("Uno en medio", "es")]
+
+    other = AdaptiveLearningStore(tmp_path / "other.sqlite3")
+    other.import_entries(exported, replace=True)
+    assert other.lookup("UNO EN MEDIO", "es", "en") == "One mid"
+    assert other.forget("uno en medio", "es", "en")
+    assert other.lookup("uno en medio", "es", "en") is None
@@ -0,0 +1,170 @@
+"""
+API translation fallback client against a local stub HTTP server.
+
+Run: python -m pytest tests/test_api_translation_client.py -q
+"""
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "fastapi-backend"))
+
+from api_translation_client import (  # noqa: E402
+    ApiTranslationClient,
+    ApiTranslationError,
+    CircuitOpenError,
+)
+
+
+class StubTranslateHandler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+
+        server = self.server
+        server.hits += 1
+        query = parse_qs(urlsplit(self.path).query)
+        if server.delay_s:
+            time.sleep(server.delay_s)
+        if server.status != 200:
+            body = b"unavailable"
+        else:
+            text = query.get("q", [""])[0]
+            body = f'<div class="result-container">[{query["tl"][0]}] {text} &amp; ok</div>'.encode()
+        self.send_response(server.status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if server.trickle_s:
+            for i in range(len(body)):
+                self.wfile.write(body[i:i + 1])
+                self.wfile.flush()
+                time.sleep(server.trickle_s)
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+
+        pass
+
+
+@pytest.fixture
+def stub_server():
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubTranslateHandler)
+    server.daemon_threads = True
+    server.hits = 0
+    server.delay_s = 0.0
+    server.trickle_s = 0.0
+    server.status = 200
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server, **kwargs):
+
+    host, port = server.server_address
+    return ApiTranslationClient(f"http://{host}:{port}/m", **kwargs)
+
+
+def test_translates_and_reuses_connection(stub_server):
+
+    client = _client(stub_server)
+    translator = client.translator("es", "en")
+    assert client.translator("es", "en") is translator
+    assert translator.translate("hola") == "[en] hola & ok"
+    assert translator.translate("adios") == "[en] adios & ok"
+    stats = client.stats()
+    assert stats["connections_created"] == 1
+    assert stats["connections_reused"] == 1
+    client.close()
+
+
+def test_deadline_bounds_slow_endpoint(stub_server):
+
+    stub_server.delay_s = 1.0
+    client = _client(stub_server, timeout_s=0.2, max_retries=0)
+    start = time.monotonic()
+    with pytest.raises(ApiTranslationError):
+        client.translate("hola", "es", "en")
+    assert time.monotonic() - start < 0.8
+    client.close()
+
+
+def test_deadline_bounds_trickling_response(stub_server):
+
+    # Each byte arrives well within any per-recv timeout; the body takes ~2 s
+    stub_server.trickle_s = 0.04
+    client = _client(stub_server, timeout_s=0.3, max_retries=0)
+    start = time.monotonic()
+    with pytest.raises(ApiTranslationError):
+        client.translate("hola", "es", "en")
+    assert time.monotonic() - start < 0.8
+    client.close()
+
+
+def test_breaker_opens_and_recovers(stub_server):
+
+    stub_server.status = 503
+    client = _client(stub_server, failure_threshold=2, reset_timeout_s=0.2)
+    for _ in range(2):
+        with pytest.raises(ApiTranslationError):
+            client.translate("hola", "es", "en")
+    assert client.breaker.state == "open"
+
+    hits = stub_server.hits
+    with pytest.raises(CircuitOpenError):
+        client.translate("hola", "es", "en")
+    assert stub_server.hits == hits
+
+    stub_server.status = 200
+    time.sleep(0.25)
+    assert client.translate("hola", "es", "en") == "[en] hola & ok"
+    assert client.breaker.state == "closed"
+    client.close()
+
+
+class FakeEngine:
+
+    def __init__(self, source, target, delay_s=0.0):
+
+        self.source = source
+        self.target = target
+        self.delay_s = delay_s
+
+    def translate(self, text):
+
+        time.sleep(self.delay_s)
+        return f"[{self.target}] {text}"
+
+
+def test_engine_is_built_once_per_pair_and_bounded_by_deadline():
+
+    built = []
+
+    def factory(source, target):
+
+        built.append((source, target))
+        return FakeEngine(source, target, delay_s=1.0 if source == "ru" else 0.0)
+
+    client = ApiTranslationClient(engine_factory=factory, timeout_s=0.2, failure_threshold=1)
+    assert client.translate("hola", "es", "en") == "[en] hola"
+    assert client.translate("adios", "es", "en") == "[en] adios"
+    assert built == [("es", "en")]
+
+    start = time.monotonic()
+    with pytest.raises(ApiTranslationError):
+        client.translate("privet", "ru", "en")
+    assert time.monotonic() - start < 0.6
+    assert client.breaker.state == "open"
+    client.close()
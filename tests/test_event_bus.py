@@ -0,0 +1,51 @@
+"""
+Pipeline event bus: fan-out, type filters, replay for late joiners.
+
+Run: python -m pytest tests/test_event_bus.py -q
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "fastapi-backend"))
+
+from event_bus import EventBus  # noqa: E402
+
+
+def test_subscribers_share_one_serialization_and_filter_by_type():
+    async def scenario():
+        bus = EventBus()
+        everything = bus.subscribe()
+        tts_only = bus.subscribe(types={"tts_started"})
+        # Published from another thread, like the TTS scheduler does
+        worker = threading.Thread(
+            target=lambda: [bus.publish("final", "utt-1", text="rush b"), bus.publish("tts_started", "utt-1", "tts-1")]
+        )
+        worker.start()
+        worker.join()
+        first, second = await everything.get(1.0), await everything.get(1.0)
+        tts = await tts_only.get(1.0)
+        assert [first.type, second.type] == ["final", "tts_started"]
+        assert tts is second and await tts_only.get(0.05) is None
+        payload = json.loads(tts.json)
+        assert payload["utterance_id"] == "utt-1" and payload["job_id"] == "tts-1"
+        assert first.sse.startswith(f"id: {first.seq}\nevent: final\n")
+
+    asyncio.run(scenario())
+
+
+def test_late_joiner_replays_history_or_resumes_after_seq():
+    async def scenario():
+        bus = EventBus(history=3)
+        seqs = [bus.publish("partial", "utt-1", text=str(i)).seq for i in range(5)]
+        replayed = bus.subscribe(replay=2)
+        resumed = bus.subscribe(since=seqs[1])
+        assert [(await replayed.get(1.0)).seq for _ in range(2)] == seqs[3:]
+        # Only the last 3 events are retained
+        assert [(await resumed.get(1.0)).seq for _ in range(3)] == seqs[2:]
+        assert await resumed.get(0.05) is None
+
+    asyncio.run(scenario())
@@ -0,0 +1,36 @@
+"""
+Polyphase resampling accuracy and PCM format conversion.
+
+Run: python -m pytest tests/test_resampling.py -q
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "fastapi-backend"))
+
+from resampling import pcm_to_float32, resample  # noqa: E402
+
+
+def _tone(freq, rate, seconds=0.5):
+    return np.sin(2 * np.pi * freq * np.arange(int(rate * seconds)) / rate).astype(np.float32)
+
+
+def test_resample_keeps_in_band_tone_and_length():
+    for src, dst in [(24000, 48000), (22050, 48000), (48000, 44100)]:
+        out = resample(_tone(1000, src), src, dst)
+        assert out.dtype == np.float32 and out.shape == (dst // 2,)
+        assert np.abs(out[100:-100] - _tone(1000, dst)[100:-100]).max() < 1e-3
+
+
+def test_downsampling_removes_tones_above_new_nyquist():
+    out = resample(_tone(10000, 48000), 48000, 16000)
+    assert np.sqrt(np.mean(out[200:-200] ** 2)) < 0.01
+
+
+def test_pcm_to_float32_downmixes_interleaved_int16():
+    raw = np.array([16384, -16384, 32767, 32767], dtype="<i2").tobytes()
+    assert np.allclose(pcm_to_float32(raw, 2, channels=2), [0.0, 1.0], atol=1e-4)
+    assert np.allclose(pcm_to_float32(bytes([0, 0, 64]), 3), [0.5])
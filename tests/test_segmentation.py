@@ -0,0 +1,26 @@
+"""
+Segmentation: short input stays whole, long input is split and re-packed.
+
+Run: python -m pytest tests/test_segmentation.py -q
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "fastapi-backend"))
+
+from segmentation import split_segments  # noqa: E402
+
+
+def test_short_multi_sentence_callout_is_one_segment():
+    assert split_segments("Rush B. Go! They are weak.") == ["Rush B. Go! They are weak."]
+
+
+def test_long_text_is_split_at_sentences_and_packed_up_to_the_limit():
+    sentences = [f"Sentence number {i} is here." for i in range(10)]
+    segments = split_segments(" ".join(sentences), max_chars=60)
+    assert " ".join(segments) == " ".join(sentences)
+    assert all(len(segment) <= 60 for segment in segments)
+    # Two 27-character sentences fit together, a third would not
+    assert segments[0] == "Sentence number 0 is here. Sentence number 1 is here."
+    assert len(segments) == 5
@@ -0,0 +1,66 @@
+"""
+Speculative translation: the speaker's own words are translated, and
+superseded speculations are cancelled.
+
+Run: python -m pytest tests/test_speculative_translation.py -q
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "fastapi-backend"))
+
+from speculative_translation import SpeculativeTranslator  # noqa: E402
+
+
+class FakeService:
+
+    def __init__(self, gate=None):
+        self.calls = []
+        self.gate = gate
+
+    def translate(self, text, source_language=None, target_prefix=None):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.calls.append((text, target_prefix))
+        return {"translated_text": f"<{text}>", "model_output": f"<{text}>"}
+
+
+def test_speculation_and_final_keep_original_case_and_punctuation():
+    service = FakeService()
+    speculator = SpeculativeTranslator()
+    speculator.partial(service, "s1", "Enemy at")
+    state = speculator.partial(service, "s1", "Enemy at A!")
+    assert state["speculated_source"] == "Enemy at"
+
+    result = speculator.final(service, "s1", "Enemy at A!")
+    assert result["speculation"] == "patched"
+    assert result["translated_text"] == "<Enemy at A!>"
+    assert service.calls[0] == ("Enemy at", None)
+
+
+def test_final_matching_the_speculation_exactly_is_accepted():
+    service = FakeService()
+    speculator = SpeculativeTranslator()
+    speculator.partial(service, "s1", "Rush B")
+    speculator.partial(service, "s1", "Rush B")
+    result = speculator.final(service, "s1", "Rush B")
+    assert result["speculation"] == "accepted"
+    assert result["translated_text"] == "<Rush B>"
+    assert len(service.calls) == 1
+
+
+def test_superseded_speculation_is_cancelled():
+    gate = threading.Event()
+    service = FakeService(gate)
+    speculator = SpeculativeTranslator()
+    partials = ["one two", "one two three four", "one two three four five six", "one two three four five six"]
+    for text in partials:
+        speculator.partial(service, "s1", text)
+    gate.set()
+    speculator.final(service, "s1", "one two three four five six")
+    translated = [text for text, _ in service.calls]
+    # The first speculation was already running; the second was still queued
+    assert translated[0] == "one two"
+    assert "one two three four" not in translated
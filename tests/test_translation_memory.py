@@ -0,0 +1,41 @@
+"""
+Fuzzy translation memory: near-duplicates hit, opposite meanings do not.
+
+Run: python -m pytest tests/test_translation_memory.py -q
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "fastapi-backend"))
+
+from translation_memory import FuzzyTranslationMemory  # noqa: E402
+
+
+def _memory(*sources):
+    memory = FuzzyTranslationMemory()
+    for source in sources:
+        memory.add(source, "en", "es", {"translated_text": f"<{source}>"})
+    return memory
+
+
+def test_punctuation_case_and_spelling_variants_match():
+    memory = _memory("the enemy team is pushing through the long corridor")
+    match = memory.lookup("The enemy team is pushin through the long corridor!", "en", "es")
+    assert match is not None
+    assert match[0]["translated_text"] == "<the enemy team is pushing through the long corridor>"
+
+
+def test_negation_and_direction_changes_do_not_match():
+    memory = _memory(
+        "the enemy team is pushing through the long corridor",
+        "two enemies are hiding on the right side of the building",
+    )
+    assert memory.lookup("the enemy team is not pushing through the long corridor", "en", "es") is None
+    assert memory.lookup("two enemies are hiding on the left side of the building", "en", "es") is None
+
+
+def test_extra_words_beyond_the_limit_do_not_match():
+    memory = _memory("the enemy team is pushing through the long corridor now")
+    assert memory.lookup("the enemy team is pushing through the long corridor", "en", "es") is not None
+    assert memory.lookup("the enemy team is pushing through the long corridor now very fast", "en", "es") is None
@@ -0,0 +1,58 @@
+"""
+Pair model router: transient load failures are retried, missing models are not.
+
+Run: python -m pytest tests/test_translation_router.py -q
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "fastapi-backend"))
+
+import translation_router  # noqa: E402
+from translation_router import PairModelRouter  # noqa: E402
+
+PAIR = "Helsinki-NLP/opus-mt-es-en"
+MUL = "Helsinki-NLP/opus-mt-mul-en"
+
+
+class RepositoryNotFoundError(Exception):
+    pass
+
+
+def test_transient_failure_is_retried_after_backoff(tmp_path, monkeypatch):
+    calls = []
+
+    def loader(model_id):
+        calls.append(model_id)
+        if len(calls) == 1:
+            raise ConnectionError("download interrupted")
+        return {"memory_bytes": 1}
+
+    router = PairModelRouter(tmp_path, loader=loader)
+    monkeypatch.setattr(translation_router, "_RETRY_BACKOFF_S", 0.0)
+    assert router.get("es", "en", wait=True)["model_id"] == MUL
+    assert router.report()["unavailable"][PAIR]["retry_in_s"] is not None
+    # The pair model is still worth waiting for while the mul model stands in
+    assert router.pending_preferred("es", "en") == PAIR
+    entry = router.get("es", "en", wait=True)
+    assert entry["model_id"] == PAIR and calls.count(PAIR) == 2
+    assert router.pending_preferred("es", "en") is None
+
+
+def test_missing_model_is_skipped_for_good(tmp_path):
+    calls = []
+
+    def loader(model_id):
+        calls.append(model_id)
+        if model_id == PAIR:
+            raise OSError(f"{model_id} is not a valid model identifier") from RepositoryNotFoundError()
+        return {"memory_bytes": 1}
+
+    router = PairModelRouter(tmp_path, loader=loader)
+    assert router.get("es", "en", wait=True)["model_id"] == MUL
+    assert router.get("es", "en", wait=True)["model_id"] == MUL
+    assert calls.count(PAIR) == 1
+    assert router.report()["unavailable"][PAIR]["retry_in_s"] is None
+    # Nothing better can load, so the mul output is final
+    assert router.pending_preferred("es", "en") is None
@@ -0,0 +1,56 @@
+"""
+Voice pack bank: write, memory-mapped lookup and serving from TTSService.
+
+Run: python -m pytest tests/test_voice_pack.py -q
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "fastapi-backend"))
+
+from tts_service import _GTTS_LANG_MAP, TTSService  # noqa: E402
+from voice_pack import VoicePack, callout_vocabulary, write_bank  # noqa: E402
+
+
+def test_bank_round_trip_matches_normalized_phrases(tmp_path):
+    tone = np.sin(np.linspace(0, 20, 800)).astype(np.float32) * 0.5
+    write_bank(tmp_path, {("es", "¡Rush B!"): tone, ("en", "Rush B"): tone[:400]}, 16000)
+
+    pack = VoicePack.load(tmp_path)
+    samples, sr = pack.lookup("rush   b", "es")
+    assert sr == 16000 and samples.shape == (800,)
+    assert np.allclose(samples, tone, atol=1e-4)
+    assert pack.lookup("Rush B", "en")[0].shape == (400,)
+    assert pack.lookup("Rush B", "ru") is None
+    assert VoicePack.load(tmp_path / "missing") is None
+
+
+def test_tts_service_serves_pack_without_engines(tmp_path):
+    write_bank(tmp_path, {("es", "Uno en medio"): np.full(480, 0.5, np.float32)}, 48000)
+    tts = TTSService(disk_cache_mb=0, voice_pack=VoicePack.load(tmp_path))
+    tts.local_engine = None
+
+    samples, sr = tts.synthesize("uno en medio.", language="es-MX", volume=0.5, target_sample_rate=24000)
+    assert sr == 24000 and samples.shape == (240,)
+    # Band-limited resampling rings at the clip edges; the body keeps its level
+    assert np.allclose(samples[40:-40], 0.25, atol=1e-3)
+
+
+def test_rebuild_writes_a_new_bank_instead_of_replacing_the_mapped_one(tmp_path):
+    write_bank(tmp_path, {("en", "Rush B"): np.full(400, 0.25, np.float32)}, 16000)
+    old = VoicePack.load(tmp_path)
+
+    index = write_bank(tmp_path, {("en", "Rush B"): np.full(200, 0.5, np.float32)}, 16000)
+    assert index["bank"] != "voice_pack.1.pcm" and (tmp_path / index["bank"]).exists()
+    # The pack loaded before the rebuild keeps serving its own bank
+    assert old.lookup("rush b", "en")[0].shape == (400,)
+    assert VoicePack.load(tmp_path).lookup("rush b", "en")[0].shape == (200,)
+
+
+def test_vocabulary_covers_every_tts_language():
+    vocabulary = callout_vocabulary()
+    assert set(_GTTS_LANG_MAP) <= set(vocabulary)
+    assert all(len(set(phrases)) == len(phrases) for phrases in vocabulary.values())